@@ -0,0 +1,4 @@
+"""Benchmarks for the Fraction class
+
+Chaque module se lance depuis la racine du dépôt, par exemple : python -m benchmarks.bench_bigint
+"""
@@ -0,0 +1,33 @@
+import time
+
+
+def ops_per_second(func, repeat=5, min_time=0.2):
+    """Measure the throughput of a callable without arguments
+
+    PRE : func est un appelable sans paramètre, repeat >= 1, min_time > 0
+    POST : renvoie le meilleur nombre d'appels par seconde observé sur repeat mesures,
+    chaque mesure durant au moins min_time secondes
+    """
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, calls / elapsed)
+    return best
+
+
+def report(title, rows):
+    """Print a small aligned table of benchmark results
+
+    PRE : title est une string, rows est une liste de tuples (libellé, valeur)
+    POST : affiche le titre puis une ligne par résultat
+    """
+    print(title)
+    width = max((len(label) for label, _ in rows), default=0)
+    for label, value in rows:
+        print(f'  {label:<{width}}  {value:>14,.0f} ops/s')
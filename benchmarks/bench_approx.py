@@ -0,0 +1,54 @@
+import random
+import sys
+import time
+
+from continued_fraction import approximate_many
+from fraction_impl import Fraction
+
+
+def stern_brocot(value, max_denominator):
+    """Best approximation found by walking the Stern-Brocot tree one mediant at a time
+
+    Référence naïve : le nombre d'étapes est la somme des termes de la fraction continue,
+    et non leur nombre comme avec limit_denominator.
+
+    PRE : value est un float, max_denominator >= 1
+    POST : renvoie la fraction de dénominateur <= max_denominator la plus proche de value
+    """
+    whole = int(value // 1)
+    target = value - whole
+    low_n, low_d, high_n, high_d = 0, 1, 1, 1
+    while True:
+        mid_n, mid_d = low_n + high_n, low_d + high_d
+        if mid_d > max_denominator:
+            break
+        if mid_n < target * mid_d:
+            low_n, low_d = mid_n, mid_d
+        elif mid_n > target * mid_d:
+            high_n, high_d = mid_n, mid_d
+        else:
+            return Fraction(whole * mid_d + mid_n, mid_d)
+    if target - low_n / low_d <= high_n / high_d - target:
+        return Fraction(whole * low_d + low_n, low_d)
+    return Fraction(whole * high_d + high_n, high_d)
+
+
+def main(count=100_000, max_denominator=1000):
+    rng = random.Random(2020)
+    values = [rng.uniform(-100, 100) for _ in range(count)]
+    print(f'{count:,} floats, max_denominator={max_denominator}')
+    start = time.perf_counter()
+    naive = [stern_brocot(v, max_denominator) for v in values]
+    print(f'  Stern-Brocot walk                 {time.perf_counter() - start:8.3f}s')
+    start = time.perf_counter()
+    best = [Fraction.from_float(v).limit_denominator(max_denominator) for v in values]
+    print(f'  from_float + limit_denominator    {time.perf_counter() - start:8.3f}s')
+    start = time.perf_counter()
+    batch = approximate_many(values, max_denominator)
+    print(f'  approximate_many                  {time.perf_counter() - start:8.3f}s')
+    assert best == batch
+    print(f'  {sum(a != b for a, b in zip(naive, best)):,} differences with the float-based walk')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,36 @@
+import random
+import sys
+import time
+
+from fraction_array import FractionArray
+from fraction_impl import Fraction
+
+
+def timed(func):
+    """Return the duration in seconds of one call to func"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(size=200_000):
+    rng = random.Random(2020)
+    nums_a = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)]
+    dens_a = [rng.randint(1, 10 ** 6) for _ in range(size)]
+    nums_b = [rng.randint(1, 10 ** 6) for _ in range(size)]
+    dens_b = [rng.randint(1, 10 ** 6) for _ in range(size)]
+    objects_a = [Fraction(n, d) for n, d in zip(nums_a, dens_a)]
+    objects_b = [Fraction(n, d) for n, d in zip(nums_b, dens_b)]
+    array_a = FractionArray(nums_a, dens_a)
+    array_b = FractionArray(nums_b, dens_b)
+    print(f'{size:,} elements, FractionArray backend: {array_a.backend}')
+    for symbol, op in (('+', lambda x, y: x + y), ('*', lambda x, y: x * y), ('/', lambda x, y: x / y)):
+        loop = timed(lambda: [op(x, y) for x, y in zip(objects_a, objects_b)])
+        batch = timed(lambda: op(array_a, array_b))
+        print(f'  {symbol}  per-object {loop:.3f}s  FractionArray {batch:.3f}s  speed-up x{loop / batch:.1f}')
+    print(f'  sum  per-object {timed(lambda: sum(objects_a[1:], objects_a[0])):.3f}s  '
+          f'FractionArray {timed(array_a.sum):.3f}s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,31 @@
+import os
+import random
+import sys
+import time
+
+from fraction_batch import FractionBatchExecutor
+from fraction_impl import Fraction
+
+
+def main(accounts=2_000, entries=500, max_workers=None):
+    rng = random.Random(2020)
+    ledgers = [[Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 4)) for _ in range(entries)]
+               for _ in range(accounts)]
+    print(f'{accounts:,} ledgers of {entries} entries')
+    start = time.perf_counter()
+    expected = [sum(ledger) for ledger in ledgers]
+    serial = time.perf_counter() - start
+    print(f'  serial sum()             {serial:8.3f}s')
+    workers = 1
+    while workers <= (max_workers or os.cpu_count() or 1):
+        with FractionBatchExecutor(workers=workers, chunk_size=max(1, accounts // (4 * workers))) as executor:
+            start = time.perf_counter()
+            totals = list(executor.reduce_each('add', ledgers))
+            elapsed = time.perf_counter() - start
+        assert totals == expected
+        print(f'  {workers:>2} worker(s)             {elapsed:8.3f}s   speed-up x{serial / elapsed:.2f}')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
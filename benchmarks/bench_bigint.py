@@ -0,0 +1,34 @@
+import fractions
+import random
+import sys
+
+from benchmarks._timing import ops_per_second, report
+from fraction_impl import Fraction
+
+
+def random_operands(digits, rng):
+    """Build two pairs (num, den) with the requested number of decimal digits
+
+    PRE : digits >= 1, rng est un objet random.Random
+    POST : renvoie une liste de deux tuples (num, den) d'entiers positifs ayant digits chiffres
+    """
+    low, high = 10 ** (digits - 1), 10 ** digits - 1
+    return [(rng.randint(low, high), rng.randint(low, high)) for _ in range(2)]
+
+
+def main(sizes=(10, 100, 10_000)):
+    rng = random.Random(2020)
+    for digits in sizes:
+        (n1, d1), (n2, d2) = random_operands(digits, rng)
+        rows = []
+        for name, cls in (('Fraction', Fraction), ('fractions.Fraction', fractions.Fraction)):
+            a, b = cls(n1, d1), cls(n2, d2)
+            rows.append((f'{name} init', ops_per_second(lambda: cls(n1, d1))))
+            rows.append((f'{name} +', ops_per_second(lambda: a + b)))
+            rows.append((f'{name} -', ops_per_second(lambda: a - b)))
+            rows.append((f'{name} *', ops_per_second(lambda: a * b)))
+        report(f'{digits}-digit operands', rows)
+
+
+if __name__ == '__main__':
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (10, 100, 10_000))
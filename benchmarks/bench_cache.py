@@ -0,0 +1,31 @@
+import random
+import sys
+import time
+
+from fraction_cache import FractionCache
+from fraction_impl import Fraction
+
+
+def main(size=1_000_000):
+    rng = random.Random(2020)
+    pairs = [(rng.randint(0, 100), 100) for _ in range(size // 2)]
+    pairs += [(1, rng.choice((1, 2, 4, 8))) for _ in range(size - len(pairs))]
+    rng.shuffle(pairs)
+    print(f'{size:,} constructions of small repeated values')
+    start = time.perf_counter()
+    plain = [Fraction(n, d) for n, d in pairs]
+    plain_time = time.perf_counter() - start
+    cache = FractionCache(maxsize=512)
+    start = time.perf_counter()
+    interned = [cache(n, d) for n, d in pairs]
+    cached_time = time.perf_counter() - start
+    assert plain == interned
+    print(f'  Fraction(num, den)       {plain_time:.3f}s')
+    print(f'  FractionCache(512)       {cached_time:.3f}s')
+    print(f'  {cache.info()}')
+    print(f'  distinct objects kept: {len(set(map(id, plain))):,} without cache, '
+          f'{len(set(map(id, interned))):,} with cache')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,39 @@
+import pickle
+import random
+import sys
+import time
+
+from fraction_codec import FractionColumn, encode_many, iter_decode, pack_column
+from fraction_impl import Fraction
+from fraction_io import format_many, parse_many
+
+
+def measure(label, dump, load):
+    """Print the encoded size and the dump/load durations of one format
+
+    PRE : dump est un appelable sans paramètre renvoyant les données encodées,
+    load est un appelable prenant ces données et décodant toutes les fractions
+    POST : affiche la taille en octets et les durées d'écriture et de lecture
+    """
+    start = time.perf_counter()
+    data = dump()
+    dumped = time.perf_counter() - start
+    start = time.perf_counter()
+    load(data)
+    loaded = time.perf_counter() - start
+    print(f'  {label:<26} {len(data):>12,} bytes   dump {dumped:6.3f}s   load {loaded:6.3f}s')
+
+
+def main(count=500_000):
+    rng = random.Random(2020)
+    values = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 4)) for _ in range(count)]
+    print(f'{count:,} fractions')
+    measure('pickle', lambda: pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+    measure('text (format_many)', lambda: ''.join(format_many(values)).encode(), lambda d: list(parse_many(d)))
+    measure('varint stream', lambda: encode_many(values), lambda d: list(iter_decode(d)))
+    measure('column', lambda: pack_column(values), lambda d: list(FractionColumn(d)))
+    measure('column, open only', lambda: pack_column(values), FractionColumn)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
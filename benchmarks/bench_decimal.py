@@ -0,0 +1,41 @@
+import decimal
+import fractions
+import itertools
+import random
+import sys
+import time
+
+from fraction_impl import Fraction
+
+
+def timed(label, func):
+    """Run func once, print its duration and return its result"""
+    start = time.perf_counter()
+    result = func()
+    print(f'  {label:<44} {time.perf_counter() - start:9.4f}s')
+    return result
+
+
+def main(digits=10_000):
+    rng = random.Random(2020)
+    num = rng.randrange(10 ** (digits - 1), 10 ** digits)
+    den = rng.randrange(10 ** (digits - 1), 10 ** digits) | 1
+    value, reference = Fraction(num, den), fractions.Fraction(num, den)
+    print(f'operands of {digits} digits')
+    assert timed('float(Fraction) x 1000', lambda: [float(value) for _ in range(1000)])[0] == float(reference)
+    timed('float(fractions.Fraction) x 1000', lambda: [float(reference) for _ in range(1000)])
+    exact = timed(f'to_decimal({digits})', lambda: value.to_decimal(digits))
+    context = decimal.Context(prec=2 * digits + 10)
+    expected = timed(f'Decimal division at precision {context.prec}', lambda: context.divide(
+        decimal.Decimal(num), decimal.Decimal(den)).quantize(decimal.Decimal(1).scaleb(-digits), context=context))
+    assert exact == expected
+    streamed = timed(f'decimal_digits(), first {digits} digits',
+                     lambda: list(itertools.islice(value.decimal_digits(), digits)))
+    assert ''.join(map(str, streamed)) == str(value.to_decimal(digits, decimal.ROUND_DOWN)).split('.')[1]
+    prime_den = Fraction(1, 1_000_003)
+    print(f'period of {prime_den}')
+    print(f'  {timed("decimal_period()", prime_den.decimal_period)}')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,62 @@
+import random
+import sys
+import time
+
+from fraction_expr import lazy
+from fraction_impl import Fraction
+
+
+def timed(label, func):
+    """Run func once, print its duration and return its result"""
+    start = time.perf_counter()
+    result = func()
+    print(f'  {label:<40} {time.perf_counter() - start:8.4f}s')
+    return result
+
+
+def horner(coefficients, x):
+    result = coefficients[0]
+    for coefficient in coefficients[1:]:
+        result = result * x + coefficient
+    return result
+
+
+def main(degree=200, chain=5_000):
+    rng = random.Random(2020)
+    coefficients = [Fraction(rng.randint(-100, 100), rng.randint(1, 100)) for _ in range(degree + 1)]
+    x = Fraction(3, 7)
+    print(f'polynomial of degree {degree}')
+    eager = timed('eager Horner', lambda: horner(coefficients, x))
+    point = lazy(x)
+    polynomial = timed('build lazy Horner', lambda: horner(coefficients, point))
+    assert timed('evaluate', polynomial.evaluate) == eager
+    point.set(Fraction(5, 11))
+    timed('evaluate after x changes', polynomial.evaluate)
+    first = lazy(coefficients[0])
+    tail = horner([first] + coefficients[1:], point)
+    tail.evaluate()
+    first.set(Fraction(1, 2))
+    timed('evaluate after the leading coefficient changes', tail.evaluate)
+
+    factors = [Fraction(rng.randint(1, 10 ** 6), rng.randint(1, 10 ** 6)) for _ in range(chain)]
+    print(f'product chain of {chain} factors')
+
+    def eager_product():
+        result = Fraction(1)
+        for factor in factors:
+            result = result * factor
+        return result
+
+    expected = timed('eager product', eager_product)
+
+    def lazy_product():
+        result = lazy(1)
+        for factor in factors:
+            result = result * factor
+        return result.evaluate()
+
+    assert timed('lazy build + evaluate', lazy_product) == expected
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,59 @@
+import bisect
+import random
+import sys
+import time
+
+from fraction_farey import FareyIndex, farey, is_unimodular
+from fraction_impl import Fraction
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def per_query(label, func, probes):
+    _, elapsed = timed(lambda: [func(probe) for probe in probes])
+    print(f'  {label:<36}{elapsed / len(probes) * 1e6:12.2f} µs/query')
+
+
+def main(order=1814, queries=200):
+    rng = random.Random(2020)
+    print(f'Farey sequence of order {order}')
+    terms, elapsed = timed(lambda: list(farey(order)))
+    print(f'  {"generation":<36}{elapsed:12.3f} s   ({len(terms):,} terms)')
+    index, elapsed = timed(lambda: FareyIndex.from_sorted(terms))
+    print(f'  {"from_sorted":<36}{elapsed:12.3f} s')
+    _, elapsed = timed(lambda: FareyIndex(terms))
+    print(f'  {"FareyIndex(values), with sort":<36}{elapsed:12.3f} s')
+    shuffled = terms[:100_000]
+    rng.shuffle(shuffled)
+    _, elapsed = timed(lambda: _insert_all(shuffled))
+    print(f'  {"100,000 random inserts":<36}{elapsed:12.3f} s')
+
+    probes = [Fraction(rng.randint(1, 10 ** 9), 10 ** 9 + 7) for _ in range(queries)]
+    members = rng.sample(terms, queries)
+    print('queries over the index')
+    per_query('predecessor', index.predecessor, probes)
+    per_query('successor', index.successor, probes)
+    per_query('nearest', index.nearest, probes)
+    per_query('range, width 1e-4', lambda p: list(index.range(p, p + Fraction(1, 10 ** 4))), probes)
+    per_query('adjacent_to, member', index.adjacent_to, members)
+    per_query('adjacent_to, simple value', index.adjacent_to, [Fraction(1, rng.randint(2, 50)) for _ in range(20)])
+    print('naive scans of the sorted list')
+    per_query('predecessor (bisect on a list)', lambda p: terms[bisect.bisect_left(terms, p) - 1], probes)
+    few = members[:5]
+    per_query('adjacent_to (is_unimodular scan)', lambda p: [v for v in terms if is_unimodular(p, v)], few)
+    per_query('adjacent_to (is_adjacent_to scan)', lambda p: [v for v in terms if p.is_adjacent_to(v)], few[:1])
+
+
+def _insert_all(values):
+    index = FareyIndex()
+    for value in values:
+        index.insert(value)
+    return index
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
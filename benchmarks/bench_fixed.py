@@ -0,0 +1,47 @@
+import decimal
+import random
+import sys
+import time
+
+from fraction_fixed import FixedDomain
+from fraction_impl import Fraction
+from fraction_sum import fsum
+
+
+def timed(label, func):
+    """Run func once, print its duration and return its result"""
+    start = time.perf_counter()
+    result = func()
+    print(f'  {label:<40} {time.perf_counter() - start:8.3f}s')
+    return result
+
+
+def running_balance(entries, start):
+    """Ledger-style loop: every entry updates the balance with one + operation"""
+    balance = start
+    for entry in entries:
+        balance = balance + entry
+    return balance
+
+
+def main(size=1_000_000):
+    rng = random.Random(2020)
+    for denominator in (100, 360, 1000):
+        domain = FixedDomain(denominator, decimal.ROUND_HALF_EVEN)
+        units = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)]
+        fractions = [Fraction(u, denominator) for u in units]
+        print(f'{size:,} additions, denominator {denominator}')
+        expected = timed('Fraction running balance', lambda: running_balance(fractions, Fraction(0)))
+        fixed = timed('conversion from Fraction', lambda: [domain(f) for f in fractions])
+        balance = timed('FixedValue running balance', lambda: running_balance(fixed, domain(0)))
+        total = timed('FixedDomain.sum', lambda: domain.sum(fixed))
+        timed('fsum (per-denominator accumulator)', lambda: fsum(fractions))
+        timed('plain int running balance', lambda: running_balance(units, 0))
+        assert balance.to_fraction() == total.to_fraction() == expected
+        interest = domain(Fraction(3, 100))
+        timed(f'{size // 10:,} rounded products', lambda: [v * interest for v in fixed[:size // 10]])
+        timed(f'{size // 10:,} Fraction products', lambda: [f * Fraction(3, 100) for f in fractions[:size // 10]])
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
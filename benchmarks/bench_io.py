@@ -0,0 +1,54 @@
+import io
+import mmap
+import random
+import sys
+import tempfile
+import time
+
+from fraction_impl import Fraction
+from fraction_io import format_many, parse_many
+
+
+def throughput(label, size, func):
+    """Run func once and print the throughput in MB/s for size bytes of text"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'  {label:<34} {size / elapsed / 1e6:8.2f} MB/s')
+
+
+def consume(values):
+    """Exhaust an iterator without keeping its items"""
+    for _ in values:
+        pass
+
+
+def main(count=500_000):
+    rng = random.Random(2020)
+    values = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 4)) for _ in range(count)]
+    text = ''.join(format_many(values, mixed=True))
+    data = text.encode()
+    print(f'{count:,} lines, {len(data) / 1e6:.1f} MB')
+    throughput('format_many', len(data), lambda: consume(format_many(values)))
+    throughput('format_many(mixed=True)', len(data), lambda: consume(format_many(values, mixed=True)))
+    throughput('parse_many(str)', len(data), lambda: consume(parse_many(text)))
+    throughput('parse_many(text file)', len(data), lambda: consume(parse_many(io.StringIO(text))))
+    with tempfile.TemporaryFile() as file:
+        file.write(data)
+        file.flush()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            throughput('parse_many(mmap)', len(data), lambda: consume(parse_many(buffer)))
+    simple_text = ''.join(format_many(values))
+    simple = simple_text.splitlines()
+    throughput('parse_many(str), a/b only', len(simple_text), lambda: consume(parse_many(simple_text)))
+    throughput('split + Fraction(int(a), int(b))', len(simple_text),
+               lambda: consume(Fraction(int(a), int(b or 1)) for a, _, b in (s.partition('/') for s in simple)))
+    throughput('parse_many(bytes), a/b only', len(simple_text), lambda: consume(parse_many(simple_text.encode())))
+    throughput('map(Fraction.from_string), a/b only', len(simple_text),
+               lambda: consume(map(Fraction.from_string, simple)))
+    blank = ' ' * 40_000 + '\n'
+    throughput('parse_many, 40k-space line', len(blank), lambda: consume(parse_many(blank)))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,56 @@
+import random
+import sys
+import time
+
+from fraction_impl import Fraction
+from fraction_matrix import FractionMatrix
+
+
+def timed(label, func):
+    """Run func once, print its duration and return its result"""
+    start = time.perf_counter()
+    result = func()
+    print(f'  {label:<36} {time.perf_counter() - start:9.3f}s')
+    return result
+
+
+def naive_solve(rows, b):
+    """Gauss-Jordan elimination on lists of Fraction, reducing after every operation"""
+    n = len(rows)
+    rows = [list(row) + [value] for row, value in zip(rows, b)]
+    for c in range(n):
+        p = next(i for i in range(c, n) if rows[i][c] != 0)
+        rows[p], rows[c] = rows[c], rows[p]
+        pivot_row = rows[c]
+        inverse = 1 / pivot_row[c]
+        pivot_row[c:] = [x * inverse for x in pivot_row[c:]]
+        for i in range(n):
+            if i != c and rows[i][c] != 0:
+                factor = rows[i][c]
+                rows[i][c:] = [x - factor * y for x, y in zip(rows[i][c:], pivot_row[c:])]
+    return [row[n] for row in rows]
+
+
+def naive_matmul(a, b):
+    columns = list(zip(*b))
+    return [[sum((x * y for x, y in zip(row, column)), Fraction(0)) for column in columns] for row in a]
+
+
+def main(sizes=(50, 100), naive_limit=100):
+    rng = random.Random(2020)
+    for n in sizes:
+        rows = [[Fraction(rng.randint(-50, 50), rng.randint(1, 20)) for _ in range(n)] for _ in range(n)]
+        b = [Fraction(rng.randint(-50, 50), rng.randint(1, 20)) for _ in range(n)]
+        matrix = FractionMatrix(rows)
+        print(f'{n}x{n} system')
+        x = timed('FractionMatrix.solve', lambda: matrix.solve(b))
+        timed('FractionMatrix.det', matrix.det)
+        timed('FractionMatrix @ FractionMatrix', lambda: matrix @ matrix)
+        if n <= naive_limit:
+            assert timed('naive Fraction Gauss-Jordan', lambda: naive_solve(rows, b)) == x
+            product = timed('naive Fraction matmul', lambda: naive_matmul(rows, rows))
+            assert product == (matrix @ matrix).rows()
+
+
+if __name__ == '__main__':
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (50, 100))
@@ -0,0 +1,45 @@
+import sys
+import tracemalloc
+
+from benchmarks._timing import ops_per_second, report
+from fraction_impl import Fraction
+
+
+class DictFraction(Fraction):
+    """Subclass without __slots__, which gets back a per-instance __dict__ as a baseline"""
+
+
+def allocated_bytes(cls, count):
+    """Measure the memory held by count live instances of cls
+
+    PRE : cls est Fraction ou une sous-classe, count >= 1
+    POST : renvoie le nombre d'octets alloués pour garder count instances en vie
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(i, 7) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return after - before
+
+
+def main(count=200_000):
+    for cls in (Fraction, DictFraction):
+        size = allocated_bytes(cls, count)
+        per_instance = size / count
+        print(f'{cls.__name__}: {per_instance:.1f} bytes/instance, '
+              f'{1024 * 1024 / per_instance:,.0f} instances/MB')
+    a, b = Fraction(355, 113), Fraction(-22, 7)
+    report('Operator throughput', [
+        ('Fraction *', ops_per_second(lambda: a * b)),
+        ('Fraction /', ops_per_second(lambda: a / b)),
+        ('Fraction +', ops_per_second(lambda: a + b)),
+        ('DictFraction(...) construction', ops_per_second(lambda: DictFraction(355, 113))),
+        ('Fraction(...) construction', ops_per_second(lambda: Fraction(355, 113))),
+        ('Fraction._from_coprime', ops_per_second(lambda: Fraction._from_coprime(355, 113))),
+    ])
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
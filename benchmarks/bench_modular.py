@@ -0,0 +1,58 @@
+import math
+import random
+import sys
+import time
+
+from fraction_expr import lazy
+from fraction_impl import Fraction
+from fraction_modular import ModularEvaluator, _prime
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def chain(values, start):
+    """r <- r * v + 1 for every v: the size of the result grows with the length of the chain"""
+    result = start
+    for value in values:
+        result = result * value + 1
+    return result
+
+
+def binomial_identity(x, n):
+    """(x + 1)**n minus its binomial expansion: huge intermediate values, the result is 0"""
+    expansion = 0
+    for k in range(n + 1):
+        expansion = expansion + math.comb(n, k) * x ** k
+    return (x + 1) ** n - expansion
+
+
+def compare(label, build, evaluator):
+    direct, direct_time = timed(lambda: build(lambda value: value))
+    expression = build(lazy)
+    deferred, deferred_time = timed(expression.evaluate)
+    modular, modular_time = timed(lambda: evaluator.evaluate(expression))
+    assert direct == deferred == modular
+    print(f'  {label:<28}{direct_time:10.4f}s{deferred_time:10.4f}s{modular_time:10.4f}s')
+
+
+def main(workers=1):
+    rng = random.Random(2020)
+    _prime(4096)
+    with ModularEvaluator(workers=workers) as evaluator:
+        print(f'{"":<30}{"direct":>10}{"lazy":>11}{"modular":>11}   (workers={workers})')
+        print('product/sum chain, growing result')
+        for n in (300, 1000, 3000):
+            values = [Fraction(rng.randint(1, 10 ** 6), rng.randint(1, 10 ** 6)) for _ in range(n)]
+            compare(f'{n} steps', lambda wrap: chain(values, wrap(Fraction(1))), evaluator)
+        print('binomial identity, result 0')
+        x = Fraction(3 ** 400, 2 ** 300 + 1)
+        for n in (20, 40, 80):
+            compare(f'n={n}, 640-bit x', lambda wrap: binomial_identity(wrap(x), n), evaluator)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
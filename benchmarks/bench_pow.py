@@ -0,0 +1,23 @@
+import fractions
+import sys
+
+from benchmarks._timing import ops_per_second, report
+from fraction_impl import Fraction
+
+
+def main(exponents=(10, 100, 1000, 10_000)):
+    base = Fraction(355, 113)
+    std_base = fractions.Fraction(355, 113)
+    perfect = base ** Fraction(7)
+    for exponent in exponents:
+        power = Fraction(exponent)
+        report(f'exponent {exponent}', [
+            ('Fraction ** n', ops_per_second(lambda: base ** power, repeat=3)),
+            ('Fraction ** -n', ops_per_second(lambda: base ** Fraction(-exponent), repeat=3)),
+            ('fractions.Fraction ** n', ops_per_second(lambda: std_base ** exponent, repeat=3)),
+            ('(x ** 7) ** (n / 7), exact root', ops_per_second(lambda: perfect ** Fraction(exponent, 7), repeat=3)),
+        ])
+
+
+if __name__ == '__main__':
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (10, 100, 1000, 10_000))
@@ -0,0 +1,85 @@
+import random
+import timeit
+import tracemalloc
+
+from fraction_array import FractionArray
+from fraction_impl import Fraction
+
+
+# Implémentations d'origine, passant par les propriétés et par une Fraction temporaire
+def old_eq(a, b):
+    return a.numerator == b.numerator and a.denominator == b.denominator
+
+
+def old_lt(a, b):
+    return a.numerator * b.denominator < b.numerator * a.denominator
+
+
+def old_is_adjacent_to(a, b):
+    return abs((a - b).numerator) == 1
+
+
+def old_is_proper(a):
+    return abs(a.numerator) < abs(a.denominator)
+
+
+def old_is_unit(a):
+    return a.numerator == 1
+
+
+def old_is_integer(a):
+    return a.denominator == 1
+
+
+def ns_per_op(func, repeat=5):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def peak_bytes(func):
+    """Return the peak of memory allocated while func runs once (0 for an allocation-free call)"""
+    func()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def compare(title, pairs):
+    print(title)
+    print(f'  {"operation":<16}{"before":>12}{"after":>12}{"peak bytes before":>20}{"after":>8}')
+    for name, before, after in pairs:
+        print(f'  {name:<16}{ns_per_op(before):9.0f} ns{ns_per_op(after):9.0f} ns'
+              f'{peak_bytes(before):20}{peak_bytes(after):8}')
+
+
+def main(count=10_000):
+    rng = random.Random(2020)
+    for label, bits in (('small', 10), ('64-bit', 62)):
+        a = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) | 1)
+        b = Fraction(a.numerator * 3 + 1, a.denominator * 3)
+        compare(f'{label} operands', [
+            ('eq', lambda: old_eq(a, b), lambda: a == b),
+            ('lt', lambda: old_lt(a, b), lambda: a < b),
+            ('is_adjacent_to', lambda: old_is_adjacent_to(a, b), lambda: a.is_adjacent_to(b)),
+            ('is_proper', lambda: old_is_proper(a), a.is_proper),
+            ('is_unit', lambda: old_is_unit(a), a.is_unit),
+            ('is_integer', lambda: old_is_integer(a), a.is_integer),
+        ])
+    values = [Fraction(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(count)]
+    others = [Fraction(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(count)]
+    left, right = FractionArray.from_fractions(values), FractionArray.from_fractions(others)
+    print(f'batch of {count} (per element)')
+    for name, before, after in (
+            ('is_adjacent_to', lambda: [old_is_adjacent_to(a, b) for a, b in zip(values, others)],
+             lambda: left.is_adjacent_to(right)),
+            ('is_proper', lambda: [old_is_proper(a) for a in values], left.is_proper),
+            ('is_integer', lambda: [old_is_integer(a) for a in values], left.is_integer)):
+        print(f'  {name:<16}{ns_per_op(before, 3) / count:9.1f} ns{ns_per_op(after, 3) / count:9.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
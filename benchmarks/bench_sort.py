@@ -0,0 +1,38 @@
+import fractions
+import random
+import sys
+import time
+
+from fraction_impl import Fraction
+
+
+def timed(label, func):
+    """Run func once and print its duration
+
+    PRE : label est une string, func est un appelable sans paramètre
+    POST : affiche la durée de l'appel et renvoie son résultat
+    """
+    start = time.perf_counter()
+    result = func()
+    print(f'  {label:<40} {time.perf_counter() - start:8.3f}s')
+    return result
+
+
+def main(size=1_000_000):
+    rng = random.Random(2020)
+    pairs = [(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(size)]
+    values = [Fraction(n, d) for n, d in pairs]
+    std_values = [fractions.Fraction(n, d) for n, d in pairs]
+    print(f'{size:,} fractions')
+    timed('sorted(Fraction)', lambda: sorted(values))
+    timed('sorted(Fraction, key=float) (lossy)', lambda: sorted(values, key=float))
+    timed('sorted(fractions.Fraction)', lambda: sorted(std_values))
+    unique = timed('set(Fraction)', lambda: set(values))
+    timed('set(Fraction), cached hashes', lambda: set(values))
+    timed('set(fractions.Fraction)', lambda: set(std_values))
+    timed('dict.fromkeys(Fraction)', lambda: dict.fromkeys(values))
+    print(f'  {len(unique):,} distinct values')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,73 @@
+import asyncio
+import concurrent.futures
+import random
+import statistics
+import sys
+import time
+
+from fraction_impl import Fraction
+from fraction_stream import amap, aparse, buffered, run_pipeline
+
+
+class NullWriter:
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        pass
+
+
+def reader_for(data):
+    reader = asyncio.StreamReader(limit=2 ** 20)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def throughput(label, data, count, **options):
+    start = time.perf_counter()
+    written = await run_pipeline(reader_for(data), NullWriter(), 'mul', Fraction(22, 7), **options)
+    elapsed = time.perf_counter() - start
+    assert written == count
+    print(f'  {label:<34} {count / elapsed:12,.0f} records/s')
+
+
+async def latency(label, count, batch_size, maxsize):
+    """Feed one record per event-loop turn and measure the time until it leaves the pipeline"""
+    emitted = []
+
+    async def source():
+        for n in range(count):
+            emitted.append(time.perf_counter())
+            yield f'{n}/7'
+            await asyncio.sleep(0)
+
+    delays = []
+    stream = amap('add', buffered(aparse(source()), maxsize), Fraction(1, 3), batch_size=batch_size)
+    async for _ in buffered(stream, maxsize):
+        delays.append(time.perf_counter() - emitted[len(delays)])
+    delays.sort()
+    print(f'  {label:<34} p50 {statistics.median(delays) * 1e6:9.0f} us'
+          f'   p99 {delays[int(len(delays) * 0.99)] * 1e6:9.0f} us')
+
+
+async def main(count=100_000):
+    rng = random.Random(2020)
+    small = ''.join(f'{rng.randint(-10 ** 6, 10 ** 6)}/{rng.randint(1, 10 ** 6)}\n' for _ in range(count)).encode()
+    big_count = count // 20
+    big = ''.join(f'{rng.getrandbits(3000)}/{rng.getrandbits(3000) | 1}\n' for _ in range(big_count)).encode()
+    print(f'throughput, {count} small records')
+    await throughput('inline', small, count)
+    print(f'throughput, {big_count} records of 3000 bits')
+    await throughput('inline', big, big_count, batch_size=256)
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        await throughput('thread pool', big, big_count, batch_size=256, executor=executor)
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        await throughput('process pool', big, big_count, batch_size=256, executor=executor)
+    print('latency, 10000 records')
+    for batch_size in (1, 64, 1000):
+        await latency(f'batch_size={batch_size}, maxsize=64', 10_000, batch_size, 64)
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
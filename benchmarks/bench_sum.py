@@ -0,0 +1,33 @@
+import functools
+import operator
+import random
+import sys
+import time
+
+from fraction_impl import Fraction
+from fraction_sum import fdot, fmean, fsum
+
+
+def timed(label, func):
+    """Run func once, print its duration and return its result"""
+    start = time.perf_counter()
+    result = func()
+    print(f'  {label:<36} {time.perf_counter() - start:8.3f}s')
+    return result
+
+
+def main(size=1_000_000):
+    rng = random.Random(2020)
+    prices = [Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.choice((1, 4, 100, 360, 1000))) for _ in range(size)]
+    weights = [Fraction(1, rng.randint(1, 12)) for _ in range(size)]
+    print(f'{size:,} terms')
+    expected = timed('reduce(operator.add, ...)', lambda: functools.reduce(operator.add, prices))
+    assert timed('fsum', lambda: fsum(prices)) == expected
+    timed('fsum over a generator', lambda: fsum(p for p in prices))
+    timed('fmean', lambda: fmean(prices))
+    dot = timed('reduce(add, map(mul, ...))', lambda: functools.reduce(operator.add, map(operator.mul, prices, weights)))
+    assert timed('fdot', lambda: fdot(prices, weights)) == dot
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
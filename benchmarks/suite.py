@@ -0,0 +1,146 @@
+"""Benchmark suite covering every public Fraction operation
+
+Utilisation :
+    python -m benchmarks.suite run --output resultats.json
+    python -m benchmarks.suite compare avant.json apres.json --threshold 0.10
+
+La commande compare signale chaque opération dont le temps a augmenté de plus de threshold
+(10 % par défaut) et se termine avec le code 1 si une régression est trouvée.
+"""
+import argparse
+import datetime
+import fractions
+import json
+import platform
+import random
+import sys
+import timeit
+
+from fraction_impl import Fraction
+
+# Chaque classe de taille fixe le nombre de chiffres des numérateurs et dénominateurs des opérandes
+SIZE_CLASSES = {'small': 2, '64bit': 19, '1000digits': 1000}
+
+
+def _operations(cls, a, b, exponent):
+    """Return the timed operations of one implementation as a dict name -> callable
+
+    PRE : cls est la classe de fraction testée, a et b en sont des instances, exponent est une instance entière
+    POST : renvoie un dict associant un nom d'opération à un appelable sans paramètre ; les opérations
+    propres à fraction_impl ne sont présentes que si la classe les définit
+    """
+    num, den = a.numerator, a.denominator
+    operations = {
+        'init': lambda: cls(num, den),
+        'add': lambda: a + b,
+        'sub': lambda: a - b,
+        'mul': lambda: a * b,
+        'truediv': lambda: a / b,
+        'pow': lambda: a ** exponent,
+        'eq': lambda: a == b,
+        'float': lambda: float(a),
+        'str': lambda: str(a),
+    }
+    for name in ('as_mixed_number', 'is_zero', 'is_integer', 'is_proper', 'is_unit'):
+        method = getattr(a, name, None)
+        if method is not None:
+            operations[name] = method
+    if hasattr(a, 'is_adjacent_to'):
+        operations['is_adjacent_to'] = lambda: a.is_adjacent_to(b)
+    return operations
+
+
+def _time_ns(func, repeat):
+    """Return the best time per call of func, in nanoseconds
+
+    PRE : func est un appelable sans paramètre, repeat >= 1
+    POST : renvoie le meilleur temps par appel observé sur repeat séries calibrées par timeit
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(repeat=5, sizes=SIZE_CLASSES, seed=2020):
+    """Time every operation for each size class, for fraction_impl and fractions
+
+    PRE : repeat >= 1, sizes associe un nom de classe de taille à un nombre de chiffres
+    POST : renvoie un dict sérialisable en JSON contenant l'environnement et, pour chaque clé
+    'taille/opération', le temps en ns par appel de chaque implémentation
+    """
+    rng = random.Random(seed)
+    results = {}
+    for size, digits in sizes.items():
+        low, high = 10 ** (digits - 1), 10 ** digits - 1
+        n1, d1, n2, d2 = (rng.randint(low, high) for _ in range(4))
+        for label, cls in (('fraction_impl', Fraction), ('fractions', fractions.Fraction)):
+            exponent = 3 if cls is fractions.Fraction else cls(3)
+            for name, func in _operations(cls, cls(n1, d1), cls(n2, d2), exponent).items():
+                results.setdefault(f'{size}/{name}', {})[label] = _time_ns(func, repeat)
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(before, after, threshold=0.10):
+    """Find the operations of fraction_impl that became slower between two runs
+
+    PRE : before et after sont des dicts produits par run, threshold >= 0
+    POST : renvoie la liste triée des tuples (clé, temps avant, temps après, rapport après/avant)
+    dont le rapport dépasse 1 + threshold, pour les clés présentes dans les deux runs
+    """
+    regressions = []
+    for key, timings in after['results'].items():
+        old = before['results'].get(key, {}).get('fraction_impl')
+        new = timings.get('fraction_impl')
+        if old and new and new / old > 1 + threshold:
+            regressions.append((key, old, new, new / old))
+    return sorted(regressions)
+
+
+def _print_run(data):
+    print(f'{"operation":<28}{"fraction_impl":>16}{"fractions":>16}{"ratio":>9}')
+    for key, timings in data['results'].items():
+        ours, theirs = timings.get('fraction_impl'), timings.get('fractions')
+        ratio = f'{ours / theirs:8.2f}x' if ours and theirs else ''
+        theirs = f'{theirs:13.0f} ns' if theirs else ''
+        print(f'{key:<28}{ours:13.0f} ns{theirs:>16}{ratio:>9}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='mesurer toutes les opérations')
+    run_parser.add_argument('--output', help='fichier JSON où écrire les résultats')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--sizes', nargs='+', choices=SIZE_CLASSES, default=list(SIZE_CLASSES))
+    compare_parser = commands.add_parser('compare', help='comparer deux fichiers de résultats')
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    compare_parser.add_argument('--threshold', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        data = run(repeat=args.repeat, sizes={size: SIZE_CLASSES[size] for size in args.sizes})
+        _print_run(data)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(data, file, indent=2)
+        return 0
+    with open(args.before) as file:
+        before = json.load(file)
+    with open(args.after) as file:
+        after = json.load(file)
+    regressions = compare(before, after, args.threshold)
+    for key, old, new, ratio in regressions:
+        print(f'REGRESSION {key:<28} {old:10.0f} ns -> {new:10.0f} ns  (x{ratio:.2f})')
+    if not regressions:
+        print(f'aucune régression au-delà de {args.threshold:.0%}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+from fraction_impl import Fraction, _limit_denominator
+
+
+def convergents(terms):
+    """Generate the convergents of a continued fraction, lazily
+
+    Les termes sont consommés un par un, ce qui permet de passer un générateur infini.
+
+    PRE : terms est un itérable d'entiers [a0, a1, ...] dont tous les termes sauf le premier sont >= 1
+    POST : génère les objets de type Fraction a0, a0 + 1/a1, a0 + 1/(a1 + 1/a2), ...
+    RAISES : ValueError si un terme autre que le premier est < 1, TypeError si un terme n'est pas un entier
+    """
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    for index, term in enumerate(terms):
+        if type(term) != int:
+            raise TypeError('les termes doivent être des entiers')
+        if index and term < 1:
+            raise ValueError('les termes après le premier doivent être strictement positifs')
+        p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+        yield Fraction._from_coprime(p1, q1)
+
+
+def from_continued_fraction(terms):
+    """Return the value of a finite continued fraction
+
+    PRE : terms est un itérable fini et non vide d'entiers dont tous les termes sauf le premier sont >= 1
+    POST : renvoie l'objet de type Fraction égal à a0 + 1/(a1 + 1/(... + 1/an))
+    RAISES : ValueError si terms est vide ou si un terme autre que le premier est < 1
+    """
+    value = None
+    for value in convergents(terms):
+        pass
+    if value is None:
+        raise ValueError('une fraction continue a au moins un terme')
+    return value
+
+
+def approximate_many(values, max_denominator=1_000_000):
+    """Return the best rational approximations of many numbers with a bounded denominator
+
+    Chaque valeur est convertie exactement en couple d'entiers puis approchée directement sur ces
+    entiers, sans construire de Fraction intermédiaire.
+
+    PRE : values est un itérable de float, d'int ou de Fraction, max_denominator est un entier >= 1
+    POST : renvoie la liste des objets de type Fraction de dénominateur <= max_denominator les plus
+    proches de chaque valeur, dans le même ordre
+    RAISES : ValueError si une valeur est NaN ou si max_denominator < 1, OverflowError si une valeur
+    est infinie, TypeError si une valeur n'est pas d'un type supporté
+    """
+    from_coprime = Fraction._from_coprime
+    result = []
+    for value in values:
+        if isinstance(value, float):
+            num, den = value.as_integer_ratio()
+        elif isinstance(value, (Fraction, int)):
+            num, den = value.numerator, value.denominator
+        else:
+            raise TypeError('les valeurs doivent être des float, des int ou des Fraction')
+        result.append(from_coprime(*_limit_denominator(num, den, max_denominator)))
+    return result
@@ -0,0 +1,443 @@
+import math
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel, on travaille alors sur des listes d'entiers Python
+    np = None
+
+from fraction_impl import Fraction
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _max_abs(values):
+    """Return the largest absolute value of a buffer, 0 if it is empty"""
+    if np is not None and isinstance(values, np.ndarray):
+        return int(np.abs(values).max()) if values.size else 0
+    return max(map(abs, values), default=0)
+
+
+def _to_list(values):
+    """Return the buffer as a list of Python integers"""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+    return values
+
+
+def _normalize(nums, dens):
+    """Apply the sign and reduction rules of Fraction.__init__ to two parallel buffers
+
+    PRE : nums et dens sont deux buffers d'entiers de même longueur (tableaux NumPy int64 ou listes)
+    POST : renvoie (nums, dens) où chaque couple est réduit et chaque dénominateur est strictement positif
+    RAISES : ZeroDivisionError si un dénominateur vaut 0
+    """
+    if np is not None and isinstance(nums, np.ndarray):
+        if not dens.all():
+            raise ZeroDivisionError('division par zéro interdite')
+        sign = np.where(dens < 0, -1, 1)
+        nums = nums * sign
+        dens = dens * sign
+        g = np.gcd(nums, dens)
+        return nums // g, dens // g
+    out_nums, out_dens = [], []
+    for num, den in zip(nums, dens):
+        if not den:
+            raise ZeroDivisionError('division par zéro interdite')
+        if den < 0:
+            num = -num
+            den = -den
+        g = math.gcd(num, den)
+        if g != 1:
+            num //= g
+            den //= g
+        out_nums.append(num)
+        out_dens.append(den)
+    return out_nums, out_dens
+
+
+class FractionArray:
+    """Fixed-size sequence of fractions stored as two parallel integer buffers
+
+    Les numérateurs et dénominateurs sont gardés dans des tableaux NumPy int64 quand NumPy est disponible
+    et que les valeurs tiennent sur 64 bits. Dès qu'une opération risque de déborder, le calcul se fait sur
+    des listes d'entiers Python, qui sont exacts quelle que soit leur taille.
+    """
+
+    __slots__ = ('_num', '_den')
+
+    def __init__(self, numerators=(), denominators=None, use_numpy=None):
+        """Build an array from parallel sequences of numerators and denominators
+
+        PRE : numerators et denominators sont des itérables d'entiers de même longueur,
+        denominators vaut None pour des dénominateurs égaux à 1
+        POST : crée un tableau dont chaque élément est réduit comme par Fraction.__init__. Le backend NumPy
+        est utilisé si use_numpy n'est pas False, si NumPy est installé et si les valeurs tiennent sur 64 bits
+        RAISES : ZeroDivisionError si un dénominateur vaut 0, TypeError si une valeur n'est pas un entier,
+        ValueError si les deux séquences n'ont pas la même longueur
+        """
+        nums = [int(n) if _is_numpy_int(n) else n for n in numerators]
+        dens = [1] * len(nums) if denominators is None else [int(d) if _is_numpy_int(d) else d
+                                                               for d in denominators]
+        if len(nums) != len(dens):
+            raise ValueError('les numérateurs et les dénominateurs doivent avoir la même longueur')
+        if any(type(n) != int for n in nums) or any(type(d) != int for d in dens):
+            raise TypeError('les paramètres doivent être des entiers')
+        bound = max(_max_abs(nums), _max_abs(dens))
+        self._num, self._den = _normalize(*_buffers(nums, dens, bound, use_numpy))
+
+    @classmethod
+    def _wrap(cls, nums, dens):
+        """Build an array from buffers that are already normalized, without any check
+
+        PRE : nums et dens sont des buffers de même longueur, réduits, à dénominateurs strictement positifs
+        POST : renvoie un objet de type FractionArray qui partage ces buffers
+        """
+        obj = object.__new__(cls)
+        obj._num = nums
+        obj._den = dens
+        return obj
+
+    @classmethod
+    def from_fractions(cls, fractions, use_numpy=None):
+        """Build an array from an iterable of Fraction objects
+
+        PRE : fractions est un itérable d'objets de type Fraction
+        POST : renvoie un objet de type FractionArray contenant les mêmes valeurs, sans nouveau calcul de pgcd
+        """
+        nums, dens = [], []
+        for fraction in fractions:
+            nums.append(fraction.numerator)
+            dens.append(fraction.denominator)
+        bound = max(_max_abs(nums), _max_abs(dens))
+        return cls._wrap(*_buffers(nums, dens, bound, use_numpy))
+
+    def to_fractions(self):
+        """Return the elements as a list of Fraction objects
+
+        PRE : -
+        POST : renvoie une liste d'objets de type Fraction dans le même ordre que le tableau
+        """
+        return [Fraction._from_coprime(n, d) for n, d in zip(_to_list(self._num), _to_list(self._den))]
+
+    @property
+    def numerators(self):
+        return list(_to_list(self._num))
+
+    @property
+    def denominators(self):
+        return list(_to_list(self._den))
+
+    @property
+    def backend(self):
+        """Name of the storage in use, 'numpy' or 'python'"""
+        return 'numpy' if np is not None and isinstance(self._num, np.ndarray) else 'python'
+
+    # ------------------ Sequence protocol ------------------
+
+    def __len__(self):
+        return len(self._num)
+
+    def __iter__(self):
+        return iter(self.to_fractions())
+
+    def __getitem__(self, index):
+        """Return one element as a Fraction, or a slice as a new FractionArray
+
+        PRE : index est un entier ou une slice
+        POST : renvoie un objet de type Fraction si index est un entier, sinon un objet de type FractionArray
+        RAISES : IndexError si index est hors limites
+        """
+        if isinstance(index, slice):
+            return FractionArray._wrap(self._num[index], self._den[index])
+        return Fraction._from_coprime(int(self._num[index]), int(self._den[index]))
+
+    def __str__(self):
+        return '[' + ', '.join(str(f) for f in self.to_fractions()) + ']'
+
+    # ------------------ Element-wise arithmetic ------------------
+
+    def __add__(self, other):
+        """Element-wise + between two arrays, or between an array and a Fraction or an int
+
+        PRE : other est un FractionArray de même longueur, une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant les sommes élément par élément
+        """
+        return self._combine(other, _ADD)
+
+    def __sub__(self, other):
+        """Element-wise - between two arrays, or between an array and a Fraction or an int
+
+        PRE : other est un FractionArray de même longueur, une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant les différences élément par élément
+        """
+        return self._combine(other, _SUB)
+
+    def __mul__(self, other):
+        """Element-wise * between two arrays, or between an array and a Fraction or an int
+
+        PRE : other est un FractionArray de même longueur, une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant les produits élément par élément
+        """
+        return self._combine(other, _MUL)
+
+    def __truediv__(self, other):
+        """Element-wise / between two arrays, or between an array and a Fraction or an int
+
+        PRE : other est un FractionArray de même longueur, une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant les quotients élément par élément
+        RAISES : ZeroDivisionError si un élément de other vaut 0
+        """
+        return self._combine(other, _DIV)
+
+    def __radd__(self, other):
+        """Element-wise + when the left operand is a Fraction or an int (ex : 1 + arr)
+
+        PRE : other est une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant other + chaque élément
+        """
+        return self._combine(other, _ADD, reflected=True)
+
+    def __rsub__(self, other):
+        """Element-wise - when the left operand is a Fraction or an int (ex : 1 - arr)
+
+        PRE : other est une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant other - chaque élément
+        """
+        return self._combine(other, _SUB, reflected=True)
+
+    def __rmul__(self, other):
+        """Element-wise * when the left operand is a Fraction or an int (ex : 3 * arr)
+
+        PRE : other est une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant other * chaque élément
+        """
+        return self._combine(other, _MUL, reflected=True)
+
+    def __rtruediv__(self, other):
+        """Element-wise / when the left operand is a Fraction or an int (ex : 1 / arr)
+
+        PRE : other est une Fraction ou un entier
+        POST : renvoie un objet de type FractionArray contenant other / chaque élément
+        RAISES : ZeroDivisionError si un élément de self vaut 0
+        """
+        return self._combine(other, _DIV, reflected=True)
+
+    def _combine(self, other, op, reflected=False):
+        other_num, other_den = self._operand(other)
+        if other_num is None:
+            return NotImplemented
+        raw_op, bound_of = op
+        bound = bound_of(_max_abs(self._num), _max_abs(self._den), _max_abs(other_num), _max_abs(other_den))
+        a_num, a_den, b_num, b_den = _aligned(self._num, self._den, other_num, other_den, bound)
+        if reflected:
+            return FractionArray._wrap(*_normalize(*raw_op(b_num, b_den, a_num, a_den)))
+        return FractionArray._wrap(*_normalize(*raw_op(a_num, a_den, b_num, b_den)))
+
+    def _operand(self, other):
+        """Return the buffers of other, broadcasting a Fraction or an int to the length of self"""
+        if isinstance(other, FractionArray):
+            if len(other) != len(self):
+                raise ValueError('les tableaux doivent avoir la même longueur')
+            return other._num, other._den
+        if isinstance(other, Fraction):
+            return [other.numerator] * len(self), [other.denominator] * len(self)
+        if type(other) == int:
+            return [other] * len(self), [1] * len(self)
+        return None, None
+
+    # ------------------ Comparisons ------------------
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    __hash__ = None
+
+    def _compare(self, other, cmp):
+        """Compare element-wise by cross-multiplication, the denominators being positive
+
+        PRE : other est un FractionArray de même longueur, une Fraction ou un entier, cmp est une fonction
+        du module operator
+        POST : renvoie une liste de booléens, ou un tableau NumPy de booléens avec le backend NumPy
+        """
+        other_num, other_den = self._operand(other)
+        if other_num is None:
+            return NotImplemented
+        bound = max(_max_abs(self._num) * _max_abs(other_den), _max_abs(other_num) * _max_abs(self._den))
+        a_num, a_den, b_num, b_den = _aligned(self._num, self._den, other_num, other_den, bound)
+        if np is not None and isinstance(a_num, np.ndarray):
+            return cmp(a_num * b_den, b_num * a_den)
+        return [cmp(n1 * d2, n2 * d1) for n1, d1, n2, d2 in zip(a_num, a_den, b_num, b_den)]
+
+    # ------------------ Predicates ------------------
+
+    def is_zero(self):
+        """Element-wise Fraction.is_zero, computed on the stored integers
+
+        PRE : -
+        POST : renvoie une liste de booléens, ou un tableau NumPy de booléens avec le backend NumPy
+        """
+        if np is not None and isinstance(self._num, np.ndarray):
+            return self._num == 0
+        return [not n for n in self._num]
+
+    def is_integer(self):
+        """Element-wise Fraction.is_integer, computed on the stored integers
+
+        PRE : -
+        POST : renvoie une liste de booléens, ou un tableau NumPy de booléens avec le backend NumPy
+        """
+        if np is not None and isinstance(self._den, np.ndarray):
+            return self._den == 1
+        return [d == 1 for d in self._den]
+
+    def is_proper(self):
+        """Element-wise Fraction.is_proper, computed on the stored integers
+
+        PRE : -
+        POST : renvoie une liste de booléens, ou un tableau NumPy de booléens avec le backend NumPy
+        """
+        if np is not None and isinstance(self._num, np.ndarray):
+            return (-self._den < self._num) & (self._num < self._den)
+        return [-d < n < d for n, d in zip(self._num, self._den)]
+
+    def is_unit(self):
+        """Element-wise Fraction.is_unit, computed on the stored integers
+
+        PRE : -
+        POST : renvoie une liste de booléens, ou un tableau NumPy de booléens avec le backend NumPy
+        """
+        if np is not None and isinstance(self._num, np.ndarray):
+            return self._num == 1
+        return [n == 1 for n in self._num]
+
+    def is_adjacent_to(self, other):
+        """Element-wise Fraction.is_adjacent_to, without building any difference
+
+        PRE : other est un FractionArray de même longueur, une Fraction ou un entier
+        POST : renvoie une liste de booléens, ou un tableau NumPy de booléens avec le backend NumPy
+        RAISES : ValueError si les tableaux n'ont pas la même longueur, TypeError si other n'est pas supporté
+        """
+        other_num, other_den = self._operand(other)
+        if other_num is None:
+            raise TypeError('other doit être un FractionArray, une Fraction ou un entier')
+        bound = (_max_abs(self._num) * _max_abs(other_den) + _max_abs(other_num) * _max_abs(self._den)
+                 + _max_abs(self._den) * _max_abs(other_den))
+        a_num, a_den, b_num, b_den = _aligned(self._num, self._den, other_num, other_den, bound)
+        if np is not None and isinstance(a_num, np.ndarray):
+            cross = a_num * b_den - b_num * a_den
+            return (cross != 0) & (a_den * b_den % np.where(cross == 0, 1, cross) == 0)
+        result = []
+        for n1, d1, n2, d2 in zip(a_num, a_den, b_num, b_den):
+            cross = n1 * d2 - n2 * d1
+            result.append(cross != 0 and not (d1 * d2) % cross)
+        return result
+
+    # ------------------ Reductions ------------------
+
+    def sum(self):
+        """Return the exact sum of all elements
+
+        Les termes sont additionnés deux à deux en arbre équilibré, ce qui garde les opérandes de tailles
+        comparables au lieu de faire grossir un seul accumulateur.
+
+        PRE : -
+        POST : renvoie un objet de type Fraction égal à la somme des éléments, 0 si le tableau est vide
+        """
+        return _pairwise(self.to_fractions(), operator.add, Fraction(0))
+
+    def prod(self):
+        """Return the exact product of all elements
+
+        PRE : -
+        POST : renvoie un objet de type Fraction égal au produit des éléments, 1 si le tableau est vide
+        """
+        return _pairwise(self.to_fractions(), operator.mul, Fraction(1))
+
+
+def _pairwise(values, op, empty):
+    """Fold a list of fractions with op as a balanced binary tree
+
+    PRE : values est une liste d'objets de type Fraction, op est une opération associative
+    POST : renvoie op appliquée à tous les éléments, ou empty si values est vide
+    """
+    if not values:
+        return empty
+    while len(values) > 1:
+        odd = values[-1:] if len(values) % 2 else []
+        values = [op(x, y) for x, y in zip(values[::2], values[1::2])] + odd
+    return values[0]
+
+
+def _is_numpy_int(value):
+    return np is not None and isinstance(value, np.integer)
+
+
+def _buffers(nums, dens, bound, use_numpy):
+    """Pick the storage for two lists of Python integers whose absolute values are at most bound"""
+    if use_numpy is not False and np is not None and bound <= _INT64_MAX:
+        return np.array(nums, dtype=np.int64), np.array(dens, dtype=np.int64)
+    return nums, dens
+
+
+def _aligned(a_num, a_den, b_num, b_den, bound):
+    """Bring four buffers to a common storage able to hold intermediate values up to bound
+
+    Le majorant d'un produit s'annule quand un des opérandes ne contient que des zéros : les valeurs du
+    tableau de droite, qui doivent elles-mêmes tenir sur 64 bits, sont donc aussi prises en compte.
+
+    PRE : les buffers ont la même longueur, bound majore la valeur absolue des résultats intermédiaires
+    POST : renvoie quatre tableaux NumPy int64 si le tableau de gauche est en NumPy et que bound ainsi que
+    les valeurs de b_num et b_den tiennent sur 64 bits, sinon quatre listes d'entiers Python
+    """
+    if (np is not None and isinstance(a_num, np.ndarray)
+            and max(bound, _max_abs(b_num), _max_abs(b_den)) <= _INT64_MAX):
+        return a_num, a_den, np.asarray(b_num, dtype=np.int64), np.asarray(b_den, dtype=np.int64)
+    return _to_list(a_num), _to_list(a_den), _to_list(b_num), _to_list(b_den)
+
+
+def _raw_add(n1, d1, n2, d2):
+    if np is not None and isinstance(n1, np.ndarray):
+        return n1 * d2 + n2 * d1, d1 * d2
+    return [a * d + b * c for a, c, b, d in zip(n1, d1, n2, d2)], [c * d for c, d in zip(d1, d2)]
+
+
+def _raw_sub(n1, d1, n2, d2):
+    if np is not None and isinstance(n1, np.ndarray):
+        return n1 * d2 - n2 * d1, d1 * d2
+    return [a * d - b * c for a, c, b, d in zip(n1, d1, n2, d2)], [c * d for c, d in zip(d1, d2)]
+
+
+def _raw_mul(n1, d1, n2, d2):
+    if np is not None and isinstance(n1, np.ndarray):
+        return n1 * n2, d1 * d2
+    return [a * b for a, b in zip(n1, n2)], [c * d for c, d in zip(d1, d2)]
+
+
+def _raw_div(n1, d1, n2, d2):
+    if np is not None and isinstance(n1, np.ndarray):
+        return n1 * d2, d1 * n2
+    return [a * d for a, d in zip(n1, d2)], [c * b for c, b in zip(d1, n2)]
+
+
+# Chaque opération associe son calcul brut à un majorant des entiers intermédiaires, calculé à partir des
+# maxima des valeurs absolues (numérateurs et dénominateurs des deux opérandes)
+_ADD = (_raw_add, lambda n1, d1, n2, d2: n1 * d2 + n2 * d1 + d1 * d2)
+_SUB = (_raw_sub, _ADD[1])
+_MUL = (_raw_mul, lambda n1, d1, n2, d2: max(n1 * n2, d1 * d2))
+_DIV = (_raw_div, lambda n1, d1, n2, d2: max(n1 * d2, d1 * n2))
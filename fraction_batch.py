@@ -0,0 +1,171 @@
+import collections
+import concurrent.futures
+import itertools
+import operator
+import os
+
+from fraction_impl import Fraction
+from fraction_sum import FractionAccumulator
+
+OPERATIONS = {
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'truediv': operator.truediv,
+    'pow': operator.pow,
+}
+
+
+def _resolve(op):
+    """Return the callable for an operation name, or op itself if it is already callable
+
+    PRE : op est un nom de OPERATIONS ou une fonction globale (donc picklable) sur des Fraction
+    POST : renvoie la fonction correspondante
+    RAISES : ValueError si op n'est ni un nom connu ni un appelable
+    """
+    if callable(op):
+        return op
+    try:
+        return OPERATIONS[op]
+    except KeyError:
+        raise ValueError(f'opération inconnue : {op!r}') from None
+
+
+def _pack(value):
+    return value.numerator, value.denominator
+
+
+def _unpack(pair):
+    return Fraction._from_coprime(*pair)
+
+
+def _reduce_values(op, values):
+    """Reduce fractions with op, using an accumulator for sums
+
+    PRE : op est operator.add, operator.mul ou une fonction associative, values est un itérable de Fraction
+    POST : renvoie l'objet de type Fraction résultant ; une séquence vide donne 0 pour add et 1 pour mul
+    RAISES : ValueError si values est vide et que op n'est ni add ni mul
+    """
+    if op is operator.add:
+        accumulator = FractionAccumulator()
+        accumulator.update(values)
+        return accumulator.value()
+    values = iter(values)
+    result = next(values, None)
+    if result is None:
+        if op is operator.mul:
+            return Fraction(1)
+        raise ValueError('impossible de réduire une séquence vide')
+    for value in values:
+        result = op(result, value)
+    return result
+
+
+# Fonctions exécutées dans les processus : elles reçoivent et renvoient des tuples (num, den)
+
+def _map_chunk(op, chunk):
+    func = _resolve(op)
+    return [_pack(func(*map(_unpack, item))) for item in chunk]
+
+
+def _reduce_chunk(op, chunk):
+    return _pack(_reduce_values(_resolve(op), map(_unpack, chunk)))
+
+
+def _reduce_each_chunk(op, chunk):
+    func = _resolve(op)
+    return [_pack(_reduce_values(func, map(_unpack, sequence))) for sequence in chunk]
+
+
+class FractionBatchExecutor:
+    """Evaluate independent fraction workloads on a pool of processes
+
+    Les fractions traversent les frontières de processus sous forme de tuples (numérateur, dénominateur),
+    bien plus compacts à sérialiser que des objets. Le travail est découpé en paquets de chunk_size
+    éléments ; au plus 2 * workers paquets sont en cours à la fois, de sorte que les entrées sont lues
+    et les résultats produits au fil de l'eau, dans l'ordre.
+    """
+
+    def __init__(self, workers=None, chunk_size=10_000):
+        """Start the process pool
+
+        PRE : workers est None (nombre de cœurs) ou un entier >= 1, chunk_size est un entier >= 1
+        POST : crée un exécuteur prêt à l'emploi, à fermer avec close() ou via un bloc with
+        RAISES : ValueError si chunk_size < 1
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size doit être au moins 1')
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+
+    def close(self):
+        """Shut the process pool down
+
+        PRE : -
+        POST : les processus sont arrêtés une fois les tâches en cours terminées
+        """
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _stream(self, task, op, items):
+        """Submit task(op, chunk) for each chunk of items and yield the results in order"""
+        chunks = iter(lambda: list(itertools.islice(items, self.chunk_size)), [])
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(self._pool.submit(task, op, chunk))
+            if len(pending) >= 2 * self.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def map(self, op, left, right=None):
+        """Apply an operation element-wise, in parallel
+
+        PRE : op est un nom de OPERATIONS ('add', 'sub', 'mul', 'truediv', 'pow') ou une fonction globale
+        sur des Fraction ; left est un itérable de Fraction ; right est None pour une opération unaire ou
+        un itérable de Fraction de même longueur que left
+        POST : génère dans l'ordre les objets de type Fraction op(l) ou op(l, r)
+        RAISES : ValueError si op est inconnue, ainsi que toute exception levée par op
+        """
+        _resolve(op)
+        if right is None:
+            items = ((_pack(value),) for value in left)
+        else:
+            items = ((_pack(a), _pack(b)) for a, b in zip(left, right, strict=True))
+        for results in self._stream(_map_chunk, op, items):
+            yield from map(_unpack, results)
+
+    def reduce(self, op, values):
+        """Reduce a long sequence of fractions exactly, in parallel
+
+        Chaque paquet est réduit dans un processus, puis les résultats partiels sont combinés exactement.
+
+        PRE : op est 'add', 'mul' ou une fonction globale associative sur des Fraction,
+        values est un itérable de Fraction
+        POST : renvoie l'objet de type Fraction égal à la réduction de values par op,
+        0 pour 'add' et 1 pour 'mul' si values est vide
+        RAISES : ValueError si op est inconnue, ou si values est vide et que op n'est ni 'add' ni 'mul'
+        """
+        func = _resolve(op)
+        partials = [_unpack(pair) for pair in self._stream(_reduce_chunk, op, map(_pack, values))]
+        return _reduce_values(func, partials)
+
+    def reduce_each(self, op, sequences):
+        """Reduce many independent sequences (ex : one ledger per account), in parallel
+
+        PRE : op est 'add', 'mul' ou une fonction globale associative sur des Fraction,
+        sequences est un itérable de séquences de Fraction
+        POST : génère dans l'ordre un objet de type Fraction par séquence, 0 pour 'add' et 1 pour 'mul'
+        si la séquence est vide
+        RAISES : ValueError si op est inconnue, ou si une séquence est vide et que op n'est ni 'add' ni 'mul'
+        """
+        _resolve(op)
+        items = ([_pack(value) for value in sequence] for sequence in sequences)
+        for results in self._stream(_reduce_each_chunk, op, items):
+            yield from map(_unpack, results)
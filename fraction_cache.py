@@ -0,0 +1,76 @@
+import collections
+import functools
+
+from fraction_impl import Fraction, _gcd
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'size', 'maxsize'])
+
+
+class FractionCache:
+    """Bounded interning cache for frequently built fractions
+
+    Le cache est optionnel : on construit les fractions via une instance de FractionCache au lieu
+    d'appeler Fraction directement. Une valeur déjà vue renvoie l'objet partagé au lieu d'une nouvelle
+    allocation. Le couple (num, den) est réduit avant la recherche : la clé du cache est la forme réduite,
+    de sorte que 2/4 et 1/2 renvoient le même objet, n'occupent qu'une entrée et qu'un appel compte pour
+    exactement un succès ou un échec.
+
+    Le stockage repose sur functools.lru_cache : éviction LRU au-delà de maxsize entrées et accès sûr
+    entre threads. Deux threads qui manquent la même clé au même moment peuvent chacun construire
+    leur objet ; les valeurs renvoyées sont toujours exactes, seul le partage de l'instance est perdu.
+    """
+
+    def __init__(self, maxsize=1024):
+        """Build an empty cache
+
+        PRE : maxsize est un entier >= 0
+        POST : crée un cache vide pouvant garder au plus maxsize entrées
+        RAISES : ValueError si maxsize est négatif
+        """
+        if maxsize < 0:
+            raise ValueError('la taille du cache doit être positive')
+        self.maxsize = maxsize
+        self._lookup = functools.lru_cache(maxsize=maxsize)(self._build)
+
+    def __call__(self, num=0, den=1):
+        """Return the shared Fraction equal to num/den
+
+        PRE : -
+        POST : renvoie un objet de type Fraction valant num/den, identique à celui renvoyé par les appels
+        précédents pour la même valeur tant qu'il n'a pas été évincé
+        RAISES : ZeroDivisionError si den==0, TypeError si num ou den ne sont pas des entiers
+        """
+        if not den:
+            raise ZeroDivisionError('division par zéro interdite')
+        if type(num) != int or type(den) != int:
+            raise TypeError('les paramètres doivent être des entiers')
+        if den < 0:
+            num = -num
+            den = -den
+        gcd = _gcd(num, den)
+        if gcd != 1:
+            num //= gcd
+            den //= gcd
+        return self._lookup(num, den)
+
+    @staticmethod
+    def _build(num, den):
+        """Build the Fraction for a missing reduced key"""
+        return Fraction._from_coprime(num, den)
+
+    def info(self):
+        """Return the hit/miss statistics of the cache
+
+        PRE : -
+        POST : renvoie un CacheInfo(hits, misses, size, maxsize)
+        """
+        info = self._lookup.cache_info()
+        return CacheInfo(info.hits, info.misses, info.currsize, self.maxsize)
+
+    def clear(self):
+        """Remove every entry and reset the statistics
+
+        PRE : -
+        POST : le cache est vide et tous ses compteurs valent 0
+        """
+        self._lookup.cache_clear()
@@ -0,0 +1,217 @@
+"""Compact binary encodings for Fraction values
+
+Encodage d'un entier (« uvalue ») : un varint LEB128 h (7 bits par octet, bit de poids fort à 1 si un
+octet suit) dont le bit de poids faible indique la forme :
+    - h pair : forme courte, la valeur est h >> 1 ;
+    - h impair : forme longue, h >> 1 est un nombre d'octets L suivi de L octets little-endian.
+La forme courte est utilisée tant que la valeur tient sur 63 bits. Les numérateurs signés passent par
+l'encodage zigzag (0, -1, 1, -2, ... deviennent 0, 1, 2, 3, ...) et les dénominateurs, strictement
+positifs, sont écrits moins 1.
+
+Enregistrement d'une fraction : uvalue(zigzag(num)) puis uvalue(den - 1). Un flux (encode_many) est
+une simple concaténation d'enregistrements.
+
+Format colonne (pack_column), pour des séquences dont toutes les valeurs tiennent sur 64 bits :
+    - en-tête de 16 octets : b'FRCL', largeur w (1, 2, 4 ou 8), 3 octets nuls, nombre n d'éléments
+      sur 8 octets little-endian ;
+    - n numérateurs signés de w octets, puis n dénominateurs signés de w octets, little-endian.
+
+Les données sont supposées produites par ce module : les fractions lues sont reprises telles quelles,
+sans nouveau calcul de pgcd.
+"""
+import array
+import struct
+import sys
+
+from fraction_impl import Fraction
+
+_COLUMN_MAGIC = b'FRCL'
+_COLUMN_HEADER = struct.Struct('<4sB3xQ')
+_TYPECODES = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+_SHORT_LIMIT = 1 << 63
+
+
+def _zigzag(value):
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_varint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_uvalue(out, value):
+    """Append a non-negative integer to a bytearray, in short or long form"""
+    if value < _SHORT_LIMIT:
+        _write_varint(out, value << 1)
+    else:
+        size = (value.bit_length() + 7) // 8
+        _write_varint(out, (size << 1) | 1)
+        out += value.to_bytes(size, 'little')
+
+
+def _read_uvalue(view, pos):
+    """Read a non-negative integer from a buffer, returning (value, position after it)
+
+    PRE : view est un memoryview d'octets, pos est une position valide dans view
+    POST : renvoie la valeur lue à la position pos et la position suivante
+    RAISES : ValueError si le buffer se termine au milieu d'une valeur
+    """
+    header = shift = 0
+    while True:
+        if pos >= len(view):
+            raise ValueError('données tronquées')
+        byte = view[pos]
+        pos += 1
+        header |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    if not header & 1:
+        return header >> 1, pos
+    end = pos + (header >> 1)
+    if end > len(view):
+        raise ValueError('données tronquées')
+    return int.from_bytes(view[pos:end], 'little'), end
+
+
+def encode(fraction):
+    """Encode one fraction as a binary record
+
+    PRE : fraction est un objet de type Fraction
+    POST : renvoie les octets de l'enregistrement décrit dans la documentation du module
+    """
+    out = bytearray()
+    _write_uvalue(out, _zigzag(fraction.numerator))
+    _write_uvalue(out, fraction.denominator - 1)
+    return bytes(out)
+
+
+def decode(data):
+    """Decode one binary record
+
+    PRE : data est un objet bytes-like contenant exactement un enregistrement
+    POST : renvoie l'objet de type Fraction encodé dans data
+    RAISES : ValueError si data est tronqué ou contient des octets en trop
+    """
+    values = iter_decode(data)
+    fraction = next(values, None)
+    if fraction is None or next(values, None) is not None:
+        raise ValueError('data doit contenir exactement une fraction')
+    return fraction
+
+
+def encode_many(fractions):
+    """Encode a sequence of fractions as a stream of records
+
+    PRE : fractions est un itérable d'objets de type Fraction
+    POST : renvoie la concaténation des enregistrements de chaque fraction
+    """
+    out = bytearray()
+    for fraction in fractions:
+        _write_uvalue(out, _zigzag(fraction.numerator))
+        _write_uvalue(out, fraction.denominator - 1)
+    return bytes(out)
+
+
+def iter_decode(buffer):
+    """Decode a stream of records lazily, without copying the buffer
+
+    PRE : buffer est un objet bytes-like (bytes, bytearray, memoryview, mmap)
+    POST : génère les objets de type Fraction du flux dans l'ordre
+    RAISES : ValueError si le flux est tronqué
+    """
+    view = memoryview(buffer).cast('B')
+    pos = 0
+    while pos < len(view):
+        num, pos = _read_uvalue(view, pos)
+        den, pos = _read_uvalue(view, pos)
+        yield Fraction._from_coprime(_unzigzag(num), den + 1)
+
+
+def pack_column(fractions):
+    """Encode a sequence of fractions in the fixed-width column layout
+
+    La largeur choisie est la plus petite qui contient tous les numérateurs et dénominateurs.
+
+    PRE : fractions est un itérable d'objets de type Fraction
+    POST : renvoie les octets du format colonne décrit dans la documentation du module
+    RAISES : OverflowError si une valeur ne tient pas sur 64 bits (utiliser alors encode_many)
+    """
+    nums, dens = [], []
+    for fraction in fractions:
+        nums.append(fraction.numerator)
+        dens.append(fraction.denominator)
+    low, high = min(nums, default=0), max(max(nums, default=0), max(dens, default=1))
+    for width, typecode in _TYPECODES.items():
+        limit = 1 << (8 * width - 1)
+        if -limit <= low and high < limit:
+            break
+    else:
+        raise OverflowError('les valeurs dépassent 64 bits, utiliser encode_many')
+    columns = array.array(typecode, nums)
+    columns.extend(dens)
+    if sys.byteorder != 'little':
+        columns.byteswap()
+    return _COLUMN_HEADER.pack(_COLUMN_MAGIC, width, len(nums)) + columns.tobytes()
+
+
+class FractionColumn:
+    """Read-only sequence view over data in the column layout
+
+    Les numérateurs et dénominateurs sont lus directement dans le buffer (bytes, mmap, ...) via des
+    memoryview : rien n'est copié à l'ouverture et chaque Fraction est construite à la demande.
+    """
+
+    __slots__ = ('_num', '_den')
+
+    def __init__(self, buffer):
+        """Open a column buffer
+
+        PRE : buffer est un objet bytes-like produit par pack_column
+        POST : crée une vue sur les fractions contenues dans buffer
+        RAISES : ValueError si buffer n'est pas au format colonne
+        """
+        view = memoryview(buffer).cast('B')
+        if len(view) < _COLUMN_HEADER.size:
+            raise ValueError('en-tête de colonne tronqué')
+        magic, width, count = _COLUMN_HEADER.unpack_from(view)
+        if magic != _COLUMN_MAGIC or width not in _TYPECODES:
+            raise ValueError('buffer au format colonne invalide')
+        start = _COLUMN_HEADER.size
+        middle, end = start + width * count, start + 2 * width * count
+        if len(view) != end:
+            raise ValueError('taille de colonne invalide')
+        typecode = _TYPECODES[width]
+        if sys.byteorder == 'little':
+            self._num = view[start:middle].cast(typecode)
+            self._den = view[middle:end].cast(typecode)
+        else:
+            self._num, self._den = array.array(typecode), array.array(typecode)
+            self._num.frombytes(view[start:middle])
+            self._den.frombytes(view[middle:end])
+            self._num.byteswap()
+            self._den.byteswap()
+
+    def __len__(self):
+        return len(self._num)
+
+    def __getitem__(self, index):
+        """Return one fraction of the column
+
+        PRE : index est un entier
+        POST : renvoie l'objet de type Fraction à la position index
+        RAISES : IndexError si index est hors limites
+        """
+        return Fraction._from_coprime(self._num[index], self._den[index])
+
+    def __iter__(self):
+        from_coprime = Fraction._from_coprime
+        for num, den in zip(self._num, self._den):
+            yield from_coprime(num, den)
@@ -0,0 +1,225 @@
+import math
+import weakref
+
+from fraction_impl import Fraction, _rational_pair
+
+# Table de hash-consing : un même (opération, opérandes) donne toujours le même nœud tant qu'il est vivant
+_NODES = weakref.WeakValueDictionary()
+
+
+def lazy(value):
+    """Start a lazy expression from a value
+
+    PRE : value est une Fraction, un int ou un nombre rationnel
+    POST : renvoie une feuille (Leaf) dont la valeur peut être modifiée avec set()
+    RAISES : TypeError si value n'est pas un nombre rationnel exact
+    """
+    return Leaf(value)
+
+
+def _as_expr(value):
+    """Return value as an expression node, wrapping constants in a shared immutable _Const, or None"""
+    if isinstance(value, Expr):
+        return value
+    pair = _rational_pair(value)
+    if pair is None:
+        return None
+    key = ('const', pair[0], pair[1])
+    node = _NODES.get(key)
+    if node is None:
+        node = _NODES[key] = _Const(pair)
+    return node
+
+
+def _node(op, left, right):
+    """Return the shared node for op applied to left and right, creating it if needed"""
+    key = (op, id(left), right if op == 'pow' else id(right))
+    node = _NODES.get(key)
+    if node is None:
+        node = _NODES[key] = _Node(op, left, right)
+    return node
+
+
+class Expr:
+    """Node of a lazy fraction expression DAG
+
+    Les opérateurs + - * / et ** (exposant entier) ne calculent rien : ils construisent un nœud, partagé
+    si la même sous-expression existe déjà. Chaque nœud garde en cache sa valeur sous forme d'un couple
+    d'entiers non réduit ; la fraction n'est réduite qu'une fois, par evaluate(). Quand une feuille change,
+    seuls les nœuds qui en dépendent sont invalidés et recalculés à l'évaluation suivante.
+    """
+
+    __slots__ = ('_pair', '_parents', '__weakref__')
+
+    def __init__(self):
+        self._pair = None
+        self._parents = weakref.WeakSet()
+
+    def _children(self):
+        return ()
+
+    # ------------------ Building ------------------
+
+    def _binary(self, op, other, reflected=False):
+        other = _as_expr(other)
+        if other is None:
+            return NotImplemented
+        return _node(op, other, self) if reflected else _node(op, self, other)
+
+    def __add__(self, other):
+        return self._binary('add', other)
+
+    def __radd__(self, other):
+        return self._binary('add', other, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary('sub', other)
+
+    def __rsub__(self, other):
+        return self._binary('sub', other, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary('mul', other)
+
+    def __rmul__(self, other):
+        return self._binary('mul', other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary('truediv', other)
+
+    def __rtruediv__(self, other):
+        return self._binary('truediv', other, reflected=True)
+
+    def __pow__(self, exponent):
+        """Build self ** exponent
+
+        PRE : exponent est un entier ou une Fraction entière
+        POST : renvoie le nœud représentant self exposant exponent
+        RAISES : TypeError si exponent n'est pas entier
+        """
+        pair = _rational_pair(exponent)
+        if pair is None or pair[1] != 1:
+            return NotImplemented
+        return _node('pow', self, pair[0])
+
+    # ------------------ Evaluation ------------------
+
+    def evaluate(self):
+        """Return the value of the expression
+
+        Seuls les nœuds invalidés depuis la dernière évaluation sont recalculés, du bas vers le haut et
+        sans récursion, puis le résultat est réduit une seule fois.
+
+        PRE : -
+        POST : renvoie un objet de type Fraction égal à la valeur de l'expression
+        RAISES : ZeroDivisionError si une division par zéro apparaît dans l'expression
+        """
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if node._pair is not None:
+                stack.pop()
+                continue
+            pending = [child for child in node._children() if child._pair is None]
+            if pending:
+                stack.extend(pending)
+            else:
+                node._pair = node._compute()
+                stack.pop()
+        return Fraction(*self._pair)
+
+    def _invalidate(self):
+        """Drop the cached values of every node depending on self"""
+        stack = list(self._parents)
+        while stack:
+            node = stack.pop()
+            if node._pair is not None:
+                node._pair = None
+                stack.extend(node._parents)
+
+
+class Leaf(Expr):
+    """Input value of an expression, which can be changed after the expression is built"""
+
+    __slots__ = ()
+
+    def __init__(self, value):
+        """Build a leaf
+
+        PRE : value est une Fraction, un int ou un nombre rationnel
+        POST : crée une feuille valant value
+        RAISES : TypeError si value n'est pas un nombre rationnel exact
+        """
+        super().__init__()
+        self.set(value)
+
+    def set(self, value):
+        """Change the value of the leaf
+
+        PRE : value est une Fraction, un int ou un nombre rationnel
+        POST : la feuille vaut value et les expressions qui en dépendent seront recalculées
+        RAISES : TypeError si value n'est pas un nombre rationnel exact
+        """
+        pair = _rational_pair(value)
+        if pair is None:
+            raise TypeError('une feuille doit contenir un nombre rationnel exact')
+        self._pair = pair
+        self._invalidate()
+
+
+class _Const(Expr):
+    """Constant operand of an expression, shared by every expression using the same value
+
+    Contrairement à Leaf, une constante n'a pas de set() : elle est partagée par la table de hash-consing
+    et la modifier changerait toutes les expressions qui l'utilisent.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, pair):
+        super().__init__()
+        self._pair = pair
+
+
+class _Node(Expr):
+    __slots__ = ('_op', '_left', '_right')
+
+    def __init__(self, op, left, right):
+        super().__init__()
+        self._op = op
+        self._left = left
+        self._right = right
+        left._parents.add(self)
+        if op != 'pow':
+            right._parents.add(self)
+
+    def _children(self):
+        return (self._left,) if self._op == 'pow' else (self._left, self._right)
+
+    def _compute(self):
+        """Combine the unreduced pairs of the children, keeping the denominator positive
+
+        Une somme est ramenée au ppcm des dénominateurs (pgcd des seuls dénominateurs) : le numérateur
+        n'est jamais réduit, mais les dénominateurs ne grossissent pas inutilement.
+        """
+        n1, d1 = self._left._pair
+        if self._op == 'pow':
+            exponent = self._right
+            if exponent < 0:
+                if not n1:
+                    raise ZeroDivisionError('division par zéro interdite')
+                n1, d1, exponent = (d1, n1, -exponent) if n1 > 0 else (-d1, -n1, -exponent)
+            return n1 ** exponent, d1 ** exponent
+        n2, d2 = self._right._pair
+        if self._op == 'add' or self._op == 'sub':
+            if self._op == 'sub':
+                n2 = -n2
+            if d1 == d2:
+                return n1 + n2, d1
+            g = math.gcd(d1, d2)
+            return n1 * (d2 // g) + n2 * (d1 // g), d1 // g * d2
+        if self._op == 'mul':
+            return n1 * n2, d1 * d2
+        if not n2:
+            raise ZeroDivisionError('division par zéro interdite')
+        return (n1 * d2, d1 * n2) if n2 > 0 else (-n1 * d2, -d1 * n2)
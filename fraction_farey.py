@@ -0,0 +1,287 @@
+import bisect
+import itertools
+
+from fraction_impl import Fraction, _rational_pair
+
+# Taille visée des blocs de FareyIndex : un bloc est coupé en deux au-delà de 2 * _LOAD éléments
+_LOAD = 512
+
+
+def farey(n):
+    """Generate the Farey sequence of order n, lazily
+
+    Chaque terme est calculé à partir des deux précédents : si a/b et c/d se suivent, le suivant est
+    (k*c - a)/(k*d - b) avec k = (n + b) // d. La mémoire utilisée ne dépend pas de n.
+
+    PRE : n est un entier >= 1
+    POST : génère dans l'ordre croissant les objets de type Fraction de [0, 1] dont le dénominateur est
+    au plus n, chacun sous forme réduite
+    RAISES : ValueError si n < 1
+    """
+    if n < 1:
+        raise ValueError("l'ordre d'une suite de Farey doit être au moins 1")
+    from_coprime = Fraction._from_coprime
+    a, b, c, d = 0, 1, 1, n
+    yield from_coprime(a, b)
+    while c <= n:
+        k = (n + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+        yield from_coprime(a, b)
+
+
+def simplest_between(low, high):
+    """Return the simplest fraction of a closed interval
+
+    La plus simple est celle de plus petit dénominateur (puis de plus petit numérateur en valeur absolue) ;
+    c'est le premier nœud de l'arbre de Stern-Brocot qui tombe dans l'intervalle. Elle est trouvée en
+    développant les deux bornes en fraction continue tant qu'elles ont la même partie entière.
+
+    PRE : low et high sont des Fraction, des int ou des nombres rationnels
+    POST : renvoie l'objet de type Fraction le plus simple de [min(low, high), max(low, high)]
+    RAISES : TypeError si une borne n'est pas un nombre rationnel exact
+    """
+    low, high = _rational_pair(low), _rational_pair(high)
+    if low is None or high is None:
+        raise TypeError('les bornes doivent être des nombres rationnels exacts')
+    p, q = low
+    r, s = high
+    if p * s > r * q:
+        p, q, r, s = r, s, p, q
+    if p <= 0 <= r:
+        return Fraction(0)
+    if r < 0:
+        num, den = _simplest(-r, s, -p, q)
+        return Fraction._from_coprime(-num, den)
+    return Fraction._from_coprime(*_simplest(p, q, r, s))
+
+
+def _simplest(p, q, r, s):
+    """Simplest fraction of [p/q, r/s], for 0 < p/q <= r/s, as a (num, den) pair"""
+    h0, h1, k0, k1 = 0, 1, 1, 0
+    while True:
+        a = p // q
+        if a * q == p:
+            t = a
+        elif (a + 1) * s <= r:
+            t = a + 1
+        else:
+            h0, h1, k0, k1 = h1, a * h1 + h0, k1, a * k1 + k0
+            p, q, r, s = s, r - a * s, q, p - a * q
+            continue
+        return t * h1 + h0, t * k1 + k0
+
+
+def is_unimodular(x, y):
+    """Check if two fractions are neighbours in the Stern-Brocot tree (|ad - bc| == 1)
+
+    Deux fractions a/b et c/d telles que |ad - bc| == 1 sont voisines dans une suite de Farey ; leur
+    différence est alors 1/(bd), elles sont donc aussi adjacentes au sens de Fraction.is_adjacent_to.
+
+    PRE : x et y sont des objets de type Fraction
+    POST : renvoie True si |x.numerator * y.denominator - y.numerator * x.denominator| == 1
+    """
+    return abs(x.numerator * y.denominator - y.numerator * x.denominator) == 1
+
+
+class FareyIndex:
+    """Sorted set of fractions for neighbour, range and adjacency queries
+
+    Les valeurs sont rangées dans l'ordre de l'arbre de Stern-Brocot, c'est-à-dire l'ordre numérique, dans
+    une liste de blocs triés d'au plus 2 * _LOAD éléments ; le plus grand élément de chaque bloc est gardé à
+    part. Une recherche fait une dichotomie sur ces maxima puis dans un bloc, et une insertion ne déplace
+    que les éléments d'un bloc.
+    """
+
+    def __init__(self, values=()):
+        """Build an index from any iterable of fractions
+
+        PRE : values est un itérable d'objets de type Fraction
+        POST : crée un index contenant les valeurs distinctes de values
+        """
+        self._load(sorted(set(values)))
+
+    @classmethod
+    def from_sorted(cls, values):
+        """Build an index from values already sorted in strictly increasing order, in linear time
+
+        PRE : values est un itérable d'objets de type Fraction, strictement croissant
+        POST : renvoie un FareyIndex contenant ces valeurs, sans nouveau tri
+        RAISES : ValueError si values n'est pas strictement croissant
+        """
+        values = list(values)
+        if any(b <= a for a, b in zip(values, itertools.islice(values, 1, None))):
+            raise ValueError('les valeurs doivent être strictement croissantes')
+        index = object.__new__(cls)
+        index._load(values)
+        return index
+
+    def _load(self, values):
+        self._blocks = [values[i:i + _LOAD] for i in range(0, len(values), _LOAD)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(values)
+        self._max_den = max((value.denominator for value in values), default=1)
+
+    # ------------------ Container protocol ------------------
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __contains__(self, value):
+        i = bisect.bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        block = self._blocks[i]
+        return block[bisect.bisect_left(block, value)] == value
+
+    def insert(self, value):
+        """Add a fraction to the index
+
+        PRE : value est un objet de type Fraction
+        POST : value fait partie de l'index ; renvoie True si elle a été ajoutée, False si elle y était déjà
+        """
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+        else:
+            i = bisect.bisect_left(self._maxes, value)
+            if i == len(self._maxes):
+                i -= 1
+            block = self._blocks[i]
+            j = bisect.bisect_left(block, value)
+            if j < len(block) and block[j] == value:
+                return False
+            block.insert(j, value)
+            self._maxes[i] = block[-1]
+            if len(block) > 2 * _LOAD:
+                self._blocks[i:i + 1] = [block[:_LOAD], block[_LOAD:]]
+                self._maxes[i:i + 1] = [block[_LOAD - 1], block[-1]]
+        self._len += 1
+        self._max_den = max(self._max_den, value.denominator)
+        return True
+
+    # ------------------ Order queries ------------------
+
+    def predecessor(self, value):
+        """Return the largest fraction of the index strictly smaller than value
+
+        PRE : value est un objet de type Fraction
+        POST : renvoie un objet de type Fraction, ou None si aucune valeur n'est plus petite
+        """
+        i = bisect.bisect_left(self._maxes, value)
+        if i < len(self._blocks):
+            block = self._blocks[i]
+            j = bisect.bisect_left(block, value)
+            if j:
+                return block[j - 1]
+        return self._maxes[i - 1] if i else None
+
+    def successor(self, value):
+        """Return the smallest fraction of the index strictly greater than value
+
+        PRE : value est un objet de type Fraction
+        POST : renvoie un objet de type Fraction, ou None si aucune valeur n'est plus grande
+        """
+        i = bisect.bisect_right(self._maxes, value)
+        if i == len(self._blocks):
+            return None
+        block = self._blocks[i]
+        return block[bisect.bisect_right(block, value)]
+
+    def nearest(self, value):
+        """Return the fraction of the index closest to value, the smaller one on a tie
+
+        PRE : value est un objet de type Fraction
+        POST : renvoie value si elle fait partie de l'index, sinon la valeur la plus proche ; None si l'index
+        est vide
+        """
+        if value in self:
+            return value
+        below, above = self.predecessor(value), self.successor(value)
+        if below is None or above is None:
+            return above if below is None else below
+        return above if above - value < value - below else below
+
+    def range(self, low, high):
+        """Generate the fractions of the index between two bounds, in increasing order
+
+        PRE : low et high sont des objets de type Fraction
+        POST : génère les valeurs v de l'index telles que low <= v <= high
+        """
+        i = bisect.bisect_left(self._maxes, low)
+        if i == len(self._blocks):
+            return
+        j = bisect.bisect_left(self._blocks[i], low)
+        for block in itertools.islice(self._blocks, i, None):
+            for value in itertools.islice(block, j, None):
+                if high < value:
+                    return
+                yield value
+            j = 0
+
+    def _range_reversed(self, low, high):
+        """Generate the fractions v of the index with low <= v <= high, in decreasing order"""
+        i = bisect.bisect_right(self._maxes, high)
+        if i < len(self._blocks):
+            j = bisect.bisect_right(self._blocks[i], high)
+        else:
+            i, j = i - 1, None
+        while i >= 0:
+            block = self._blocks[i]
+            for k in range(len(block) if j is None else j, 0, -1):
+                value = block[k - 1]
+                if value < low:
+                    return
+                yield value
+            i, j = i - 1, None
+
+    # ------------------ Adjacency queries ------------------
+
+    def adjacent_to(self, value):
+        """Return the fractions of the index that are unimodular neighbours of value
+
+        Les voisins c/d de a/b (|ad - bc| == 1) situés à droite forment la suite (c0 + k*a)/(d0 + k*b),
+        k >= 0, qui décroît vers a/b ; c0/d0, le voisin de plus petit dénominateur, borne donc l'intervalle où
+        chercher. De chaque côté, la moins coûteuse de deux stratégies est choisie : parcourir les valeurs de
+        l'index dans l'intervalle, ou tester l'appartenance des voisins dont le dénominateur ne dépasse pas
+        le plus grand dénominateur de l'index.
+
+        PRE : value est un objet de type Fraction
+        POST : renvoie la liste croissante des valeurs v de l'index telles que is_unimodular(value, v)
+        """
+        a, b = value.numerator, value.denominator
+        found = []
+        for sign in (1, -1):
+            # voisin c0/d0 de plus petit dénominateur, avec a*d0 - b*c0 == -sign
+            d0 = 1 if b == 1 else (-sign * pow(a, -1, b)) % b
+            c0 = (a * d0 + sign) // b
+            candidates = (self._max_den - d0) // b + 1
+            if candidates <= 0:
+                continue
+            extreme = Fraction._from_coprime(c0, d0)
+            scan = self.range(value, extreme) if sign > 0 else self._range_reversed(extreme, value)
+            scanned = list(itertools.islice(scan, candidates + 1))
+            if len(scanned) <= candidates:
+                found.extend(v for v in scanned if is_unimodular(value, v))
+            else:
+                for k in range(candidates):
+                    neighbour = Fraction._from_coprime(c0 + k * a, d0 + k * b)
+                    if neighbour in self:
+                        found.append(neighbour)
+        return sorted(found)
+
+    def adjacent_pairs(self):
+        """Generate the consecutive values of the index that are unimodular neighbours
+
+        PRE : -
+        POST : génère dans l'ordre les couples (x, y) de valeurs consécutives de l'index telles que
+        is_unimodular(x, y)
+        """
+        values = iter(self)
+        previous = next(values, None)
+        for value in values:
+            if is_unimodular(previous, value):
+                yield previous, value
+            previous = value
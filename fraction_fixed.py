@@ -0,0 +1,349 @@
+"""Fixed-denominator arithmetic for values sharing a common denominator
+
+Un FixedDomain fixe un dénominateur D (100 pour des centimes, 360, 1000, ...). Une valeur du domaine
+est stockée comme un entier u, son nombre d'unités, et vaut u/D. Additions, soustractions, opposés et
+comparaisons entre valeurs du même domaine ne touchent que ces entiers : ni ppcm, ni pgcd, ni nouvelle
+Fraction.
+
+Un produit ou un quotient de deux valeurs n'est en général plus un multiple de 1/D. Si le domaine
+déclare un mode d'arrondi (ceux du module decimal), le résultat est ramené à un nombre entier d'unités
+selon ce mode. Sans mode d'arrondi, le résultat reste dans le domaine s'il y tombe exactement et est
+sinon promu en Fraction, sans aucune perte. Une opération avec une valeur hors du domaine (Fraction
+quelconque, valeur d'un autre domaine) est elle aussi faite exactement sur des Fraction.
+"""
+import decimal
+import operator
+
+from fraction_impl import Fraction, _ROUNDINGS, _rational_pair, _round_up
+
+
+def _units(num, den, rounding):
+    """Return num/den as an integer, rounded with rounding, or None if rounding is None and it is not exact
+
+    PRE : num et den sont des entiers, den != 0, rounding est None ou un mode d'arrondi du module decimal
+    POST : renvoie un entier, ou None si num/den n'est pas entier et qu'aucun arrondi n'est demandé
+    RAISES : ZeroDivisionError si den vaut 0
+    """
+    if not den:
+        raise ZeroDivisionError('division par zéro interdite')
+    if den < 0:
+        num, den = -num, -den
+    negative = num < 0
+    whole, rest = divmod(-num if negative else num, den)
+    if rest:
+        if rounding is None:
+            return None
+        if _round_up(whole, rest, den, negative, rounding):
+            whole += 1
+    return -whole if negative else whole
+
+
+class FixedDomain:
+    """Context pinning a common denominator for FixedValue objects"""
+
+    __slots__ = ('denominator', 'rounding')
+
+    def __init__(self, denominator, rounding=None):
+        """Build a domain
+
+        PRE : denominator est un entier >= 1, rounding est None ou un mode d'arrondi du module decimal
+        (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN, ...)
+        POST : crée un domaine de dénominateur denominator ; les produits et quotients inexacts sont
+        arrondis selon rounding, ou promus en Fraction si rounding est None
+        RAISES : TypeError si denominator n'est pas un entier, ValueError si denominator < 1 ou si
+        rounding n'est pas un mode d'arrondi connu
+        """
+        if type(denominator) != int:
+            raise TypeError('le dénominateur doit être un entier')
+        if denominator < 1:
+            raise ValueError('le dénominateur doit être au moins 1')
+        if rounding is not None and rounding not in _ROUNDINGS:
+            raise ValueError(f'mode d\'arrondi inconnu : {rounding!r}')
+        self.denominator = denominator
+        self.rounding = rounding
+
+    def __eq__(self, other):
+        if not isinstance(other, FixedDomain):
+            return NotImplemented
+        return self.denominator == other.denominator and self.rounding == other.rounding
+
+    def __hash__(self):
+        return hash((self.denominator, self.rounding))
+
+    def __call__(self, value):
+        """Convert an exact rational value to the domain, without any loss
+
+        PRE : value est une FixedValue, une Fraction, un int ou un nombre rationnel
+        POST : renvoie une FixedValue de ce domaine égale à value si value est un multiple de
+        1/denominator, sinon renvoie value sous forme de Fraction
+        RAISES : TypeError si value n'est pas un nombre rationnel exact
+        """
+        num, den = self._pair(value)
+        # num/den est réduite : c'est un multiple de 1/denominator si et seulement si den divise denominator
+        if self.denominator % den:
+            return Fraction._from_coprime(num, den)
+        return FixedValue(num * (self.denominator // den), self)
+
+    def quantize(self, value, rounding=None):
+        """Convert an exact rational value to the nearest value of the domain
+
+        PRE : value est une FixedValue, une Fraction, un int ou un nombre rationnel, rounding est None ou
+        un mode d'arrondi du module decimal
+        POST : renvoie une FixedValue de ce domaine, value arrondie selon rounding, à défaut selon le mode
+        du domaine, à défaut au plus proche (ROUND_HALF_EVEN)
+        RAISES : TypeError si value n'est pas un nombre rationnel exact, ValueError si rounding n'est pas
+        un mode d'arrondi connu
+        """
+        num, den = self._pair(value)
+        rounding = rounding or self.rounding or decimal.ROUND_HALF_EVEN
+        return FixedValue(_units(num * self.denominator, den, rounding), self)
+
+    def from_units(self, units):
+        """Build a value from its number of units
+
+        PRE : units est un entier
+        POST : renvoie la FixedValue de ce domaine valant units/denominator
+        RAISES : TypeError si units n'est pas un entier
+        """
+        if type(units) != int:
+            raise TypeError('le nombre d\'unités doit être un entier')
+        return FixedValue(units, self)
+
+    def sum(self, values, start=0):
+        """Add values of the domain on their integers only
+
+        PRE : values est un itérable de FixedValue de ce domaine, start est un int ou une FixedValue de
+        ce domaine
+        POST : renvoie la FixedValue de ce domaine égale à start plus la somme des valeurs
+        RAISES : ValueError si une valeur n'appartient pas à ce domaine
+        """
+        start = self(start)
+        if not isinstance(start, FixedValue):
+            raise ValueError('start doit appartenir au domaine')
+        total = start._units
+        for value in values:
+            if not isinstance(value, FixedValue) or value._domain is not self and value._domain != self:
+                raise ValueError('toutes les valeurs doivent appartenir au domaine')
+            total += value._units
+        return FixedValue(total, self)
+
+    @staticmethod
+    def _pair(value):
+        if isinstance(value, FixedValue):
+            return value._pair()
+        pair = _rational_pair(value)
+        if pair is None:
+            raise TypeError('seuls les nombres rationnels exacts peuvent être convertis')
+        return pair
+
+
+class FixedValue:
+    """Rational value units/D of a FixedDomain, stored as the integer units"""
+
+    __slots__ = ('_units', '_domain')
+
+    def __init__(self, units, domain):
+        """Build a value from a number of units, without any check
+
+        Constructeur interne : les valeurs se créent par FixedDomain.__call__, quantize ou from_units.
+
+        PRE : units est un entier, domain est un FixedDomain
+        POST : crée la valeur units / domain.denominator
+        """
+        self._units = units
+        self._domain = domain
+
+    @property
+    def units(self):
+        return self._units
+
+    @property
+    def domain(self):
+        return self._domain
+
+    def to_fraction(self):
+        """Convert the value to a Fraction, without any loss
+
+        PRE : -
+        POST : renvoie l'objet de type Fraction égal à units / denominator
+        """
+        return Fraction(self._units, self._domain.denominator)
+
+    def _pair(self):
+        """Return the reduced (numerator, denominator) of the value"""
+        fraction = self.to_fraction()
+        return fraction.numerator, fraction.denominator
+
+    def _same(self, other):
+        """Tell whether other is a FixedValue of an equal domain"""
+        return isinstance(other, FixedValue) and (other._domain is self._domain or other._domain == self._domain)
+
+    def _result(self, num, den):
+        """Rescale num/den (in units) to the domain with its rounding, or promote it to a Fraction"""
+        units = _units(num, den, self._domain.rounding)
+        if units is None:
+            return Fraction(num, den * self._domain.denominator)
+        return FixedValue(units, self._domain)
+
+    # ------------------ Operators overloading ------------------
+
+    def __add__(self, other):
+        """Overloading of the + operator
+
+        PRE : other est une FixedValue, une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie une FixedValue du domaine si other est un int ou une valeur du même domaine (simple
+        addition d'entiers), sinon la somme exacte sous forme de Fraction, un float si other est un float
+        """
+        if self._same(other):
+            return FixedValue(self._units + other._units, self._domain)
+        if type(other) == int:
+            return FixedValue(self._units + other * self._domain.denominator, self._domain)
+        return self._promoted(other, lambda a, b: a + b)
+
+    def __radd__(self, other):
+        if type(other) == int:
+            return FixedValue(other * self._domain.denominator + self._units, self._domain)
+        return self._promoted(other, lambda a, b: b + a)
+
+    def __sub__(self, other):
+        """Overloading of the - operator
+
+        PRE : other est une FixedValue, une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie une FixedValue du domaine si other est un int ou une valeur du même domaine (simple
+        soustraction d'entiers), sinon la différence exacte sous forme de Fraction, un float si other est
+        un float
+        """
+        if self._same(other):
+            return FixedValue(self._units - other._units, self._domain)
+        if type(other) == int:
+            return FixedValue(self._units - other * self._domain.denominator, self._domain)
+        return self._promoted(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        if type(other) == int:
+            return FixedValue(other * self._domain.denominator - self._units, self._domain)
+        return self._promoted(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        """Overloading of the * operator
+
+        Le produit par un int est exact. Le produit de u/D par une valeur p/q vaut u*p/q unités : il est
+        arrondi selon le mode du domaine, ou promu en Fraction si le domaine n'en a pas et qu'il n'est pas
+        entier.
+
+        PRE : other est une FixedValue, une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie une FixedValue du domaine ou, si l'exactitude l'exige, une Fraction ; un float si
+        other est un float
+        """
+        if type(other) == int:
+            return FixedValue(self._units * other, self._domain)
+        if self._same(other):
+            return self._result(self._units * other._units, self._domain.denominator)
+        pair = self._operand(other)
+        if pair is None:
+            return float(self) * other if isinstance(other, float) else NotImplemented
+        return self._result(self._units * pair[0], pair[1])
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """Overloading of the / operator
+
+        Le quotient de u/D par p/q vaut u*q/p unités, arrondi ou promu comme pour la multiplication.
+
+        PRE : other est une FixedValue, une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie une FixedValue du domaine ou, si l'exactitude l'exige, une Fraction ; un float si
+        other est un float
+        RAISES : ZeroDivisionError si other vaut 0
+        """
+        if type(other) == int:
+            return self._result(self._units, other)
+        if self._same(other):
+            return self._result(self._units * self._domain.denominator, other._units)
+        pair = self._operand(other)
+        if pair is None:
+            return float(self) / other if isinstance(other, float) else NotImplemented
+        return self._result(self._units * pair[1], pair[0])
+
+    def __rtruediv__(self, other):
+        """Overloading of the / operator when the left operand is not a FixedValue
+
+        PRE : other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie other / self sous la même forme que __truediv__
+        RAISES : ZeroDivisionError si self vaut 0
+        """
+        pair = self._operand(other)
+        if pair is None:
+            return other / float(self) if isinstance(other, float) else NotImplemented
+        denominator = self._domain.denominator
+        return self._result(pair[0] * denominator * denominator, pair[1] * self._units)
+
+    def __neg__(self):
+        return FixedValue(-self._units, self._domain)
+
+    def __abs__(self):
+        return FixedValue(abs(self._units), self._domain)
+
+    def _operand(self, other):
+        """Return the reduced (numerator, denominator) of an exact operand, None for anything else"""
+        if isinstance(other, FixedValue):
+            return other._pair()
+        return _rational_pair(other)
+
+    def _promoted(self, other, op):
+        """Apply op exactly on Fraction values, for an operand outside the domain"""
+        if isinstance(other, float):
+            return op(float(self), other)
+        pair = self._operand(other)
+        if pair is None:
+            return NotImplemented
+        return op(self.to_fraction(), Fraction._from_coprime(*pair))
+
+    # ------------------ Comparisons and conversions ------------------
+
+    def __eq__(self, other):
+        if self._same(other):
+            return self._units == other._units
+        pair = self._operand(other)
+        if pair is None:
+            return self.to_fraction() == other if isinstance(other, float) else NotImplemented
+        return self._units * pair[1] == pair[0] * self._domain.denominator
+
+    def _compare(self, other, op):
+        if self._same(other):
+            return op(self._units, other._units)
+        pair = self._operand(other)
+        if pair is None:
+            return op(self.to_fraction(), other) if isinstance(other, float) else NotImplemented
+        return op(self._units * pair[1], pair[0] * self._domain.denominator)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __hash__(self):
+        """Hash equal to the one of the equal Fraction, so that equal values share a dict key"""
+        return hash(self.to_fraction())
+
+    def __bool__(self):
+        return self._units != 0
+
+    def __float__(self):
+        return self._units / self._domain.denominator
+
+    def __str__(self):
+        """Return the textual representation of the equal Fraction
+
+        PRE : -
+        POST : renvoie la même string que str(self.to_fraction())
+        """
+        return str(self.to_fraction())
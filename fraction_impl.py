@@ -1,4 +1,24 @@
+import decimal
 import math
+import numbers
+import operator
+import re
+import sys
+
+_gcd = math.gcd
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+_ROUNDINGS = frozenset((decimal.ROUND_DOWN, decimal.ROUND_UP, decimal.ROUND_CEILING, decimal.ROUND_FLOOR,
+                        decimal.ROUND_HALF_UP, decimal.ROUND_HALF_DOWN, decimal.ROUND_HALF_EVEN, decimal.ROUND_05UP))
+
+# Formes acceptées par Fraction.from_string : entier, a/b, nombre mixte (2+2/5, -2-2/5), décimal, scientifique
+_FRACTION_TEXT = re.compile(r'''
+    \s*(?P<sign>[-+]?)
+    (?:
+        (?P<whole>\d+)(?P<mixed_sign>[-+])(?P<mixed_num>\d+)\s*/\s*(?P<mixed_den>\d+)
+      | (?P<num>\d+)\s*/\s*(?P<den>\d+)
+      | (?=\d|\.\d)(?P<int>\d*)(?:\.(?P<decimals>\d*))?(?:[eE](?P<exp>[-+]?\d+))?
+    )\s*\Z''', re.VERBOSE | re.ASCII)
 
 
 class Fraction:
@@ -9,11 +29,13 @@ class Fraction:
     This class allows fraction manipulations through several operations.
     """
 
+    __slots__ = ('__numerator', '__denominator', '__hash')
+
     def __init__(self, num=0, den=1):
         """This builds a fraction based on some numerator and denominator.
 
         PRE : -
-        POST : crée le numérateur et le dénominateur sous leur forme réduite
+        POST : crée le numérateur et le dénominateur sous leur forme réduite, stockés comme entiers exacts.
         RAISES : ZeroDivisionError si den==0, TypeError si num ou den ne sont pas des entiers
         """
         if not den:
@@ -23,17 +45,157 @@ class Fraction:
         if den < 0:
             num = -num
             den = -den
-        gcd = math.gcd(num, den)
-        self.__numerator = num / gcd
-        self.__denominator = den / gcd
+        gcd = _gcd(num, den)
+        if gcd != 1:
+            num //= gcd
+            den //= gcd
+        self.__numerator = num
+        self.__denominator = den
+
+    @classmethod
+    def _from_coprime(cls, num, den):
+        """Build a fraction from integers already in reduced form, without any check
+
+        Constructeur interne utilisé par les opérateurs, dont les résultats sont réduits par construction.
+
+        PRE : num et den sont des entiers premiers entre eux, den > 0
+        POST : renvoie un objet de type Fraction valant num/den, sans vérification ni calcul de pgcd
+        """
+        obj = object.__new__(cls)
+        obj.__numerator = num
+        obj.__denominator = den
+        return obj
+
+    @classmethod
+    def from_string(cls, text):
+        """Build a fraction from its textual representation
+
+        Les formes acceptées sont celles produites par __str__ et as_mixed_number ('3', '-4/5', '2+2/5',
+        '-2-2/5') ainsi que les décimaux et la notation scientifique ('0.125', '-.5', '1.5e-3').
+        Les blancs autour du texte et autour de la barre de fraction sont ignorés.
+
+        PRE : text est une string
+        POST : renvoie un objet de type Fraction égal à la valeur exacte décrite par text
+        RAISES : ValueError si text n'est pas une fraction valide, ZeroDivisionError si le dénominateur vaut 0
+        """
+        text = text.strip()
+        # Chemin rapide pour les formes courantes, limité aux chiffres ASCII : tout ce qu'il ne reconnaît
+        # pas exactement est confié à l'expression régulière, qui définit la grammaire acceptée
+        head, slash, tail = text.partition('/')
+        if slash:
+            if tail.isdigit() and text.isascii():
+                negative = head[:1] == '-'
+                if negative or head[:1] == '+':
+                    head = head[1:]
+                if head.isdigit():
+                    num, den = int(head), int(tail)
+                else:
+                    whole, mark, part = head.partition('-' if negative else '+')
+                    if not (mark and whole.isdigit() and part.isdigit()):
+                        return cls._parse(text)
+                    den = int(tail)
+                    num = int(whole) * den + int(part)
+                if not den:
+                    raise ZeroDivisionError('division par zéro interdite')
+                gcd = _gcd(num, den)
+                if gcd != 1:
+                    num //= gcd
+                    den //= gcd
+                return cls._from_coprime(-num if negative else num, den)
+        elif text.isascii():
+            body = text[1:] if text[:1] == '-' or text[:1] == '+' else text
+            if body.isdigit():
+                return cls._from_coprime(-int(body) if text[:1] == '-' else int(body), 1)
+            whole, point, decimals = body.partition('.')
+            if point and (whole + decimals).isdigit():
+                num = int(whole + decimals)
+                return cls(-num if text[:1] == '-' else num, 10 ** len(decimals))
+        return cls._parse(text)
+
+    @classmethod
+    def _parse(cls, text):
+        """Build a fraction from a stripped text with the full grammar of from_string (_FRACTION_TEXT)"""
+        match = _FRACTION_TEXT.match(text)
+        if match is None:
+            raise ValueError(f'fraction invalide : {text!r}')
+        negative = match['sign'] == '-'
+        if match['whole'] is not None:
+            if (match['mixed_sign'] == '-') != negative:
+                raise ValueError(f'nombre mixte invalide : {text!r}')
+            den = int(match['mixed_den'])
+            if not den:
+                raise ZeroDivisionError('division par zéro interdite')
+            num = int(match['whole']) * den + int(match['mixed_num'])
+        elif match['num'] is not None:
+            num, den = int(match['num']), int(match['den'])
+        else:
+            decimals = match['decimals'] or ''
+            num = int(match['int'] + decimals or '0')
+            den = 10 ** len(decimals)
+            exp = int(match['exp'] or 0)
+            if exp >= 0:
+                num *= 10 ** exp
+            else:
+                den *= 10 ** -exp
+        return cls(-num if negative else num, den)
+
+    @classmethod
+    def from_float(cls, value):
+        """Build the fraction exactly equal to a float
+
+        PRE : value est un float ou un int
+        POST : renvoie un objet de type Fraction de valeur exactement égale à value
+        RAISES : ValueError si value est NaN, OverflowError si value est infini,
+        TypeError si value n'est pas un float ou un int
+        """
+        if isinstance(value, int):
+            return cls._from_coprime(int(value), 1)
+        if not isinstance(value, float):
+            raise TypeError('from_float attend un float')
+        return cls._from_coprime(*value.as_integer_ratio())
+
+    @classmethod
+    def from_decimal(cls, value):
+        """Build the fraction exactly equal to a decimal.Decimal
+
+        PRE : value est un decimal.Decimal ou un int
+        POST : renvoie un objet de type Fraction de valeur exactement égale à value
+        RAISES : ValueError si value est NaN, OverflowError si value est infini,
+        TypeError si value n'est pas un Decimal ou un int
+        """
+        if isinstance(value, int):
+            return cls._from_coprime(int(value), 1)
+        if not isinstance(value, decimal.Decimal):
+            raise TypeError('from_decimal attend un decimal.Decimal')
+        return cls._from_coprime(*value.as_integer_ratio())
+
+    def __reduce__(self):
+        """Support for pickle and copy
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie une fonction de reconstruction globale et le couple (numérateur, dénominateur),
+        ce qui évite d'écrire les noms des slots et de recalculer le pgcd au chargement
+        """
+        return _restore, (self.__numerator, self.__denominator)
 
     @property
     def numerator(self):
-        return int(self.__numerator)
+        return self.__numerator
 
     @property
     def denominator(self):
-        return int(self.__denominator)
+        return self.__denominator
+
+    @property
+    def real(self):
+        return self
+
+    @property
+    def imag(self):
+        return 0
+
+    def conjugate(self):
+        return self
 
     # ------------------ Textual representations ------------------
 
@@ -72,73 +234,493 @@ class Fraction:
     def __add__(self, other):
         """Overloading of the + operator for fractions
 
-         PRE : self et other sont des objets de type Fraction
-         POST : renvoie un objet de type Fraction correspondant à la somme de self et other
-         """
-        new_denominator = math.lcm(self.denominator, other.denominator)
-        new_numerator = self.numerator * (new_denominator / self.denominator) + other.numerator * (new_denominator /
-                                                                                                   other.denominator)
-        return Fraction(num=int(new_numerator), den=int(new_denominator))
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à la somme de self et other,
+        un float si other est un float
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) + other if isinstance(other, float) else NotImplemented
+        return _add_sub(self.numerator, self.denominator, pair[0], pair[1])
+
+    def __radd__(self, other):
+        """Overloading of the + operator when the left operand is not a Fraction (ex : 1 + f, sum(...))
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à la somme de other et self,
+        un float si other est un float
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return other + float(self) if isinstance(other, float) else NotImplemented
+        return _add_sub(pair[0], pair[1], self.numerator, self.denominator)
 
     def __sub__(self, other):
         """Overloading of the - operator for fractions
 
-        PRE : self et other sont des objets de type Fraction
-        POST : renvoie un objet de type Fraction correspondant à la différence de self et other
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à la différence de self et other,
+        un float si other est un float
         """
-        new_denominator = math.lcm(self.denominator, other.denominator)
-        new_numerator = self.numerator * (new_denominator / self.denominator) - other.numerator * (new_denominator /
-                                                                                                   other.denominator)
-        return Fraction(num=int(new_numerator), den=int(new_denominator))
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) - other if isinstance(other, float) else NotImplemented
+        return _add_sub(self.numerator, self.denominator, -pair[0], pair[1])
+
+    def __rsub__(self, other):
+        """Overloading of the - operator when the left operand is not a Fraction
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à la différence de other et self,
+        un float si other est un float
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return other - float(self) if isinstance(other, float) else NotImplemented
+        return _add_sub(pair[0], pair[1], -self.numerator, self.denominator)
 
     def __mul__(self, other):
         """Overloading of the * operator for fractions
 
-        PRE : self et other sont des objets de type Fraction
-        POST : renvoie un objet de type Fraction correspondant à la multiplication de self et other
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à la multiplication de self et other,
+        un float si other est un float
         """
-        new_numerator = self.numerator * other.numerator
-        new_denominator = self.denominator * other.denominator
-        return Fraction(num=new_numerator, den=new_denominator)
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) * other if isinstance(other, float) else NotImplemented
+        return _mul(self.numerator, self.denominator, pair[0], pair[1])
+
+    def __rmul__(self, other):
+        """Overloading of the * operator when the left operand is not a Fraction
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à la multiplication de other et self,
+        un float si other est un float
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return other * float(self) if isinstance(other, float) else NotImplemented
+        return _mul(pair[0], pair[1], self.numerator, self.denominator)
 
     def __truediv__(self, other):
         """Overloading of the / operator for fractions
 
-        PRE : self et other sont des objets de type Fraction
-        POST : renvoie un objet de type Fraction correspondant au quotient de self et other
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant au quotient de self et other,
+        un float si other est un float
+        RAISES : ZeroDivisionError si other vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) / other if isinstance(other, float) else NotImplemented
+        return _div(self.numerator, self.denominator, pair[0], pair[1])
+
+    def __rtruediv__(self, other):
+        """Overloading of the / operator when the left operand is not a Fraction
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant au quotient de other et self,
+        un float si other est un float
+        RAISES : ZeroDivisionError si self vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return other / float(self) if isinstance(other, float) else NotImplemented
+        return _div(pair[0], pair[1], self.numerator, self.denominator)
+
+    def __floordiv__(self, other):
+        """Overloading of the // operator for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie l'int égal à la partie entière inférieure de self / other, un float si other est un float
+        RAISES : ZeroDivisionError si other vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) // other if isinstance(other, float) else NotImplemented
+        return _divmod(self.__numerator, self.__denominator, pair[0], pair[1])[0]
+
+    def __rfloordiv__(self, other):
+        """Overloading of the // operator when the left operand is not a Fraction
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie l'int égal à la partie entière inférieure de other / self, un float si other est un float
+        RAISES : ZeroDivisionError si self vaut 0
         """
-        new_numerator = self.numerator * other.denominator
-        new_denominator = self.denominator * other.numerator
-        return Fraction(num=new_numerator, den=new_denominator)
+        pair = _rational_pair(other)
+        if pair is None:
+            return other // float(self) if isinstance(other, float) else NotImplemented
+        return _divmod(pair[0], pair[1], self.__numerator, self.__denominator)[0]
+
+    def __mod__(self, other):
+        """Overloading of the % operator for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction égal à self - other * (self // other), du signe de other ;
+        un float si other est un float
+        RAISES : ZeroDivisionError si other vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) % other if isinstance(other, float) else NotImplemented
+        return _divmod(self.__numerator, self.__denominator, pair[0], pair[1])[1]
+
+    def __rmod__(self, other):
+        """Overloading of the % operator when the left operand is not a Fraction
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie other - self * (other // self), selon les mêmes règles que __mod__
+        RAISES : ZeroDivisionError si self vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return other % float(self) if isinstance(other, float) else NotImplemented
+        return _divmod(pair[0], pair[1], self.__numerator, self.__denominator)[1]
+
+    def __divmod__(self, other):
+        """Overloading of divmod() for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie le couple (self // other, self % other)
+        RAISES : ZeroDivisionError si other vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return divmod(float(self), other) if isinstance(other, float) else NotImplemented
+        return _divmod(self.__numerator, self.__denominator, pair[0], pair[1])
+
+    def __rdivmod__(self, other):
+        """Overloading of divmod() when the left operand is not a Fraction
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie le couple (other // self, other % self)
+        RAISES : ZeroDivisionError si self vaut 0
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return divmod(other, float(self)) if isinstance(other, float) else NotImplemented
+        return _divmod(pair[0], pair[1], self.__numerator, self.__denominator)
 
     def __pow__(self, other):
         """Overloading of the ** operator for fractions
 
-        PRE : self et other sont des objets de type Fraction
-        POST : renvoie un objet de type Fraction correspondant à self exposant other
+        Un exposant entier est calculé exactement par exponentiation rapide du numérateur et du dénominateur,
+        qui restent premiers entre eux sans nouveau pgcd. Pour un exposant p/q non entier, le résultat est
+        exact si le numérateur et le dénominateur de self sont des puissances q-ièmes parfaites ; sinon le
+        résultat n'est pas rationnel et une approximation de type float est renvoyée.
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie un objet de type Fraction correspondant à self exposant other si ce résultat est
+        rationnel, sinon un float approchant self exposant other
+        RAISES : ZeroDivisionError si self vaut 0 et other est négatif,
+        ValueError si self est négatif et que le dénominateur de other est pair
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return float(self) ** other if isinstance(other, float) else NotImplemented
+        return _pow(self.numerator, self.denominator, pair[0], pair[1])
+
+    def __rpow__(self, other):
+        """Overloading of the ** operator when the base is not a Fraction (ex : 4 ** Fraction(1, 2))
+
+        PRE : self est un objet de type Fraction, other est un int, un nombre rationnel ou un float
+        POST : renvoie other exposant self, selon les mêmes règles que __pow__
+        RAISES : ZeroDivisionError si other vaut 0 et self est négatif,
+        ValueError si other est négatif et que le dénominateur de self est pair
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return other ** float(self) if isinstance(other, float) else NotImplemented
+        return _pow(pair[0], pair[1], self.numerator, self.denominator)
+
+    def __neg__(self):
+        """Overloading of the unary - operator for fractions
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie un objet de type Fraction correspondant à l'opposé de self
+        """
+        return Fraction._from_coprime(-self.numerator, self.denominator)
+
+    def __pos__(self):
+        """Overloading of the unary + operator for fractions
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie self, une Fraction étant immuable
         """
-        new_numerator = self.numerator ** (other.numerator / other.denominator)
-        new_denominator = self.denominator ** (other.numerator / other.denominator)
-        if new_numerator == int(new_numerator) and new_denominator == int(new_denominator):
-            return Fraction(num=int(new_numerator), den=int(new_denominator))
-        return Fraction(num=new_numerator, den=new_denominator)
+        return self
+
+    def __abs__(self):
+        """Overloading of abs() for fractions
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie un objet de type Fraction correspondant à la valeur absolue de self
+        """
+        return Fraction._from_coprime(abs(self.numerator), self.denominator)
+
+    # ------------------ Comparisons and hashing ------------------
 
     def __eq__(self, other):
         """Overloading of the == operator for fractions
 
-        PRE : self et other sont des objets de type Fraction
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
         POST : renvoie True si le numérateur de self et other
         sont égaux et si le dénominateur de self et other sont égaux, sinon renvoie False
         """
-        return self.numerator == other.numerator and self.denominator == other.denominator
+        if isinstance(other, Fraction):
+            return self.__numerator == other.__numerator and self.__denominator == other.__denominator
+        pair = _rational_pair(other)
+        if pair is None:
+            if not isinstance(other, float):
+                return NotImplemented
+            if math.isnan(other) or math.isinf(other):
+                return False
+            pair = other.as_integer_ratio()
+        return self.__numerator == pair[0] and self.__denominator == pair[1]
+
+    def __lt__(self, other):
+        """Overloading of the < operator for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie True si self est strictement plus petit que other, sinon renvoie False
+        """
+        if isinstance(other, Fraction):
+            return self.__numerator * other.__denominator < other.__numerator * self.__denominator
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        """Overloading of the <= operator for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie True si self est plus petit ou égal à other, sinon renvoie False
+        """
+        if isinstance(other, Fraction):
+            return self.__numerator * other.__denominator <= other.__numerator * self.__denominator
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        """Overloading of the > operator for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie True si self est strictement plus grand que other, sinon renvoie False
+        """
+        if isinstance(other, Fraction):
+            return self.__numerator * other.__denominator > other.__numerator * self.__denominator
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        """Overloading of the >= operator for fractions
+
+        PRE : self est un objet de type Fraction, other est une Fraction, un int, un nombre rationnel ou un float
+        POST : renvoie True si self est plus grand ou égal à other, sinon renvoie False
+        """
+        if isinstance(other, Fraction):
+            return self.__numerator * other.__denominator >= other.__numerator * self.__denominator
+        return self._compare(other, operator.ge)
+
+    def _compare(self, other, op):
+        """Compare self and other by cross-multiplication, without building any intermediate Fraction
+
+        Les dénominateurs étant strictement positifs, a/b op c/d équivaut à a*d op c*b.
+
+        PRE : self est un objet de type Fraction, op est une fonction de comparaison du module operator
+        POST : renvoie le résultat de la comparaison, False si other est un float NaN,
+        NotImplemented si other n'est pas un nombre réel supporté
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            if not isinstance(other, float):
+                return NotImplemented
+            if math.isnan(other):
+                return False
+            if math.isinf(other):
+                return op(0.0, other)
+            pair = other.as_integer_ratio()
+        return op(self.__numerator * pair[1], pair[0] * self.__denominator)
+
+    def __hash__(self):
+        """Return a hash equal to the one of int, float and fractions.Fraction for the same value
+
+        Le hash est calculé une seule fois puis mémorisé dans l'instance.
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie un entier tel que hash(self) == hash(x) pour tout nombre x égal à self
+        """
+        cached = getattr(self, '_Fraction__hash', None)
+        if cached is not None:
+            return cached
+        try:
+            inverse = pow(self.denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            value = _HASH_INF
+        else:
+            value = hash(hash(abs(self.numerator)) * inverse)
+        if self.numerator < 0:
+            value = -value
+        self.__hash = -2 if value == -1 else value
+        return self.__hash
 
     def __float__(self):
         """Returns the decimal value of the fraction
 
+        La division de deux int de CPython est correctement arrondie (demi-pair) : elle travaille sur les
+        longueurs en bits et des décalages des deux entiers, sans passer par des flottants intermédiaires.
+        Elle ne déborde donc que si le quotient lui-même dépasse la plage des flottants.
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie le flottant le plus proche de la valeur exacte de la fraction
+        RAISES : OverflowError si la valeur absolue de la fraction dépasse le plus grand flottant
+        """
+        return self.__numerator / self.__denominator
+
+    def __bool__(self):
+        """Return False for a zero fraction, True otherwise
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie True si le numérateur de self est non nul
+        """
+        return self.__numerator != 0
+
+    def __trunc__(self):
+        """Return the integer part of the fraction, rounded toward zero
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie l'int obtenu en tronquant la valeur de self vers 0
+        """
+        if self.__numerator < 0:
+            return -(-self.__numerator // self.__denominator)
+        return self.__numerator // self.__denominator
+
+    __int__ = __trunc__
+
+    def __floor__(self):
+        """Support of math.floor(): the largest integer lower or equal to the fraction
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie un int
+        """
+        return self.__numerator // self.__denominator
+
+    def __ceil__(self):
+        """Support of math.ceil(): the smallest integer greater or equal to the fraction
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie un int
+        """
+        return -(-self.__numerator // self.__denominator)
+
+    def __round__(self, ndigits=None):
+        """Support of round(), rounding half to even like the built-in numbers
+
+        PRE : self est un objet de type Fraction, ndigits est None ou un entier
+        POST : renvoie l'int le plus proche de self si ndigits est None, sinon l'objet de type Fraction
+        multiple de 10**-ndigits le plus proche de self ; une égalité est départagée vers le pair
+        """
+        num, den = self.__numerator, self.__denominator
+        if ndigits is None:
+            return _round_half_even(num, den)
+        if ndigits >= 0:
+            shift = 10 ** ndigits
+            return Fraction(_round_half_even(num * shift, den), shift)
+        shift = 10 ** -ndigits
+        return Fraction._from_coprime(_round_half_even(num, den * shift) * shift, 1)
+
+    # ------------------ Decimal expansion ------------------
+
+    def to_decimal(self, digits, rounding=decimal.ROUND_HALF_EVEN):
+        """Return the value rounded to a fixed number of digits after the decimal point
+
+        Le calcul est entier : |num| * 10**digits est divisé par den et le reste décide de l'arrondi.
+        Le résultat est exact quel que soit le contexte decimal courant.
+
+        PRE : self est un objet de type Fraction, digits est un entier >= 0, rounding est un des modes
+        d'arrondi du module decimal (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN, ROUND_FLOOR, ...)
+        POST : renvoie un decimal.Decimal ayant exactement digits chiffres après la virgule
+        RAISES : ValueError si digits < 0 ou si rounding n'est pas un mode d'arrondi connu
+        """
+        if digits < 0:
+            raise ValueError('digits doit être positif')
+        negative = self.__numerator < 0
+        whole, rest = divmod(abs(self.__numerator) * 10 ** digits, self.__denominator)
+        if _round_up(whole, rest, self.__denominator, negative, rounding):
+            whole += 1
+        return decimal.Decimal((negative, decimal.Decimal(whole).as_tuple().digits, -digits))
+
+    def decimal_digits(self):
+        """Generate the digits after the decimal point of abs(self), lazily
+
+        Le développement décimal d'une fraction est fini ou périodique. La partie non périodique compte
+        max(v2, v5) chiffres, où 2**v2 et 5**v5 sont les plus grandes puissances de 2 et 5 qui divisent le
+        dénominateur ; le reste obtenu à sa fin est mémorisé et, dès qu'il réapparaît, une période entière
+        a été produite. Un seul reste est gardé en mémoire, quelle que soit la longueur de la période.
+
         PRE : self est un objet de type Fraction
-        POST : renvoie le résultat de la fraction sous forme décimale
+        POST : génère un int de 0 à 9 par chiffre : ceux de la partie non périodique, puis ceux d'une
+        période ; la génération s'arrête à la fin d'un développement fini ou après la première période
         """
-        return self.numerator / self.denominator
+        den = self.__denominator
+        rest = abs(self.__numerator) % den
+        for _ in range(_pre_period(den)):
+            digit, rest = divmod(rest * 10, den)
+            yield digit
+        if not rest:
+            return
+        start = rest
+        while True:
+            digit, rest = divmod(rest * 10, den)
+            yield digit
+            if rest == start:
+                return
+
+    def decimal_period(self):
+        """Return the lengths of the non-repeating part and of the period of the decimal expansion
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie (pre, period) : pre chiffres non périodiques après la virgule, suivis d'une période
+        de period chiffres ; period vaut 0 si le développement est fini (ex : 1/6 donne (1, 1))
+        """
+        den = self.__denominator
+        pre = _pre_period(den)
+        rest = abs(self.__numerator) % den * pow(10, pre, den) % den
+        if not rest:
+            return pre, 0
+        start, period = rest, 0
+        while True:
+            rest = rest * 10 % den
+            period += 1
+            if rest == start:
+                return pre, period
+
+    # ------------------ Continued fractions ------------------
+
+    def to_continued_fraction(self):
+        """Return the terms of the continued fraction expansion
+
+        Le développement est celui de l'algorithme d'Euclide : le premier terme est la partie entière
+        (arrondie vers le bas) et les suivants sont strictement positifs.
+
+        PRE : self est un objet de type Fraction
+        POST : renvoie la liste [a0, a1, ..., an] telle que self = a0 + 1/(a1 + 1/(... + 1/an))
+        """
+        terms = []
+        num, den = self.numerator, self.denominator
+        while den:
+            whole, rest = divmod(num, den)
+            terms.append(whole)
+            num, den = den, rest
+        return terms
+
+    def limit_denominator(self, max_denominator=1_000_000):
+        """Return the closest fraction to self whose denominator is at most max_denominator
+
+        Le résultat est un des convergents de self ou un semi-convergent, trouvé en O(log(dénominateur))
+        étapes de l'algorithme des fractions continues.
+
+        PRE : self est un objet de type Fraction, max_denominator est un entier
+        POST : renvoie un objet de type Fraction de dénominateur <= max_denominator le plus proche de self
+        RAISES : ValueError si max_denominator < 1
+        """
+        return Fraction._from_coprime(*_limit_denominator(self.numerator, self.denominator, max_denominator))
 
     # ------------------ Properties checking ------------------
 
@@ -148,7 +730,7 @@ class Fraction:
         PRE : self est un objet de type Fraction
         POST : renvoie True si self.numerator==0, sinon renvoie False
         """
-        return not self.numerator
+        return not self.__numerator
 
     def is_integer(self):
         """Check if a fraction is integer (ex : 8/4, 3, 2/2, ...)
@@ -156,16 +738,17 @@ class Fraction:
         PRE : self est un objet de type Fraction
         POST : renvoie True si self.denominator==1, sinon renvoie False
         """
-        return self.denominator == 1
+        return self.__denominator == 1
 
     def is_proper(self):
         """Check if the absolute value of the fraction is < 1
 
         PRE : self est un objet de type Fraction
         POST : renvoie True si la valeur absolue de self.numerator est plus
-        petite que la valeur absolue de self.denominator, sinon renvoie False
+        petite que self.denominator (toujours positif), sinon renvoie False
         """
-        return abs(self.numerator) < abs(self.denominator)
+        num = self.__numerator
+        return num < self.__denominator if num >= 0 else -num < self.__denominator
 
     def is_unit(self):
         """Check if a fraction's numerator is 1 in its reduced form
@@ -173,15 +756,242 @@ class Fraction:
         PRE : self est un objet de type Fraction
         POST : renvoie True si self.numerator==1, sinon renvoie False
         """
-        return self.numerator == 1
+        return self.__numerator == 1
 
     def is_adjacent_to(self, other):
         """Check if two fractions differ by a unit fraction
 
-        Two fractions are adjacents if the absolute value of the difference them is a unit fraction
+        Two fractions are adjacents if the absolute value of the difference them is a unit fraction.
+        a/b - c/d = (ad - cb)/bd a un numérateur réduit de valeur absolue 1 si et seulement si ad - cb est
+        non nul et divise bd : la différence n'est jamais construite.
 
-        PRE : self et other sont des objets de type Fraction POST : renvoie True si la valeur absolue du numérateur
-        de la différence de self et other est égale à 1, sinon renvoie False
+        PRE : self est un objet de type Fraction, other est une Fraction, un int ou un nombre rationnel
+        POST : renvoie True si la valeur absolue du numérateur de la différence de self et other est égale à 1,
+        sinon renvoie False
+        RAISES : TypeError si other n'est pas un nombre rationnel exact
         """
-        difference = self - other
-        return abs(difference.numerator) == 1
+        if isinstance(other, Fraction):
+            num, den = other.__numerator, other.__denominator
+        else:
+            pair = _rational_pair(other)
+            if pair is None:
+                raise TypeError('other doit être un nombre rationnel exact')
+            num, den = pair
+        cross = self.__numerator * den - num * self.__denominator
+        return cross != 0 and not (self.__denominator * den) % cross
+
+
+numbers.Rational.register(Fraction)
+
+
+def _rational_pair(value):
+    """Return the reduced (numerator, denominator) of an exact rational operand
+
+    PRE : -
+    POST : renvoie un tuple (num, den) si value est une Fraction, un int ou un numbers.Rational,
+    sinon renvoie None
+    """
+    if isinstance(value, Fraction):
+        return value.numerator, value.denominator
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, numbers.Rational):
+        return value.numerator, value.denominator
+    return None
+
+
+def _restore(num, den):
+    """Rebuild a pickled fraction, whose numerator and denominator are already reduced"""
+    return Fraction._from_coprime(num, den)
+
+
+def _add_sub(na, da, nb, db):
+    """Add two reduced fractions na/da and nb/db with the Henrici method
+
+    Le pgcd n'est calculé que sur les dénominateurs puis sur un facteur du résultat, ce qui garde les entiers
+    intermédiaires petits et évite la réduction complète de la somme.
+
+    PRE : na, da, nb, db sont des entiers, da > 0, db > 0, na/da et nb/db sont réduites
+    POST : renvoie un objet de type Fraction correspondant à na/da + nb/db
+    """
+    g = _gcd(da, db)
+    if g == 1:
+        return Fraction._from_coprime(na * db + da * nb, da * db)
+    s = da // g
+    t = na * (db // g) + nb * s
+    g2 = _gcd(t, g)
+    if g2 == 1:
+        return Fraction._from_coprime(t, s * db)
+    return Fraction._from_coprime(t // g2, s * (db // g2))
+
+
+def _mul(na, da, nb, db):
+    """Multiply two reduced fractions na/da and nb/db
+
+    Les pgcd croisés sont retirés avant la multiplication, le produit est donc réduit par construction.
+
+    PRE : na, da, nb, db sont des entiers, da > 0, db > 0, na/da et nb/db sont réduites
+    POST : renvoie un objet de type Fraction correspondant à na/da * nb/db
+    """
+    g1 = _gcd(na, db)
+    if g1 > 1:
+        na //= g1
+        db //= g1
+    g2 = _gcd(nb, da)
+    if g2 > 1:
+        nb //= g2
+        da //= g2
+    return Fraction._from_coprime(na * nb, db * da)
+
+
+def _div(na, da, nb, db):
+    """Divide the reduced fraction na/da by the reduced fraction nb/db
+
+    PRE : na, da, nb, db sont des entiers, da > 0, db > 0, na/da et nb/db sont réduites
+    POST : renvoie un objet de type Fraction correspondant à (na/da) / (nb/db)
+    RAISES : ZeroDivisionError si nb vaut 0
+    """
+    if not nb:
+        raise ZeroDivisionError('division par zéro interdite')
+    g1 = _gcd(na, nb)
+    if g1 > 1:
+        na //= g1
+        nb //= g1
+    g2 = _gcd(db, da)
+    if g2 > 1:
+        db //= g2
+        da //= g2
+    num, den = na * db, nb * da
+    if den < 0:
+        return Fraction._from_coprime(-num, -den)
+    return Fraction._from_coprime(num, den)
+
+
+def _divmod(na, da, nb, db):
+    """Floor division and remainder of the reduced fraction na/da by the reduced fraction nb/db
+
+    PRE : na, da, nb, db sont des entiers, da > 0, db > 0, na/da et nb/db sont réduites
+    POST : renvoie le couple (q, r) où q est un int, r un objet de type Fraction et na/da == q * nb/db + r
+    RAISES : ZeroDivisionError si nb vaut 0
+    """
+    if not nb:
+        raise ZeroDivisionError('division par zéro interdite')
+    q, r = divmod(na * db, da * nb)
+    return q, Fraction(r, da * db)
+
+
+def _pow(num, den, power, root):
+    """Raise the reduced fraction num/den to the reduced exponent power/root
+
+    PRE : num, den, power, root sont des entiers, den > 0, root > 0, num/den et power/root sont réduites
+    POST : renvoie un objet de type Fraction si le résultat est rationnel, sinon un float approché
+    RAISES : ZeroDivisionError si num vaut 0 et power < 0, ValueError si num < 0 et root est pair
+    """
+    if root != 1:
+        if num < 0 and not root % 2:
+            raise ValueError('racine paire d\'une fraction négative')
+        root_num = _iroot(abs(num), root)
+        root_den = _iroot(den, root)
+        if root_num ** root != abs(num) or root_den ** root != den:
+            value = (abs(num) / den) ** (power / root)
+            return -value if num < 0 and power % 2 else value
+        num = -root_num if num < 0 else root_num
+        den = root_den
+    if power >= 0:
+        return Fraction._from_coprime(num ** power, den ** power)
+    if not num:
+        raise ZeroDivisionError('division par zéro interdite')
+    if num < 0:
+        return Fraction._from_coprime((-den) ** -power, (-num) ** -power)
+    return Fraction._from_coprime(den ** -power, num ** -power)
+
+
+def _iroot(n, k):
+    """Return the integer k-th root of n, rounded down
+
+    PRE : n >= 0 et k >= 1 sont des entiers
+    POST : renvoie le plus grand entier r tel que r ** k <= n
+    """
+    if k == 1 or n < 2:
+        return n
+    if k == 2:
+        return math.isqrt(n)
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def _round_half_even(num, den):
+    """Return the integer closest to num/den, a tie going to the even one (den > 0)"""
+    whole, rest = divmod(num, den)
+    twice = 2 * rest
+    if twice > den or twice == den and whole % 2:
+        whole += 1
+    return whole
+
+
+def _round_up(whole, rest, den, negative, rounding):
+    """Tell whether the truncated magnitude whole (remainder rest / den) must be incremented
+
+    PRE : whole >= 0, 0 <= rest < den, negative indique le signe de la valeur arrondie,
+    rounding est un mode d'arrondi du module decimal
+    POST : renvoie True si l'arrondi de la valeur absolue doit se faire vers le haut
+    RAISES : ValueError si rounding n'est pas un mode d'arrondi connu
+    """
+    if rounding not in _ROUNDINGS:
+        raise ValueError(f'mode d\'arrondi inconnu : {rounding!r}')
+    if not rest:
+        return False
+    if rounding == decimal.ROUND_DOWN:
+        return False
+    if rounding == decimal.ROUND_UP:
+        return True
+    if rounding == decimal.ROUND_CEILING:
+        return not negative
+    if rounding == decimal.ROUND_FLOOR:
+        return negative
+    if rounding == decimal.ROUND_05UP:
+        return whole % 5 == 0
+    twice = 2 * rest
+    if twice != den:
+        return twice > den
+    return rounding == decimal.ROUND_HALF_UP or (rounding == decimal.ROUND_HALF_EVEN and whole % 2 == 1)
+
+
+def _pre_period(den):
+    """Return the number of non-repeating decimal digits of a fraction with denominator den (den > 0)"""
+    twos = (den & -den).bit_length() - 1
+    fives = 0
+    while not den % 5:
+        den //= 5
+        fives += 1
+    return max(twos, fives)
+
+
+def _limit_denominator(num, den, max_denominator):
+    """Best rational approximation of num/den with a bounded denominator
+
+    PRE : num et den sont des entiers premiers entre eux, den > 0
+    POST : renvoie le couple réduit (p, q), q <= max_denominator, tel que p/q est le plus proche de num/den
+    RAISES : ValueError si max_denominator < 1
+    """
+    if max_denominator < 1:
+        raise ValueError('max_denominator doit être au moins 1')
+    if den <= max_denominator:
+        return num, den
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = num, den
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    k = (max_denominator - q0) // q1
+    if 2 * d * (q0 + k * q1) <= den:
+        return p1, q1
+    return p0 + k * p1, q0 + k * q1
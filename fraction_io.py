@@ -0,0 +1,79 @@
+import mmap
+
+from fraction_impl import Fraction, _gcd
+
+# Taille des morceaux lus dans un buffer : seul un morceau et ses lignes existent à la fois en mémoire
+_CHUNK = 1 << 16
+
+
+def _buffer_lines(source):
+    """Yield the lines of a string or of an ASCII bytes-like buffer, one chunk of the buffer at a time
+
+    Seul '\n' sépare les lignes ; un '\r' final reste dans la ligne et est retiré par from_string.
+    """
+    rest = ''
+    for start in range(0, len(source), _CHUNK):
+        piece = source[start:start + _CHUNK]
+        if not isinstance(piece, str):
+            piece = bytes(piece).decode('ascii')
+        lines = (rest + piece).split('\n')
+        rest = lines.pop()
+        yield from lines
+    yield rest
+
+
+def _stripped_lines(source):
+    """Yield the lines of an iterable of text or binary lines, without their surrounding blanks"""
+    for line in source:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode('ascii')
+        yield line.strip()
+
+
+def parse_many(source):
+    """Parse one fraction per line, lazily
+
+    Les lignes vides ou blanches sont ignorées. Une ligne 'a/b' écrite en chiffres ASCII, avec un signe
+    '-' facultatif, est convertie directement : deux int(), un pgcd et la construction de la Fraction.
+    Les autres formes passent par Fraction.from_string. Un buffer est découpé par morceaux de taille
+    fixe, sans jamais être copié en entier, et aucune liste de toutes les lignes n'est construite.
+
+    PRE : source est une string, un objet bytes-like (bytes, bytearray, memoryview, mmap) ou un itérable
+    de lignes (fichier texte ou binaire, liste, générateur)
+    POST : génère un objet de type Fraction par ligne non vide de source
+    RAISES : ValueError si une ligne n'est pas une fraction valide, ZeroDivisionError si une ligne a un
+    dénominateur nul, UnicodeDecodeError si un buffer binaire n'est pas en ASCII
+    """
+    if isinstance(source, (str, bytes, bytearray, memoryview, mmap.mmap)):
+        lines = _buffer_lines(source)
+    else:
+        lines = _stripped_lines(source)
+    from_coprime, from_string = Fraction._from_coprime, Fraction.from_string
+    for line in lines:
+        num, _, den = line.partition('/')
+        if (den.isdigit() and (num.isdigit() or num[:1] == '-' and num[1:].isdigit())
+                and line.isascii()):
+            num, den = int(num), int(den)
+            if not den:
+                raise ZeroDivisionError('division par zéro interdite')
+            gcd = _gcd(num, den)
+            yield from_coprime(num // gcd, den // gcd) if gcd != 1 else from_coprime(num, den)
+        elif line and not line.isspace():
+            yield from_string(line)
+
+
+def format_many(fractions, mixed=False):
+    """Format fractions one per line, lazily
+
+    Le résultat se combine avec file.writelines pour écrire un fichier sans construire de grande string.
+
+    PRE : fractions est un itérable d'objets de type Fraction
+    POST : génère pour chaque fraction une string terminée par '\\n', produite par as_mixed_number
+    si mixed est vrai, sinon par __str__
+    """
+    if mixed:
+        for fraction in fractions:
+            yield fraction.as_mixed_number() + '\n'
+    else:
+        for fraction in fractions:
+            yield f'{fraction}\n'
@@ -0,0 +1,355 @@
+import math
+import operator
+
+from fraction_impl import Fraction, _rational_pair
+
+
+def _normalized_row(nums, den):
+    """Bring an integer row over a common denominator to its canonical form
+
+    PRE : nums est une liste d'entiers, den est un entier non nul
+    POST : renvoie (nums, den) avec den > 0 et pgcd(den, *nums) == 1 ; den est alors le ppcm des
+    dénominateurs réduits des éléments de la ligne
+    """
+    if den < 0:
+        nums = [-x for x in nums]
+        den = -den
+    g = math.gcd(den, *nums)
+    if g != 1:
+        nums = [x // g for x in nums]
+        den //= g
+    return nums, den
+
+
+def _bareiss(rows, pivot_columns):
+    """Run fraction-free (Bareiss) elimination in place on integer rows
+
+    Chaque nouvel élément vaut (pivot * x - f * y) // pivot_précédent ; la division est exacte, les
+    éléments restent des mineurs de la matrice de départ et aucun pgcd n'est calculé.
+
+    PRE : rows est une liste de listes d'entiers de même longueur, pivot_columns <= len(rows[0])
+    POST : rows est échelonnée ; renvoie (colonnes des pivots, signe de la permutation des lignes).
+    Les pivots ne sont cherchés que dans les pivot_columns premières colonnes
+    """
+    nrows = len(rows)
+    pivots, sign, previous, r = [], 1, 1, 0
+    for c in range(pivot_columns):
+        if r == nrows:
+            break
+        p = next((i for i in range(r, nrows) if rows[i][c]), None)
+        if p is None:
+            continue
+        if p != r:
+            rows[p], rows[r] = rows[r], rows[p]
+            sign = -sign
+        pivot_row = rows[r]
+        pivot = pivot_row[c]
+        pivot_tail = pivot_row[c + 1:]
+        for i in range(r + 1, nrows):
+            row = rows[i]
+            f = row[c]
+            if previous == 1:
+                row[c + 1:] = [pivot * x - f * y for x, y in zip(row[c + 1:], pivot_tail)]
+            else:
+                row[c + 1:] = [(pivot * x - f * y) // previous for x, y in zip(row[c + 1:], pivot_tail)]
+            row[c] = 0
+        pivots.append(c)
+        previous = pivot
+        r += 1
+    return pivots, sign
+
+
+class FractionMatrix:
+    """Dense matrix of fractions for exact linear algebra
+
+    Chaque ligne est stockée comme des numérateurs entiers sur un dénominateur commun (le ppcm des
+    dénominateurs de la ligne) ; les numérateurs de toutes les lignes se suivent dans une seule liste.
+    Les calculs (produit, déterminant, rang, inverse, résolution) travaillent directement sur ces lignes
+    entières : l'élimination de Bareiss n'a besoin d'aucun pgcd dans sa boucle interne et chaque
+    résultat n'est réduit qu'une fois, ligne par ligne.
+    """
+
+    __slots__ = ('_nrows', '_ncols', '_num', '_den')
+
+    def __init__(self, rows):
+        """Build a matrix from a sequence of rows
+
+        PRE : rows est un itérable de séquences de même longueur de Fraction, d'int ou de nombres rationnels
+        POST : crée une matrice contenant ces valeurs
+        RAISES : ValueError si les lignes n'ont pas toutes la même longueur, TypeError si un élément
+        n'est pas un nombre rationnel exact
+        """
+        num, den, ncols = [], [], None
+        for row in rows:
+            pairs = [_rational_pair(value) for value in row]
+            if None in pairs:
+                raise TypeError('les éléments doivent être des nombres rationnels exacts')
+            if ncols is None:
+                ncols = len(pairs)
+            elif len(pairs) != ncols:
+                raise ValueError('toutes les lignes doivent avoir la même longueur')
+            common = math.lcm(*(d for _, d in pairs)) if pairs else 1
+            num.extend(n * (common // d) for n, d in pairs)
+            den.append(common)
+        self._nrows = len(den)
+        self._ncols = ncols or 0
+        self._num = num
+        self._den = den
+
+    @classmethod
+    def _wrap(cls, nrows, ncols, num, den):
+        """Build a matrix from row-major numerators and canonical row denominators, without any check"""
+        obj = object.__new__(cls)
+        obj._nrows = nrows
+        obj._ncols = ncols
+        obj._num = num
+        obj._den = den
+        return obj
+
+    @classmethod
+    def _from_int_rows(cls, rows, dens, ncols):
+        """Build a matrix from integer rows over arbitrary non-zero denominators, normalizing each row"""
+        num, out_dens = [], []
+        for row, den in zip(rows, dens):
+            row, den = _normalized_row(row, den)
+            num.extend(row)
+            out_dens.append(den)
+        return cls._wrap(len(out_dens), ncols, num, out_dens)
+
+    @classmethod
+    def identity(cls, n):
+        """Build the identity matrix of size n
+
+        PRE : n est un entier >= 0
+        POST : renvoie la matrice identité n x n
+        """
+        num = [0] * (n * n)
+        num[::n + 1] = [1] * n
+        return cls._wrap(n, n, num, [1] * n)
+
+    @classmethod
+    def zeros(cls, nrows, ncols):
+        """Build a matrix filled with zeros
+
+        PRE : nrows et ncols sont des entiers >= 0
+        POST : renvoie la matrice nulle nrows x ncols
+        """
+        return cls._wrap(nrows, ncols, [0] * (nrows * ncols), [1] * nrows)
+
+    # ------------------ Access ------------------
+
+    @property
+    def shape(self):
+        return self._nrows, self._ncols
+
+    def _int_row(self, i):
+        start = i * self._ncols
+        return self._num[start:start + self._ncols]
+
+    def row(self, i):
+        """Return one row of the matrix
+
+        PRE : 0 <= i < nombre de lignes
+        POST : renvoie la liste des objets de type Fraction de la ligne i
+        RAISES : IndexError si i est hors limites
+        """
+        if not 0 <= i < self._nrows:
+            raise IndexError('indice de ligne hors limites')
+        den = self._den[i]
+        return [Fraction(n, den) for n in self._int_row(i)]
+
+    def rows(self):
+        """Return the matrix as a list of rows
+
+        PRE : -
+        POST : renvoie une liste de listes d'objets de type Fraction
+        """
+        return [self.row(i) for i in range(self._nrows)]
+
+    def __iter__(self):
+        return (self.row(i) for i in range(self._nrows))
+
+    def __len__(self):
+        return self._nrows
+
+    def __getitem__(self, index):
+        """Return one element (matrix[i, j]) or one row (matrix[i])
+
+        PRE : index est un entier i ou un tuple (i, j) d'indices valides
+        POST : renvoie l'objet de type Fraction à la position (i, j), ou la liste de la ligne i
+        RAISES : IndexError si un indice est hors limites
+        """
+        if not isinstance(index, tuple):
+            return self.row(index)
+        i, j = index
+        if not (0 <= i < self._nrows and 0 <= j < self._ncols):
+            raise IndexError('indice hors limites')
+        return Fraction(self._num[i * self._ncols + j], self._den[i])
+
+    def __eq__(self, other):
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        return self.shape == other.shape and self._den == other._den and self._num == other._num
+
+    __hash__ = None
+
+    def __str__(self):
+        return '\n'.join('[' + ', '.join(str(value) for value in row) + ']' for row in self)
+
+    def __repr__(self):
+        return f'FractionMatrix({[[str(value) for value in row] for row in self]})'
+
+    # ------------------ Arithmetic ------------------
+
+    def transpose(self):
+        """Return the transposed matrix
+
+        PRE : -
+        POST : renvoie la matrice dont l'élément (j, i) vaut l'élément (i, j) de self
+        """
+        return FractionMatrix(zip(*self.rows())) if self._nrows else FractionMatrix.zeros(self._ncols, 0)
+
+    def _combine(self, other, op):
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ValueError('les matrices doivent avoir la même taille')
+        rows, dens = [], []
+        for i in range(self._nrows):
+            da, db = self._den[i], other._den[i]
+            g = math.gcd(da, db)
+            fa, fb = db // g, da // g
+            rows.append([op(a * fa, b * fb) for a, b in zip(self._int_row(i), other._int_row(i))])
+            dens.append(da * fa)
+        return FractionMatrix._from_int_rows(rows, dens, self._ncols)
+
+    def __add__(self, other):
+        return self._combine(other, operator.add)
+
+    def __sub__(self, other):
+        return self._combine(other, operator.sub)
+
+    def __neg__(self):
+        return FractionMatrix._wrap(self._nrows, self._ncols, [-x for x in self._num], list(self._den))
+
+    def __mul__(self, other):
+        """Multiply every element by a scalar
+
+        PRE : other est une Fraction, un int ou un nombre rationnel
+        POST : renvoie la matrice self * other
+        """
+        pair = _rational_pair(other)
+        if pair is None:
+            return NotImplemented
+        n, d = pair
+        rows = [[x * n for x in self._int_row(i)] for i in range(self._nrows)]
+        return FractionMatrix._from_int_rows(rows, [den * d for den in self._den], self._ncols)
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, other):
+        """Return the matrix product self @ other
+
+        Les lignes de other sont ramenées à un dénominateur commun L : chaque élément du produit est
+        alors une somme de produits d'entiers, divisée par den_i * L.
+
+        PRE : other est une FractionMatrix dont le nombre de lignes est le nombre de colonnes de self
+        POST : renvoie la matrice produit
+        RAISES : ValueError si les tailles sont incompatibles
+        """
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        if self._ncols != other._nrows:
+            raise ValueError('tailles incompatibles pour le produit matriciel')
+        common = math.lcm(*other._den)
+        scaled = [[x * (common // other._den[k]) for x in other._int_row(k)] for k in range(other._nrows)]
+        columns = list(zip(*scaled)) if scaled else [()] * other._ncols
+        rows = [[sum(map(operator.mul, row, column)) for column in columns]
+                for row in map(self._int_row, range(self._nrows))]
+        return FractionMatrix._from_int_rows(rows, [den * common for den in self._den], other._ncols)
+
+    # ------------------ Linear algebra ------------------
+
+    def _require_square(self):
+        if self._nrows != self._ncols:
+            raise ValueError('la matrice doit être carrée')
+
+    def det(self):
+        """Return the determinant
+
+        PRE : self est une matrice carrée
+        POST : renvoie l'objet de type Fraction égal au déterminant (1 pour une matrice 0 x 0)
+        RAISES : ValueError si la matrice n'est pas carrée
+        """
+        self._require_square()
+        n = self._nrows
+        if not n:
+            return Fraction(1)
+        rows = [self._int_row(i) for i in range(n)]
+        pivots, sign = _bareiss(rows, n)
+        if len(pivots) < n:
+            return Fraction(0)
+        return Fraction(sign * rows[-1][-1], math.prod(self._den))
+
+    def rank(self):
+        """Return the rank
+
+        PRE : -
+        POST : renvoie le rang de la matrice
+        """
+        rows = [self._int_row(i) for i in range(self._nrows)]
+        pivots, _ = _bareiss(rows, self._ncols)
+        return len(pivots)
+
+    def solve(self, b):
+        """Solve the system self @ x = b exactly
+
+        Le système augmenté [self | b] est éliminé par Bareiss, puis la remontée reste entière : si D est
+        le dernier pivot, D * x est entier (règle de Cramer) et chaque division de la remontée est exacte.
+
+        PRE : self est une matrice carrée inversible, b est une FractionMatrix ayant autant de lignes que
+        self, ou une séquence de nombres rationnels de cette longueur
+        POST : renvoie la FractionMatrix x si b est une matrice, sinon la liste des objets de type Fraction
+        de la solution
+        RAISES : ValueError si la matrice n'est pas carrée, si les tailles sont incompatibles ou si la
+        matrice est singulière
+        """
+        self._require_square()
+        vector = not isinstance(b, FractionMatrix)
+        if vector:
+            b = FractionMatrix([value] for value in b)
+        if b._nrows != self._nrows:
+            raise ValueError('le second membre doit avoir autant de lignes que la matrice')
+        n, k = self._nrows, b._ncols
+        rows = []
+        for i in range(n):
+            da, db = self._den[i], b._den[i]
+            g = math.gcd(da, db)
+            fa, fb = db // g, da // g
+            rows.append([x * fa for x in self._int_row(i)] + [x * fb for x in b._int_row(i)])
+        pivots, _ = _bareiss(rows, n)
+        if len(pivots) < n:
+            raise ValueError('la matrice est singulière')
+        d = rows[-1][n - 1] if n else 1
+        solution = [None] * n
+        for i in reversed(range(n)):
+            row = rows[i]
+            acc = [d * x for x in row[n:]]
+            for j in range(i + 1, n):
+                u = row[j]
+                if u:
+                    acc = [a - u * y for a, y in zip(acc, solution[j])]
+            pivot = row[i]
+            solution[i] = [a // pivot for a in acc]
+        x = FractionMatrix._from_int_rows(solution, [d] * n, k)
+        return [x[i, 0] for i in range(n)] if vector else x
+
+    def inverse(self):
+        """Return the inverse matrix
+
+        PRE : self est une matrice carrée inversible
+        POST : renvoie la FractionMatrix inverse de self
+        RAISES : ValueError si la matrice n'est pas carrée ou si elle est singulière
+        """
+        self._require_square()
+        return self.solve(FractionMatrix.identity(self._nrows))
@@ -0,0 +1,275 @@
+"""Multi-modular evaluation of lazy fraction expressions
+
+Une expression construite avec fraction_expr.lazy() est évaluée modulo des nombres premiers de 62 bits
+au lieu de l'être sur des entiers exacts, sans aucun pgcd. Chaque valeur intermédiaire est gardée sous
+forme projective (numérateur, dénominateur) modulo m : seul le résultat final demande une inversion
+modulaire. Pour amortir le coût de l'interpréteur, les premiers sont regroupés par group_size et chaque
+flux de résidus travaille modulo le produit d'un groupe ; les flux sont indépendants et peuvent tourner
+dans des processus séparés.
+
+Les résidus sont combinés par le théorème des restes chinois (CRT) en un entier r modulo M, puis la
+fraction n/d telle que n ≡ r * d (mod M), avec |n| et d au plus sqrt(M / 2), est retrouvée par
+reconstruction rationnelle (algorithme d'Euclide étendu arrêté à mi-chemin).
+
+Le résultat est vérifié modulo un nombre premier qui n'a pas servi à le construire. Si la reconstruction
+échoue ou si la vérification ne passe pas, le nombre de premiers est doublé. Un faux positif demande que
+le nombre premier de vérification divise la différence entre deux fractions distinctes : sa probabilité
+est de l'ordre de (taille du résultat en bits) / 2**62.
+"""
+import concurrent.futures
+import math
+
+from fraction_expr import _as_expr
+from fraction_impl import Fraction
+
+# Bases du test de Miller-Rabin, déterministe pour tout n < 3.3 * 10**24
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+# Nombres premiers déjà trouvés, du plus grand au plus petit, en partant de 2**62
+_PRIMES = []
+# Au-delà de ce nombre de premiers inutilisables d'affilée, la division par zéro est considérée comme réelle
+_BAD_PRIME_LIMIT = 4
+
+
+def _is_prime(n):
+    """Deterministic Miller-Rabin test for n < 3.3 * 10**24"""
+    if n < 2:
+        return False
+    for p in _WITNESSES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in _WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _prime(index):
+    """Return the index-th prime below 2**62, generating and caching the missing ones"""
+    candidate = _PRIMES[-1] - 2 if _PRIMES else (1 << 62) - 1
+    while len(_PRIMES) <= index:
+        if _is_prime(candidate):
+            _PRIMES.append(candidate)
+        candidate -= 2
+    return _PRIMES[index]
+
+
+def _compile(expr):
+    """Flatten an expression DAG into a list of instructions in evaluation order
+
+    PRE : expr est un nœud de fraction_expr
+    POST : renvoie une liste picklable d'instructions ('const', num, den), (op, i, j) ou ('pow', i, exposant),
+    où i et j sont les positions des résultats déjà calculés ; le dernier résultat est celui de expr
+    et une sous-expression partagée n'apparaît qu'une fois
+    """
+    program, index = [], {}
+    stack = [expr]
+    while stack:
+        node = stack[-1]
+        if id(node) in index:
+            stack.pop()
+            continue
+        children = node._children()
+        if not children:
+            program.append(('const',) + node._pair)
+        else:
+            pending = [child for child in children if id(child) not in index]
+            if pending:
+                stack.extend(pending)
+                continue
+            right = node._right if node._op == 'pow' else index[id(node._right)]
+            program.append((node._op, index[id(node._left)], right))
+        index[id(node)] = len(program) - 1
+        stack.pop()
+    return program
+
+
+def _run(program, m):
+    """Evaluate a compiled program modulo m
+
+    Chaque valeur est un couple (numérateur, dénominateur) modulo m : une somme coûte trois produits mais
+    aucune inversion. Une division ou une puissance négative fait passer un dénominateur au numérateur, et
+    une puissance nulle le fait disparaître : ces dénominateurs sont multipliés dans guard, de sorte que
+    l'unique inversion finale, celle de dens[-1] * guard, détecte tous les dénominateurs nuls modulo m.
+
+    PRE : program est produit par _compile, m est un nombre premier ou un produit de premiers distincts
+    POST : renvoie le résidu modulo m de la valeur de l'expression, ou None si un dénominateur de
+    l'évaluation n'est pas inversible modulo m
+    """
+    nums, dens = [], []
+    guard = 1
+    for op, a, b in program:
+        if op == 'const':
+            nums.append(a % m)
+            dens.append(b % m)
+        elif op == 'add' or op == 'sub':
+            da, db = dens[a], dens[b]
+            if op == 'add':
+                nums.append((nums[a] * db + nums[b] * da) % m)
+            else:
+                nums.append((nums[a] * db - nums[b] * da) % m)
+            dens.append(da * db % m)
+        elif op == 'mul':
+            nums.append(nums[a] * nums[b] % m)
+            dens.append(dens[a] * dens[b] % m)
+        elif op == 'truediv':
+            guard = guard * dens[b] % m
+            nums.append(nums[a] * dens[b] % m)
+            dens.append(dens[a] * nums[b] % m)
+        elif b >= 0:
+            if not b:
+                guard = guard * dens[a] % m
+            nums.append(pow(nums[a], b, m))
+            dens.append(pow(dens[a], b, m))
+        else:
+            guard = guard * dens[a] % m
+            nums.append(pow(dens[a], -b, m))
+            dens.append(pow(nums[a], -b, m))
+    try:
+        return nums[-1] * guard * pow(dens[-1] * guard, -1, m) % m
+    except ValueError:
+        return None
+
+
+def _residues(program, moduli):
+    """Evaluate a program modulo each modulus, None marking the moduli that cannot be used"""
+    return [_run(program, m) for m in moduli]
+
+
+def _reconstruct(r, m):
+    """Find the fraction n/d congruent to r modulo m with |n|, d <= sqrt(m / 2)
+
+    PRE : m > 1, 0 <= r < m
+    POST : renvoie le couple (n, d) réduit avec d > 0, ou None si aucune fraction assez petite n'existe
+    """
+    bound = math.isqrt(m // 2)
+    r0, r1, t0, t1 = m, r, 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    if t1 == 0 or abs(t1) > bound:
+        return None
+    n, d = (r1, t1) if t1 > 0 else (-r1, -t1)
+    if math.gcd(n, d) != 1:
+        return None
+    return n, d
+
+
+class ModularEvaluator:
+    """Evaluate lazy fraction expressions with modular arithmetic and rational reconstruction
+
+    Avec workers > 1, les flux de résidus (un par groupe de premiers) sont répartis dans un pool de
+    processus, l'expression étant envoyée sous forme d'une liste d'instructions.
+    """
+
+    def __init__(self, workers=None, primes=4, max_primes=1 << 16, group_size=64):
+        """Build an evaluator
+
+        PRE : workers est None ou 1 (calcul dans le processus courant) ou un entier > 1, primes >= 1 est le
+        nombre de premiers du premier essai, max_primes >= primes borne le nombre total de premiers,
+        group_size >= 1 est le nombre de premiers traités ensemble par un flux de résidus
+        POST : crée un évaluateur, à fermer avec close() ou via un bloc with s'il utilise des processus
+        """
+        self.primes = primes
+        self.max_primes = max_primes
+        self.group_size = group_size
+        self.workers = workers or 1
+        self._pool = (concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+                      if self.workers > 1 else None)
+
+    def close(self):
+        """Shut the process pool down, if any
+
+        PRE : -
+        POST : les processus sont arrêtés
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _evaluate(self, program, primes):
+        """Return the list of (modulus, residue) obtained from a list of primes
+
+        Les premiers sont regroupés par group_size ; un groupe inutilisable (dénominateur divisible par
+        un de ses premiers) est réévalué premier par premier pour ne perdre que les mauvais.
+        """
+        groups = [primes[i:i + self.group_size] for i in range(0, len(primes), self.group_size)]
+        moduli = [math.prod(group) for group in groups]
+        if self._pool is None or len(moduli) < 2:
+            residues = _residues(program, moduli)
+        else:
+            size = -(-len(moduli) // self.workers)
+            chunks = [moduli[i:i + size] for i in range(0, len(moduli), size)]
+            residues = [x for chunk in self._pool.map(_residues, [program] * len(chunks), chunks) for x in chunk]
+        results = []
+        for group, m, x in zip(groups, moduli, residues):
+            if x is not None:
+                results.append((m, x))
+            elif len(group) > 1:
+                results.extend((p, y) for p, y in zip(group, _residues(program, group)) if y is not None)
+        return results
+
+    def evaluate(self, expr):
+        """Return the exact value of an expression
+
+        PRE : expr est un nœud de fraction_expr, une Fraction ou un int
+        POST : renvoie l'objet de type Fraction égal à la valeur de expr
+        RAISES : ZeroDivisionError si l'expression divise par zéro, ValueError si le résultat n'a pas pu
+        être reconstruit avec max_primes nombres premiers, TypeError si expr n'est pas une expression
+        """
+        expr = _as_expr(expr)
+        if expr is None:
+            raise TypeError('expr doit être une expression de fraction_expr')
+        program = _compile(expr)
+        r, m, used, bad, wanted = 0, 1, 0, 0, self.primes
+        while True:
+            # wanted premiers pour la reconstruction, le dernier servant à la vérification
+            primes = [_prime(i) for i in range(used, used + wanted + 1)]
+            used += len(primes)
+            check = _run(program, primes[-1])
+            good = self._evaluate(program, primes[:-1])
+            bad = 0 if good or check is not None else bad + len(primes)
+            if bad >= _BAD_PRIME_LIMIT:
+                raise ZeroDivisionError('division par zéro interdite')
+            for modulus, x in good:
+                r += m * ((x - r) * pow(m, -1, modulus) % modulus)
+                m *= modulus
+            candidate = _reconstruct(r, m) if m > 1 else None
+            if check is not None:
+                p = primes[-1]
+                if candidate is not None:
+                    n, d = candidate
+                    if d % p and n * pow(d, -1, p) % p == check:
+                        return Fraction._from_coprime(n, d)
+                r += m * ((check - r) * pow(m, -1, p) % p)
+                m *= p
+            if used >= self.max_primes:
+                raise ValueError(f'reconstruction impossible avec {self.max_primes} nombres premiers')
+            wanted = min(used, self.max_primes - used - 1) or 1
+
+
+def evaluate_modular(expr, workers=None, primes=4, max_primes=1 << 16, group_size=64):
+    """Evaluate an expression with a temporary ModularEvaluator
+
+    PRE : voir ModularEvaluator.__init__ et ModularEvaluator.evaluate
+    POST : renvoie l'objet de type Fraction égal à la valeur de expr
+    RAISES : ZeroDivisionError, ValueError ou TypeError comme ModularEvaluator.evaluate
+    """
+    with ModularEvaluator(workers, primes, max_primes, group_size) as evaluator:
+        return evaluator.evaluate(expr)
@@ -0,0 +1,229 @@
+import functools
+import threading
+import time
+
+import fraction_cache
+import fraction_impl
+import fraction_io
+import fraction_sum
+from fraction_impl import Fraction
+
+# Méthodes de Fraction instrumentées quand le profilage est actif
+PROFILED_METHODS = (
+    '__init__', '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__truediv__',
+    '__rtruediv__', '__floordiv__', '__rfloordiv__', '__mod__', '__rmod__', '__divmod__', '__rdivmod__',
+    '__pow__', '__rpow__', '__neg__', '__pos__', '__abs__', '__eq__', '__lt__', '__le__', '__gt__', '__ge__',
+    '__hash__', '__float__', '__int__', '__trunc__', '__floor__', '__ceil__', '__round__', '__str__',
+    'as_mixed_number', 'limit_denominator', 'to_continued_fraction', 'to_decimal', 'decimal_digits',
+    'decimal_period', 'is_zero', 'is_integer', 'is_proper', 'is_unit', 'is_adjacent_to',
+)
+
+# Modules qui lient fraction_impl._gcd à l'import et dont les pgcd doivent aussi être comptés
+_GCD_MODULES = (fraction_impl, fraction_cache, fraction_io)
+
+_active = None
+
+
+def _bucket(value):
+    """Return the power-of-two upper bound of the histogram bucket holding value (value >= 0)"""
+    return 1 << value.bit_length() if value else 0
+
+
+class FractionProfiler:
+    """Opt-in instrumentation of the Fraction hot paths
+
+    Tant que le profileur n'est pas activé, rien n'est modifié : Fraction tourne sans aucun surcoût.
+    enable() remplace les méthodes de PROFILED_METHODS, les alias _gcd des modules de _GCD_MODULES et
+    l'alias _lcm de fraction_sum par des versions qui comptent les appels, mesurent leur durée et la taille en bits
+    des fractions produites ; disable() remet les originaux en place. Un seul profileur peut être actif
+    à la fois.
+    """
+
+    def __init__(self):
+        """Build an inactive profiler with empty statistics
+
+        PRE : -
+        POST : crée un profileur inactif dont tous les compteurs valent 0
+        """
+        self._lock = threading.Lock()
+        self._originals = {}
+        self.reset()
+
+    # ------------------ Activation ------------------
+
+    def enable(self):
+        """Install the instrumented methods
+
+        PRE : aucun autre profileur n'est actif
+        POST : les appels aux méthodes de Fraction, à _gcd et à _lcm sont comptabilisés
+        RAISES : RuntimeError si un profileur est déjà actif
+        """
+        global _active
+        if _active is not None:
+            raise RuntimeError('un profileur est déjà actif')
+        _active = self
+        for name in PROFILED_METHODS:
+            method = Fraction.__dict__[name]
+            self._originals[(Fraction, name)] = method
+            setattr(Fraction, name, self._timed(name, method))
+        counted_gcd = self._counted_gcd(fraction_impl._gcd)
+        for module in _GCD_MODULES:
+            self._originals[(module, '_gcd')] = module._gcd
+            module._gcd = counted_gcd
+        self._originals[(fraction_sum, '_lcm')] = fraction_sum._lcm
+        fraction_sum._lcm = self._counted_lcm(fraction_sum._lcm)
+
+    def disable(self):
+        """Restore the original methods
+
+        PRE : -
+        POST : Fraction, les modules de _GCD_MODULES et fraction_sum sont remis dans leur état d'origine, les
+        statistiques sont conservées
+        """
+        global _active
+        for (owner, name), original in self._originals.items():
+            setattr(owner, name, original)
+        self._originals.clear()
+        if _active is self:
+            _active = None
+
+    @property
+    def enabled(self):
+        return _active is self
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    # ------------------ Recording ------------------
+
+    def reset(self):
+        """Set every statistic back to 0
+
+        PRE : -
+        POST : tous les compteurs et histogrammes sont vides
+        """
+        with self._lock:
+            self._calls = {}
+            self._time_total = {}
+            self._time_histogram = {}
+            self._bits = {'numerator': {}, 'denominator': {}}
+            self._bits_total = {'numerator': 0, 'denominator': 0}
+            self._gcd_calls = 0
+            self._gcd_reductions = 0
+            self._gcd_bits = 0
+            self._lcm_calls = 0
+
+    def _timed(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            result = method(*args, **kwargs)
+            elapsed = time.perf_counter_ns() - start
+            self._record(name, elapsed, args[0] if name == '__init__' else result)
+            return result
+        return wrapper
+
+    def _record(self, name, elapsed, value):
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._time_total[name] = self._time_total.get(name, 0) + elapsed
+            histogram = self._time_histogram.setdefault(name, {})
+            bucket = _bucket(elapsed)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+            if isinstance(value, Fraction):
+                for part, number in (('numerator', value.numerator), ('denominator', value.denominator)):
+                    bits = abs(number).bit_length()
+                    bucket = _bucket(bits)
+                    self._bits[part][bucket] = self._bits[part].get(bucket, 0) + 1
+                    self._bits_total[part] += bits
+
+    def _counted_gcd(self, gcd):
+        @functools.wraps(gcd)
+        def counted(*args):
+            result = gcd(*args)
+            with self._lock:
+                self._gcd_calls += 1
+                self._gcd_bits += max((abs(arg).bit_length() for arg in args), default=0)
+                if result > 1:
+                    self._gcd_reductions += 1
+            return result
+        return counted
+
+    def _counted_lcm(self, lcm):
+        @functools.wraps(lcm)
+        def counted(*args):
+            with self._lock:
+                self._lcm_calls += 1
+            return lcm(*args)
+        return counted
+
+    # ------------------ Export ------------------
+
+    def snapshot(self):
+        """Return a copy of the current statistics
+
+        PRE : -
+        POST : renvoie un dict avec 'calls' (appels par méthode), 'time_ns' (durée totale et histogramme
+        des durées par méthode, clés = bornes supérieures en puissances de 2), 'bits' (somme et histogramme
+        de la taille en bits des numérateurs et dénominateurs produits), 'gcd_calls',
+        'gcd_reductions' (pgcd > 1), 'gcd_bits' (somme des tailles des opérandes des pgcd) et 'lcm_calls'
+        """
+        with self._lock:
+            return {
+                'calls': dict(self._calls),
+                'time_ns': {name: {'total': self._time_total[name],
+                                   'histogram': dict(sorted(self._time_histogram[name].items()))}
+                            for name in self._calls},
+                'bits': {part: {'total': self._bits_total[part], 'histogram': dict(sorted(histogram.items()))}
+                         for part, histogram in self._bits.items()},
+                'gcd_calls': self._gcd_calls,
+                'gcd_reductions': self._gcd_reductions,
+                'gcd_bits': self._gcd_bits,
+                'lcm_calls': self._lcm_calls,
+            }
+
+    def to_prometheus(self):
+        """Return the statistics in the Prometheus text exposition format
+
+        PRE : -
+        POST : renvoie une string contenant les compteurs et histogrammes préfixés par fraction_
+        """
+        stats = self.snapshot()
+        lines = ['# TYPE fraction_calls_total counter']
+        lines += [f'fraction_calls_total{{method="{name}"}} {count}' for name, count in stats['calls'].items()]
+        lines.append('# TYPE fraction_call_duration_ns histogram')
+        for name, timing in stats['time_ns'].items():
+            lines += _histogram_lines('fraction_call_duration_ns', f'method="{name}"', timing['histogram'],
+                                      timing['total'])
+        lines.append('# TYPE fraction_result_bits histogram')
+        for part, bits in stats['bits'].items():
+            lines += _histogram_lines('fraction_result_bits', f'part="{part}"', bits['histogram'], bits['total'])
+        for key in ('gcd_calls', 'gcd_reductions', 'gcd_bits', 'lcm_calls'):
+            lines.append(f'# TYPE fraction_{key}_total counter')
+            lines.append(f'fraction_{key}_total {stats[key]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _histogram_lines(metric, labels, histogram, total):
+    """Format one Prometheus histogram with cumulative buckets"""
+    lines, cumulative = [], 0
+    for bound, count in sorted(histogram.items()):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {cumulative}')
+    lines.append(f'{metric}_sum{{{labels}}} {total}')
+    lines.append(f'{metric}_count{{{labels}}} {cumulative}')
+    return lines
+
+
+def profile():
+    """Return a new profiler to use as a context manager for scoped profiling
+
+    PRE : aucun profileur n'est actif
+    POST : renvoie un FractionProfiler, activé à l'entrée du bloc with et désactivé à sa sortie
+    """
+    return FractionProfiler()
@@ -0,0 +1,204 @@
+"""Asynchronous streaming stages for Fraction records
+
+Chaque étape est un générateur asynchrone qui consomme l'itérateur asynchrone de l'étape précédente :
+
+    values = aparse(reader)                        # lignes -> Fraction
+    values = amap('mul', values, Fraction(3, 2))   # opération, éventuellement déportée dans un pool
+    await write_lines(aformat(values), writer)     # Fraction -> lignes, avec writer.drain()
+
+Le flux est tiré par le consommateur : une étape lente ralentit naturellement les précédentes.
+buffered() découple deux étapes par une file bornée ; quand elle est pleine, le producteur attend.
+Les paquets de grands entiers sont calculés dans un exécuteur (threads ou processus) pour ne pas
+bloquer la boucle d'événements ; ils traversent les frontières de processus sous forme de tuples
+(numérateur, dénominateur), comme pour fraction_batch.
+"""
+import asyncio
+import collections
+import contextlib
+import operator
+
+from fraction_batch import _map_chunk, _pack, _reduce_values, _resolve, _unpack
+from fraction_impl import Fraction
+from fraction_sum import FractionAccumulator
+
+_END = object()
+
+
+async def aparse(source):
+    """Parse one fraction per line of an asynchronous stream
+
+    PRE : source est un itérable asynchrone de lignes (str ou bytes), par exemple un asyncio.StreamReader
+    POST : génère un objet de type Fraction par ligne non vide
+    RAISES : ValueError si une ligne n'est pas une fraction valide,
+    ZeroDivisionError si une ligne a un dénominateur nul
+    """
+    async for line in source:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode('ascii')
+        if line.strip():
+            yield Fraction.from_string(line)
+
+
+def _bits(values):
+    """Return the largest bit length among the numerators and denominators of a batch"""
+    return max((max(abs(value.numerator).bit_length(), value.denominator.bit_length()) for value in values),
+               default=0)
+
+
+async def amap(op, values, operand=None, *, executor=None, batch_size=1000, offload_bits=256, max_pending=2):
+    """Apply an operation to every fraction of an asynchronous stream
+
+    Les valeurs sont regroupées en paquets de batch_size. Un paquet dont un numérateur ou un dénominateur
+    dépasse offload_bits bits est calculé dans executor ; les autres, pour lesquels l'aller-retour coûterait
+    plus que le calcul, sont calculés sur place, en rendant la main à la boucle après chaque paquet.
+    Au plus max_pending paquets sont en cours de calcul : au-delà, la lecture de l'amont est suspendue.
+
+    PRE : op est un nom de fraction_batch.OPERATIONS ou une fonction globale (picklable pour un pool de
+    processus) ; values est un itérable asynchrone de Fraction ; operand est None pour une opération
+    unaire, sinon une Fraction ou un int passé en second argument ; executor est None ou un
+    concurrent.futures.Executor ; batch_size >= 1, max_pending >= 1
+    POST : génère dans l'ordre les objets de type Fraction op(v) ou op(v, operand)
+    RAISES : ValueError si op est inconnue, ainsi que toute exception levée par op
+    """
+    func = _resolve(op)
+    loop = asyncio.get_running_loop()
+    extra = () if operand is None else (_pack(operand),)
+    args = () if operand is None else (operand,)
+    pending = collections.deque()
+
+    async def submit(batch):
+        if executor is not None and _bits(batch) >= offload_bits:
+            items = [(_pack(value),) + extra for value in batch]
+            pending.append(loop.run_in_executor(executor, _map_chunk, op, items))
+        else:
+            pending.append([func(value, *args) for value in batch])
+            await asyncio.sleep(0)
+
+    async def results():
+        done = pending.popleft()
+        if isinstance(done, list):
+            return done
+        return list(map(_unpack, await done))
+
+    try:
+        batch = []
+        async for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                await submit(batch)
+                batch = []
+                while len(pending) >= max_pending:
+                    for result in await results():
+                        yield result
+        if batch:
+            await submit(batch)
+        while pending:
+            for result in await results():
+                yield result
+    finally:
+        for future in pending:
+            if not isinstance(future, list):
+                future.cancel()
+
+
+async def aggregate(values, op='add'):
+    """Reduce an asynchronous stream of fractions to a single value
+
+    PRE : op est 'add', 'mul' ou une fonction associative sur des Fraction,
+    values est un itérable asynchrone de Fraction
+    POST : renvoie l'objet de type Fraction égal à la réduction de values par op,
+    0 pour 'add' et 1 pour 'mul' si values est vide
+    RAISES : ValueError si op est inconnue, ou si values est vide et que op n'est ni 'add' ni 'mul'
+    """
+    func = _resolve(op)
+    if func is operator.add:
+        accumulator = FractionAccumulator()
+        async for value in values:
+            accumulator.add(value)
+        return accumulator.value()
+    result = _END
+    async for value in values:
+        result = value if result is _END else func(result, value)
+    return _reduce_values(func, ()) if result is _END else result
+
+
+async def aformat(values, mixed=False):
+    """Format the fractions of an asynchronous stream one per line
+
+    PRE : values est un itérable asynchrone de Fraction
+    POST : génère pour chaque fraction une string terminée par '\\n', produite par as_mixed_number
+    si mixed est vrai, sinon par __str__
+    """
+    async for value in values:
+        yield (value.as_mixed_number() if mixed else str(value)) + '\n'
+
+
+async def buffered(values, maxsize=1024):
+    """Run an upstream stage in its own task, connected through a bounded queue
+
+    PRE : values est un itérable asynchrone, maxsize >= 1
+    POST : génère les éléments de values dans l'ordre ; l'amont prend au plus maxsize éléments d'avance
+    puis attend que l'aval consomme. Si l'aval s'arrête, la tâche de l'amont est annulée
+    RAISES : toute exception levée par l'amont, au moment où l'aval atteint l'élément fautif
+    """
+    queue = asyncio.Queue(maxsize)
+
+    async def produce():
+        try:
+            async for value in values:
+                await queue.put((None, value))
+        except Exception as error:
+            await queue.put((error, None))
+        else:
+            await queue.put((_END, None))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            error, value = await queue.get()
+            if error is _END:
+                return
+            if error is not None:
+                raise error
+            yield value
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def write_lines(lines, writer, drain_every=256, encoding='ascii'):
+    """Write an asynchronous stream of lines, honouring the writer's flow control
+
+    PRE : lines est un itérable asynchrone de str ; writer est un asyncio.StreamWriter ou un objet
+    ayant une méthode write(bytes) et, facultativement, une coroutine drain()
+    POST : écrit chaque ligne encodée dans writer, attend writer.drain() toutes les drain_every lignes
+    et à la fin, puis renvoie le nombre de lignes écrites
+    """
+    drain = getattr(writer, 'drain', None)
+    count = 0
+    async for line in lines:
+        writer.write(line.encode(encoding))
+        count += 1
+        if drain is not None and not count % drain_every:
+            await drain()
+    if drain is not None:
+        await drain()
+    return count
+
+
+async def run_pipeline(reader, writer, op=None, operand=None, *, mixed=False, executor=None, batch_size=1000,
+                       maxsize=1024):
+    """Connect parse, map and format stages from a reader to a writer
+
+    PRE : reader est un itérable asynchrone de lignes, writer est accepté par write_lines, op et operand
+    sont acceptés par amap (op=None : les fractions sont recopiées telles quelles), executor est None ou
+    un concurrent.futures.Executor
+    POST : écrit dans writer une ligne par fraction lue, transformée par op, et renvoie le nombre de
+    lignes écrites
+    RAISES : les exceptions des étapes (ValueError, ZeroDivisionError, ...)
+    """
+    values = buffered(aparse(reader), maxsize)
+    if op is not None:
+        values = buffered(amap(op, values, operand, executor=executor, batch_size=batch_size), maxsize)
+    return await write_lines(aformat(values, mixed), writer)
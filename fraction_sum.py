@@ -0,0 +1,129 @@
+import math
+
+from fraction_impl import Fraction, _rational_pair
+
+_lcm = math.lcm
+
+
+class FractionAccumulator:
+    """Exact running sum of a stream of fractions
+
+    Les termes ne sont pas additionnés un par un : les numérateurs sont cumulés par dénominateur, sans
+    pgcd ni nouvelle Fraction. Quand le nombre de dénominateurs distincts dépasse max_groups, les groupes
+    sont ramenés à leur ppcm, réduits une seule fois et ajoutés au total courant. Pour des dénominateurs
+    peu variés (monnaie, pourcentages) le coût d'un terme est donc une addition d'entiers.
+    """
+
+    def __init__(self, start=0, max_groups=256):
+        """Build an accumulator
+
+        PRE : start est une Fraction, un int ou un nombre rationnel, max_groups est un entier >= 1
+        POST : crée un accumulateur dont la valeur initiale est start
+        RAISES : TypeError si start n'est pas un nombre rationnel exact
+        """
+        pair = _rational_pair(start)
+        if pair is None:
+            raise TypeError('seuls les nombres rationnels exacts peuvent être additionnés')
+        self.max_groups = max_groups
+        self.count = 0
+        self._total = Fraction(pair[0], pair[1])
+        self._groups = {}
+
+    def add(self, value):
+        """Add one term to the sum
+
+        PRE : value est une Fraction, un int ou un nombre rationnel
+        POST : la valeur de l'accumulateur est augmentée de value
+        RAISES : TypeError si value n'est pas un nombre rationnel exact
+        """
+        pair = _rational_pair(value)
+        if pair is None:
+            raise TypeError('seuls les nombres rationnels exacts peuvent être additionnés')
+        self._add_pair(pair[0], pair[1])
+
+    def add_product(self, left, right):
+        """Add the product of two terms to the sum, without reducing the product
+
+        PRE : left et right sont des Fraction, des int ou des nombres rationnels
+        POST : la valeur de l'accumulateur est augmentée de left * right
+        RAISES : TypeError si left ou right n'est pas un nombre rationnel exact
+        """
+        left_pair, right_pair = _rational_pair(left), _rational_pair(right)
+        if left_pair is None or right_pair is None:
+            raise TypeError('seuls les nombres rationnels exacts peuvent être multipliés')
+        self._add_pair(left_pair[0] * right_pair[0], left_pair[1] * right_pair[1])
+
+    def update(self, values):
+        """Add every term of an iterable, consumed lazily
+
+        PRE : values est un itérable de Fraction, d'int ou de nombres rationnels
+        POST : la valeur de l'accumulateur est augmentée de la somme des termes de values
+        RAISES : TypeError si un terme n'est pas un nombre rationnel exact
+        """
+        for value in values:
+            self.add(value)
+
+    def _add_pair(self, num, den):
+        groups = self._groups
+        groups[den] = groups.get(den, 0) + num
+        self.count += 1
+        if len(groups) > self.max_groups:
+            self._flush()
+
+    def _flush(self):
+        """Fold the per-denominator groups into the running total with a single reduction"""
+        if not self._groups:
+            return
+        common = _lcm(*self._groups)
+        num = sum(n * (common // d) for d, n in self._groups.items())
+        self._groups.clear()
+        self._total = self._total + Fraction(num, common)
+
+    def value(self):
+        """Return the exact sum of all the terms added so far
+
+        PRE : -
+        POST : renvoie un objet de type Fraction égal à la somme des termes
+        """
+        self._flush()
+        return self._total
+
+
+def fsum(values):
+    """Return the exact sum of an iterable of fractions
+
+    PRE : values est un itérable de Fraction, d'int ou de nombres rationnels
+    POST : renvoie un objet de type Fraction égal à la somme des termes, 0 si values est vide
+    RAISES : TypeError si un terme n'est pas un nombre rationnel exact
+    """
+    accumulator = FractionAccumulator()
+    accumulator.update(values)
+    return accumulator.value()
+
+
+def fdot(left, right):
+    """Return the exact dot product of two iterables of fractions
+
+    PRE : left et right sont des itérables de même longueur de Fraction, d'int ou de nombres rationnels
+    POST : renvoie un objet de type Fraction égal à la somme des produits terme à terme
+    RAISES : ValueError si les itérables n'ont pas la même longueur,
+    TypeError si un terme n'est pas un nombre rationnel exact
+    """
+    accumulator = FractionAccumulator()
+    for x, y in zip(left, right, strict=True):
+        accumulator.add_product(x, y)
+    return accumulator.value()
+
+
+def fmean(values):
+    """Return the exact arithmetic mean of an iterable of fractions
+
+    PRE : values est un itérable de Fraction, d'int ou de nombres rationnels
+    POST : renvoie un objet de type Fraction égal à la moyenne des termes
+    RAISES : ValueError si values est vide, TypeError si un terme n'est pas un nombre rationnel exact
+    """
+    accumulator = FractionAccumulator()
+    accumulator.update(values)
+    if not accumulator.count:
+        raise ValueError('la moyenne d\'une séquence vide n\'est pas définie')
+    return accumulator.value() / accumulator.count
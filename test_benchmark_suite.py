@@ -0,0 +1,44 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from benchmarks.suite import compare, main
+
+
+def results(**timings):
+    return {'results': {key.replace('__', '/'): {'fraction_impl': ns, 'fractions': 100.0}
+                        for key, ns in timings.items()}}
+
+
+class BenchmarkSuiteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.before = results(small__add=100.0, small__mul=200.0, small__eq=50.0, small__pow=80.0)
+        self.after = results(small__add=125.0, small__mul=210.0, small__eq=40.0, small__str=300.0)
+
+    def test_compare(self):
+        self.assertEqual(compare(self.before, self.after), [('small/add', 100.0, 125.0, 1.25)])
+        self.assertEqual(compare(self.before, self.after, threshold=0.30), [])
+        self.assertEqual([key for key, *_ in compare(self.before, self.after, threshold=0.0)],
+                         ['small/add', 'small/mul'])
+        self.assertEqual(compare(self.after, self.after), [])
+
+    def test_main_exit_code(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, data in (('before', self.before), ('after', self.after)):
+                paths.append(os.path.join(directory, f'{name}.json'))
+                with open(paths[-1], 'w') as file:
+                    json.dump(data, file)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main(['compare', *paths]), 1)
+                self.assertEqual(main(['compare', *paths, '--threshold', '0.5']), 0)
+                self.assertEqual(main(['compare', paths[0], paths[0]]), 0)
+        self.assertIn('REGRESSION small/add', output.getvalue())
+        self.assertNotIn('small/str', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
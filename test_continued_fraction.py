@@ -0,0 +1,33 @@
+import itertools
+import math
+import unittest
+from fraction_impl import Fraction
+from continued_fraction import approximate_many, convergents, from_continued_fraction
+
+
+class ContinuedFractionTestCase(unittest.TestCase):
+    def test_convergents(self):
+        self.assertEqual([str(f) for f in convergents([4, 2, 6, 7])], ['4', '9/2', '58/13', '415/93'])
+        self.assertEqual([str(f) for f in convergents([-3, 1, 2])], ['-3', '-2', '-7/3'])
+        golden = convergents(itertools.repeat(1))
+        self.assertEqual([str(f) for f in itertools.islice(golden, 6)], ['1', '2', '3/2', '5/3', '8/5', '13/8'])
+        with self.assertRaises(ValueError):
+            list(convergents([1, 0]))
+        with self.assertRaises(TypeError):
+            list(convergents([1, 2.5]))
+
+    def test_from_continued_fraction(self):
+        for fraction in (Fraction(num=415, den=93), Fraction(num=-7, den=3), Fraction(num=10 ** 30 + 7, den=3 ** 40)):
+            self.assertEqual(from_continued_fraction(fraction.to_continued_fraction()), fraction)
+        with self.assertRaises(ValueError):
+            from_continued_fraction([])
+
+    def test_approximate_many(self):
+        result = approximate_many([math.pi, 0.333333, -2.75, 3, Fraction(num=22, den=7)], max_denominator=100)
+        self.assertEqual([str(f) for f in result], ['311/99', '1/3', '-11/4', '3', '22/7'])
+        with self.assertRaises(TypeError):
+            approximate_many(['0.5'])
+
+
+if __name__ == '__main__':
+    unittest.main()
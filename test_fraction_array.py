@@ -0,0 +1,114 @@
+import unittest
+from fraction_impl import Fraction
+from fraction_array import FractionArray, np
+
+
+class FractionArrayTestCase(unittest.TestCase):
+    use_numpy = False
+
+    def make(self, nums, dens=None):
+        return FractionArray(nums, dens, use_numpy=self.use_numpy)
+
+    def test_init(self):
+        array = self.make([6, -15, 0, 7], [8, 6, -8, -3])
+        self.assertEqual(array.numerators, [3, -5, 0, -7])
+        self.assertEqual(array.denominators, [4, 2, 1, 3])
+        self.assertEqual(self.make([4, 5]).denominators, [1, 1])
+        with self.assertRaises(ZeroDivisionError):
+            self.make([1, 2], [3, 0])
+        with self.assertRaises(TypeError):
+            self.make([0.5], [2])
+        with self.assertRaises(ValueError):
+            self.make([1, 2], [3])
+
+    def test_conversions(self):
+        fractions = [Fraction(num=5, den=6), Fraction(num=-4, den=7), Fraction(num=3)]
+        array = FractionArray.from_fractions(fractions, use_numpy=self.use_numpy)
+        self.assertEqual(array.to_fractions(), fractions)
+        self.assertEqual(list(array), fractions)
+        self.assertEqual(array[1], Fraction(num=-4, den=7))
+        self.assertEqual(array[1:].to_fractions(), fractions[1:])
+        self.assertEqual(len(array), 3)
+        self.assertEqual(str(array), '[5/6, -4/7, 3]')
+
+    def test_arithmetic(self):
+        a = self.make([5, 7, 0], [6, -8, 42])
+        b = self.make([4, -4, 13], [7, -7, 25])
+        self.assertEqual([str(f) for f in a + b], ['59/42', '-17/56', '13/25'])
+        self.assertEqual([str(f) for f in a - b], ['11/42', '-81/56', '-13/25'])
+        self.assertEqual([str(f) for f in a * b], ['10/21', '-1/2', '0'])
+        self.assertEqual([str(f) for f in a / b], ['35/24', '-49/32', '0'])
+        self.assertEqual([str(f) for f in a * Fraction(num=2, den=3)], ['5/9', '-7/12', '0'])
+        self.assertEqual([str(f) for f in a + 1], ['11/6', '1/8', '1'])
+        self.assertEqual([str(f) for f in 1 + a], ['11/6', '1/8', '1'])
+        self.assertEqual([str(f) for f in 1 - a], ['1/6', '15/8', '1'])
+        self.assertEqual([str(f) for f in 3 * a], ['5/2', '-21/8', '0'])
+        self.assertEqual([str(f) for f in Fraction(num=1, den=2) + a], ['4/3', '-3/8', '1/2'])
+        self.assertEqual([str(f) for f in Fraction(num=1, den=2) / b], ['7/8', '7/8', '25/26'])
+        with self.assertRaises(ZeroDivisionError):
+            1 / a
+        with self.assertRaises(TypeError):
+            '1' - a
+        with self.assertRaises(ZeroDivisionError):
+            a / self.make([1, 0, 1])
+        with self.assertRaises(ValueError):
+            a + self.make([1])
+
+    def test_overflow_fallback(self):
+        big = self.make([2 ** 40, 3], [3, 2 ** 40])
+        product = big * big
+        self.assertEqual(product.numerators, [2 ** 80, 9])
+        self.assertEqual(product.denominators, [9, 2 ** 80])
+        self.assertEqual(product.backend, 'python')
+
+    def test_comparisons(self):
+        a = self.make([1, 2, -3], [2, 3, 4])
+        b = self.make([2, 1, -1], [4, 2, 2])
+        self.assertEqual(list(a == b), [True, False, False])
+        self.assertEqual(list(a < b), [False, False, True])
+        self.assertEqual(list(a >= b), [True, True, False])
+        self.assertEqual(list(a != Fraction(num=1, den=2)), [False, True, True])
+
+    def test_predicates(self):
+        a = self.make([0, 1, -5, 6, 1], [3, 1, 4, 1, 7])
+        self.assertEqual(list(a.is_zero()), [True, False, False, False, False])
+        self.assertEqual(list(a.is_integer()), [True, True, False, True, False])
+        self.assertEqual(list(a.is_proper()), [True, False, False, False, True])
+        self.assertEqual(list(a.is_unit()), [False, True, False, False, True])
+        b = self.make([1, 1, -1, 6, 1], [4, 2, 1, 1, 8])
+        self.assertEqual(list(a.is_adjacent_to(b)), [True, True, True, False, True])
+        self.assertEqual(list(a.is_adjacent_to(1)), [True, False, False, False, False])
+        fractions = a.to_fractions()
+        self.assertEqual(list(a.is_adjacent_to(Fraction(num=1, den=3))),
+                         [f.is_adjacent_to(Fraction(num=1, den=3)) for f in fractions])
+        with self.assertRaises(TypeError):
+            a.is_adjacent_to(0.5)
+
+    def test_reductions(self):
+        a = self.make([1, 1, 1], [2, 3, 6])
+        self.assertEqual(a.sum(), Fraction(num=1))
+        self.assertEqual(a.prod(), Fraction(num=1, den=36))
+        self.assertEqual(self.make([]).sum(), Fraction(num=0))
+        self.assertEqual(self.make([]).prod(), Fraction(num=1))
+
+
+@unittest.skipIf(np is None, 'NumPy non installé')
+class FractionArrayNumpyTestCase(FractionArrayTestCase):
+    use_numpy = None
+
+    def test_backend(self):
+        self.assertEqual(self.make([1, 2], [3, 4]).backend, 'numpy')
+        self.assertEqual(self.make([2 ** 70], [3]).backend, 'python')
+
+    def test_zero_operand_overflow(self):
+        zeros = self.make([0, 0])
+        self.assertEqual(zeros.backend, 'numpy')
+        self.assertEqual([str(f) for f in zeros * Fraction(num=2 ** 70)], ['0', '0'])
+        self.assertEqual([str(f) for f in zeros / Fraction(num=1, den=2 ** 70)], ['0', '0'])
+        self.assertEqual([str(f) for f in zeros * self.make([2 ** 70, 1])], ['0', '0'])
+        self.assertEqual(list(zeros < Fraction(num=1, den=2 ** 70)), [True, True])
+        self.assertEqual(list(zeros.is_adjacent_to(Fraction(num=1, den=2 ** 70))), [True, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
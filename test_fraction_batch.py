@@ -0,0 +1,54 @@
+import operator
+import unittest
+from fraction_impl import Fraction
+from fraction_batch import FractionBatchExecutor
+
+
+def square(value):
+    return value * value
+
+
+class FractionBatchTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = FractionBatchExecutor(workers=2, chunk_size=7)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def test_map(self):
+        left = [Fraction(num=n, den=n + 1) for n in range(1, 50)]
+        right = [Fraction(num=n + 2, den=3) for n in range(1, 50)]
+        self.assertEqual(list(self.executor.map('add', left, right)), [a + b for a, b in zip(left, right)])
+        self.assertEqual(list(self.executor.map(operator.truediv, iter(left), iter(right))),
+                         [a / b for a, b in zip(left, right)])
+        self.assertEqual(list(self.executor.map(square, left)), [a * a for a in left])
+        with self.assertRaises(ValueError):
+            list(self.executor.map('modulo', left, right))
+        with self.assertRaises(ZeroDivisionError):
+            list(self.executor.map('truediv', left, [Fraction()] * len(left)))
+
+    def test_reduce(self):
+        values = [Fraction(num=1, den=n * (n + 1)) for n in range(1, 100)]
+        self.assertEqual(self.executor.reduce('add', values).__str__(), '99/100')
+        self.assertEqual(self.executor.reduce('mul', (Fraction(num=n, den=n + 1) for n in range(1, 40))).__str__(),
+                         '1/40')
+        self.assertEqual(self.executor.reduce('add', []).__str__(), '0')
+        self.assertEqual(self.executor.reduce('mul', []).__str__(), '1')
+        with self.assertRaises(ValueError):
+            self.executor.reduce(operator.sub, [])
+
+    def test_reduce_each(self):
+        ledgers = [[Fraction(num=k, den=100) for k in range(n)] + [Fraction(num=1)] for n in range(20)]
+        self.assertEqual(list(self.executor.reduce_each('add', ledgers)), [sum(ledger) for ledger in ledgers])
+        self.assertEqual([str(f) for f in self.executor.reduce_each('mul', [[Fraction(num=1, den=2)], []])],
+                         ['1/2', '1'])
+
+    def test_chunk_size(self):
+        with self.assertRaises(ValueError):
+            FractionBatchExecutor(chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import threading
+import unittest
+from fraction_impl import Fraction
+from fraction_cache import FractionCache
+
+
+class FractionCacheTestCase(unittest.TestCase):
+    def test_interning(self):
+        cache = FractionCache()
+        half = cache(1, 2)
+        self.assertEqual(half, Fraction(num=1, den=2))
+        self.assertIs(cache(1, 2), half)
+        self.assertIs(cache(2, 4), half)
+        self.assertIs(cache(-3, -6), half)
+        self.assertEqual(cache(5).__str__(), '5')
+        with self.assertRaises(ZeroDivisionError):
+            cache(1, 0)
+        with self.assertRaises(TypeError):
+            cache(0.5, 2)
+
+    def test_info(self):
+        cache = FractionCache(maxsize=10)
+        cache(1, 2)
+        cache(1, 2)
+        cache(2, 4)
+        info = cache.info()
+        self.assertEqual(tuple(info), (2, 1, 1, 10))
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 0, 10))
+
+    def test_reduced_key(self):
+        cache = FractionCache(maxsize=4)
+        values = [cache(1, 3), cache(1, 4), cache(1, 5)]
+        for num, den in ((1, 2), (2, 4), (-3, -6), (50, 100), (7, 14)):
+            cache(num, den)
+        self.assertEqual(tuple(cache.info()), (4, 4, 4, 4))
+        self.assertEqual([cache(1, n) for n in (3, 4, 5)], values)
+        self.assertIs(cache(2, 6), values[0])
+        self.assertEqual(cache.info().misses, 4)
+
+    def test_lru_eviction(self):
+        cache = FractionCache(maxsize=2)
+        first = cache(1, 3)
+        cache(1, 4)
+        cache(1, 3)
+        cache(1, 5)
+        self.assertEqual(cache.info().size, 2)
+        self.assertIs(cache(1, 3), first)
+        self.assertEqual(cache.info().hits, 2)
+        cache(1, 4)
+        self.assertEqual(cache.info().misses, 4)
+        self.assertEqual(FractionCache(maxsize=0)(1, 3).__str__(), '1/3')
+        with self.assertRaises(ValueError):
+            FractionCache(maxsize=-1)
+
+    def test_threads(self):
+        cache = FractionCache(maxsize=200)
+        results = []
+
+        def work():
+            results.append([cache(i % 100, 100) for i in range(2000)])
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for values in results:
+            self.assertEqual(values, [Fraction(num=i % 100, den=100) for i in range(2000)])
+        info = cache.info()
+        self.assertGreater(info.hits, info.misses)
+        self.assertLessEqual(info.size, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
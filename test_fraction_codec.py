@@ -0,0 +1,59 @@
+import mmap
+import tempfile
+import unittest
+from fraction_impl import Fraction
+from fraction_codec import FractionColumn, decode, encode, encode_many, iter_decode, pack_column
+
+
+class FractionCodecTestCase(unittest.TestCase):
+    values = [Fraction(), Fraction(num=-1, den=2), Fraction(num=63, den=64), Fraction(num=-5000, den=3),
+              Fraction(num=2 ** 62, den=2 ** 63 - 1)]
+    big = Fraction(num=-(10 ** 40) - 1, den=10 ** 30)
+
+    def test_record(self):
+        self.assertEqual(encode(Fraction()), b'\x00\x00')
+        self.assertEqual(encode(Fraction(num=-1, den=2)), b'\x02\x02')
+        self.assertEqual(len(encode(Fraction(num=63, den=64))), 3)
+        for fraction in self.values + [self.big]:
+            self.assertEqual(decode(encode(fraction)), fraction)
+        with self.assertRaises(ValueError):
+            decode(encode(self.big)[:-1])
+        with self.assertRaises(ValueError):
+            decode(encode(Fraction()) * 2)
+
+    def test_stream(self):
+        data = encode_many(self.values + [self.big])
+        self.assertEqual(list(iter_decode(data)), self.values + [self.big])
+        self.assertEqual(list(iter_decode(memoryview(data))), self.values + [self.big])
+        self.assertEqual(list(iter_decode(b'')), [])
+
+    def test_column(self):
+        data = pack_column(self.values)
+        self.assertEqual(data[:5], b'FRCL\x08')
+        column = FractionColumn(data)
+        self.assertEqual(len(column), len(self.values))
+        self.assertEqual(list(column), self.values)
+        self.assertEqual(column[-1], self.values[-1])
+        small = pack_column([Fraction(num=-1, den=2), Fraction(num=3, den=4)])
+        self.assertEqual(len(small), 16 + 4)
+        self.assertEqual(list(FractionColumn(small)), [Fraction(num=-1, den=2), Fraction(num=3, den=4)])
+        self.assertEqual(list(FractionColumn(pack_column([]))), [])
+        with self.assertRaises(OverflowError):
+            pack_column([self.big])
+        with self.assertRaises(ValueError):
+            FractionColumn(data[:-1])
+        with self.assertRaises(ValueError):
+            FractionColumn(b'XXXX' + data[4:])
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(pack_column(self.values))
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                column = FractionColumn(buffer)
+                self.assertEqual(list(column), self.values)
+                del column
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from fraction_impl import Fraction
+from fraction_expr import lazy
+
+
+class FractionExprTestCase(unittest.TestCase):
+    def test_evaluate(self):
+        x = lazy(Fraction(num=1, den=2))
+        y = lazy(Fraction(num=1, den=3))
+        self.assertEqual((x + y).evaluate().__str__(), '5/6')
+        self.assertEqual((x - y).evaluate().__str__(), '1/6')
+        self.assertEqual((x * y).evaluate().__str__(), '1/6')
+        self.assertEqual((x / y).evaluate().__str__(), '3/2')
+        self.assertEqual((x ** 3).evaluate().__str__(), '1/8')
+        self.assertEqual((x ** -2).evaluate().__str__(), '4')
+        self.assertEqual((1 - x * 4 + Fraction(num=1, den=6)).evaluate().__str__(), '-5/6')
+        self.assertEqual((2 / (x - y)).evaluate().__str__(), '12')
+        with self.assertRaises(TypeError):
+            x ** Fraction(num=1, den=2)
+        with self.assertRaises(TypeError):
+            lazy(0.5)
+
+    def test_common_subexpressions(self):
+        x, y = lazy(1), lazy(2)
+        self.assertIs(x + y, x + y)
+        self.assertIs((x + y) * 3, (x + y) * 3)
+        self.assertIsNot(x + y, y + x)
+
+    def test_incremental(self):
+        x, y, z = lazy(Fraction(num=1, den=2)), lazy(3), lazy(Fraction(num=2, den=5))
+        left = x * y
+        expression = left + z
+        self.assertEqual(expression.evaluate().__str__(), '19/10')
+        cached = left._pair
+        z.set(Fraction(num=-3, den=2))
+        self.assertIs(left._pair, cached)
+        self.assertEqual(expression.evaluate().__str__(), '0')
+        x.set(1)
+        self.assertIsNone(left._pair)
+        self.assertEqual(expression.evaluate().__str__(), '3/2')
+
+    def test_shared_constants(self):
+        x, y = lazy(Fraction(num=1, den=2)), lazy(Fraction(num=10))
+        expression = x + 2
+        self.assertFalse(hasattr(expression, 'right'))
+        with self.assertRaises(AttributeError):
+            expression._right.set(5)
+        self.assertEqual((y + 2).evaluate().__str__(), '12')
+        self.assertEqual(expression.evaluate().__str__(), '5/2')
+
+    def test_negative_and_zero(self):
+        x = lazy(Fraction(num=-2, den=3))
+        self.assertEqual((x ** -3).evaluate().__str__(), '-27/8')
+        self.assertEqual((1 / x).evaluate().__str__(), '-3/2')
+        zero = lazy(0)
+        with self.assertRaises(ZeroDivisionError):
+            (x / zero).evaluate()
+        with self.assertRaises(ZeroDivisionError):
+            (zero ** -1).evaluate()
+
+    def test_long_chain(self):
+        product = lazy(1)
+        for n in range(1, 3000):
+            product = product * Fraction(num=n, den=n + 1)
+        self.assertEqual(product.evaluate().__str__(), '1/3000')
+
+
+if __name__ == '__main__':
+    unittest.main()
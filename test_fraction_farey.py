@@ -0,0 +1,105 @@
+import random
+import unittest
+from fraction_impl import Fraction
+from fraction_farey import FareyIndex, farey, is_unimodular, simplest_between
+
+
+def brute_simplest(low, high):
+    den = 1
+    while True:
+        num = -(-low.numerator * den // low.denominator)
+        candidates = [n for n in (num, num + 1) if low <= Fraction(n, den) <= high]
+        if candidates:
+            return Fraction(min(candidates, key=abs), den)
+        den += 1
+
+
+class FareyTestCase(unittest.TestCase):
+    def test_farey(self):
+        self.assertEqual([f.__str__() for f in farey(5)],
+                         ['0', '1/5', '1/4', '1/3', '2/5', '1/2', '3/5', '2/3', '3/4', '4/5', '1'])
+        self.assertEqual([f.__str__() for f in farey(1)], ['0', '1'])
+        terms = list(farey(40))
+        self.assertEqual(terms, sorted({Fraction(n, d) for d in range(1, 41) for n in range(d + 1)}))
+        self.assertTrue(all(is_unimodular(a, b) for a, b in zip(terms, terms[1:])))
+        with self.assertRaises(ValueError):
+            next(farey(0))
+
+    def test_simplest_between(self):
+        self.assertEqual(simplest_between(Fraction(3, 10), Fraction(2, 5)).__str__(), '1/3')
+        self.assertEqual(simplest_between(Fraction(2, 5), Fraction(3, 10)).__str__(), '1/3')
+        self.assertEqual(simplest_between(Fraction(-7, 3), Fraction(5, 2)).__str__(), '0')
+        self.assertEqual(simplest_between(Fraction(-2, 5), Fraction(-3, 10)).__str__(), '-1/3')
+        self.assertEqual(simplest_between(Fraction(7, 5), Fraction(7, 5)).__str__(), '7/5')
+        self.assertEqual(simplest_between(Fraction(3, 2), 4).__str__(), '2')
+        self.assertEqual(simplest_between(Fraction(314159, 100000), Fraction(314160, 100000)).__str__(), '355/113')
+        self.assertEqual(simplest_between(Fraction(314, 100), Fraction(315, 100)).__str__(), '22/7')
+        rng = random.Random(2020)
+        for _ in range(300):
+            a, b = sorted((Fraction(rng.randint(1, 200), rng.randint(1, 60)) for _ in range(2)))
+            self.assertEqual(simplest_between(a, b), brute_simplest(a, b))
+        with self.assertRaises(TypeError):
+            simplest_between(0.5, 1)
+
+
+class FareyIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.values = sorted({Fraction(rng.randint(-500, 500), rng.randint(1, 60)) for _ in range(3000)})
+        self.index = FareyIndex(reversed(self.values))
+
+    def test_build(self):
+        self.assertEqual(list(self.index), self.values)
+        self.assertEqual(len(self.index), len(self.values))
+        self.assertEqual(list(FareyIndex.from_sorted(self.values)), self.values)
+        with self.assertRaises(ValueError):
+            FareyIndex.from_sorted([Fraction(1), Fraction(1)])
+        self.assertIn(self.values[10], self.index)
+        self.assertEqual(len(FareyIndex()), 0)
+
+    def test_insert(self):
+        index = FareyIndex()
+        rng = random.Random(3)
+        expected = set()
+        for _ in range(3000):
+            value = Fraction(rng.randint(-99, 99), rng.randint(1, 99))
+            self.assertEqual(index.insert(value), value not in expected)
+            expected.add(value)
+        self.assertEqual(list(index), sorted(expected))
+        self.assertEqual(len(index), len(expected))
+
+    def test_neighbours(self):
+        index, values = self.index, self.values
+        for probe in (Fraction(1, 7), values[100], Fraction(-10 ** 6), Fraction(10 ** 6), values[0], values[-1]):
+            below = [v for v in values if v < probe]
+            above = [v for v in values if v > probe]
+            self.assertEqual(index.predecessor(probe), below[-1] if below else None)
+            self.assertEqual(index.successor(probe), above[0] if above else None)
+            closest = min(values, key=lambda v: (abs(v - probe), v))
+            self.assertEqual(index.nearest(probe), closest)
+        self.assertIsNone(FareyIndex().nearest(Fraction(1)))
+
+    def test_range(self):
+        low, high = Fraction(-3, 2), Fraction(17, 4)
+        expected = [v for v in self.values if low <= v <= high]
+        self.assertEqual(list(self.index.range(low, high)), expected)
+        self.assertEqual(list(self.index._range_reversed(low, high)), expected[::-1])
+        self.assertEqual(list(self.index.range(Fraction(10 ** 6), Fraction(10 ** 7))), [])
+
+    def test_adjacent_to(self):
+        for probe in (Fraction(1, 3), Fraction(2), Fraction(-7, 5), self.values[500], Fraction(0)):
+            expected = [v for v in self.values if is_unimodular(probe, v)]
+            self.assertEqual(self.index.adjacent_to(probe), expected)
+            self.assertTrue(all(probe.is_adjacent_to(v) for v in expected))
+        index = FareyIndex.from_sorted(list(farey(200)))
+        expected = [v for v in index if is_unimodular(Fraction(1, 2), v)]
+        self.assertEqual(index.adjacent_to(Fraction(1, 2)), expected)
+
+    def test_adjacent_pairs(self):
+        pairs = list(self.index.adjacent_pairs())
+        self.assertEqual(pairs, [(a, b) for a, b in zip(self.values, self.values[1:]) if is_unimodular(a, b)])
+        self.assertEqual(len(list(FareyIndex.from_sorted(farey(30)).adjacent_pairs())), len(list(farey(30))) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import decimal
+import fractions
+import random
+import unittest
+from fraction_impl import Fraction
+from fraction_fixed import FixedDomain, FixedValue
+
+
+class FixedDomainTestCase(unittest.TestCase):
+    def test_conversion(self):
+        cents = FixedDomain(100)
+        value = cents(Fraction(num=-7, den=4))
+        self.assertIsInstance(value, FixedValue)
+        self.assertEqual(value.units, -175)
+        self.assertEqual(value.to_fraction().__str__(), '-7/4')
+        self.assertEqual(cents(3).units, 300)
+        self.assertEqual(cents(fractions.Fraction(1, 20)).units, 5)
+        self.assertEqual(cents(value), value)
+        promoted = cents(Fraction(num=1, den=3))
+        self.assertIsInstance(promoted, Fraction)
+        self.assertEqual(promoted.__str__(), '1/3')
+        rng = random.Random(2020)
+        for _ in range(200):
+            fraction = Fraction(rng.randint(-10 ** 6, 10 ** 6), rng.choice((1, 2, 4, 5, 20, 25, 50, 100)))
+            self.assertEqual(cents(fraction).to_fraction(), fraction)
+        with self.assertRaises(TypeError):
+            cents(0.5)
+        with self.assertRaises(ValueError):
+            FixedDomain(0)
+        with self.assertRaises(TypeError):
+            FixedDomain(100.0)
+        with self.assertRaises(ValueError):
+            FixedDomain(100, 'ROUND_SOMETIMES')
+
+    def test_quantize(self):
+        cents = FixedDomain(100)
+        self.assertEqual(cents.quantize(Fraction(num=1, den=3)).units, 33)
+        self.assertEqual(cents.quantize(Fraction(num=-1, den=3), decimal.ROUND_FLOOR).units, -34)
+        self.assertEqual(cents.quantize(Fraction(num=1, den=200)).units, 0)
+        self.assertEqual(cents.quantize(Fraction(num=3, den=200)).units, 2)
+        self.assertEqual(cents.quantize(Fraction(num=1, den=200), decimal.ROUND_HALF_UP).units, 1)
+        self.assertEqual(FixedDomain(100, decimal.ROUND_UP).quantize(Fraction(num=1, den=1000)).units, 1)
+        self.assertEqual(cents.from_units(-12).__str__(), '-3/25')
+        with self.assertRaises(TypeError):
+            cents.from_units(1.5)
+
+    def test_sum(self):
+        cents = FixedDomain(100)
+        rng = random.Random(7)
+        values = [cents.from_units(rng.randint(-10 ** 6, 10 ** 6)) for _ in range(1000)]
+        expected = sum(value.to_fraction() for value in values)
+        self.assertEqual(cents.sum(values).to_fraction(), expected)
+        self.assertEqual(sum(values).to_fraction(), expected)
+        self.assertEqual(cents.sum([], start=2).units, 200)
+        with self.assertRaises(ValueError):
+            cents.sum([cents(1), FixedDomain(360)(1)])
+        with self.assertRaises(ValueError):
+            cents.sum(values, start=Fraction(num=1, den=3))
+
+
+class FixedValueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cents = FixedDomain(100)
+        self.a = self.cents(Fraction(num=5, den=4))
+        self.b = self.cents(Fraction(num=-3, den=10))
+
+    def test_add_sub(self):
+        a, b = self.a, self.b
+        self.assertEqual((a + b).units, 95)
+        self.assertEqual((a - b).units, 155)
+        self.assertEqual((a + 2).units, 325)
+        self.assertEqual((2 - a).units, 75)
+        self.assertEqual((-a).units, -125)
+        self.assertEqual(abs(b).units, 30)
+        self.assertIsInstance(a + b, FixedValue)
+        mixed = a + Fraction(num=1, den=3)
+        self.assertIsInstance(mixed, Fraction)
+        self.assertEqual(mixed.__str__(), '19/12')
+        self.assertEqual((Fraction(num=1, den=3) - a).__str__(), '-11/12')
+        other = FixedDomain(360)(Fraction(num=1, den=360))
+        self.assertEqual((a + other).__str__(), '451/360')
+        self.assertEqual(a + 0.5, 1.75)
+
+    def test_mul_div_exact(self):
+        a, b = self.a, self.b
+        self.assertEqual((a * 3).units, 375)
+        self.assertEqual((3 * a).units, 375)
+        self.assertEqual((a * b).__str__(), '-3/8')
+        self.assertIsInstance(a * b, Fraction)
+        product = a * self.cents(Fraction(num=1, den=5))
+        self.assertIsInstance(product, FixedValue)
+        self.assertEqual(product.units, 25)
+        self.assertEqual((a / 5).units, 25)
+        self.assertEqual((a / 3).__str__(), '5/12')
+        self.assertIsInstance(a / 3, Fraction)
+        self.assertEqual((a / b).__str__(), '-25/6')
+        self.assertEqual((a / Fraction(num=5, den=2)).units, 50)
+        self.assertEqual((1 / a).units, 80)
+        self.assertEqual(a * 0.5, 0.625)
+        with self.assertRaises(ZeroDivisionError):
+            a / 0
+        with self.assertRaises(ZeroDivisionError):
+            a / self.cents(0)
+
+    def test_mul_div_rounded(self):
+        cents = FixedDomain(100, decimal.ROUND_HALF_EVEN)
+        price, rate = cents(Fraction(num=1999, den=100)), cents(Fraction(num=7, den=100))
+        self.assertEqual((price * rate).units, 140)
+        self.assertEqual((price / 3).units, 666)
+        self.assertEqual((-price / 3).units, -666)
+        self.assertEqual((price / rate).units, 28557)
+        self.assertEqual((price * Fraction(num=1, den=3)).units, 666)
+        down = FixedDomain(100, decimal.ROUND_FLOOR)
+        self.assertEqual((down(-1) / 3).units, -34)
+        rng = random.Random(11)
+        for _ in range(200):
+            x, y = cents.from_units(rng.randint(-10 ** 5, 10 ** 5)), cents.from_units(rng.randint(1, 10 ** 5))
+            exact = x.to_fraction() * y.to_fraction()
+            self.assertEqual((x * y).units, cents.quantize(exact).units)
+            self.assertEqual((x / y).units, cents.quantize(x.to_fraction() / y.to_fraction()).units)
+
+    def test_comparisons(self):
+        a, b = self.a, self.b
+        self.assertTrue(b < a <= a)
+        self.assertTrue(a > Fraction(num=6, den=5))
+        self.assertTrue(a == Fraction(num=5, den=4))
+        self.assertTrue(Fraction(num=5, den=4) == a)
+        self.assertTrue(a == 1.25)
+        self.assertTrue(a < 2.0)
+        self.assertFalse(a == float('nan'))
+        self.assertEqual(hash(a), hash(Fraction(num=5, den=4)))
+        self.assertEqual(hash(self.cents(3)), hash(3))
+        self.assertEqual(a, FixedDomain(1000)(Fraction(num=5, den=4)))
+        self.assertFalse(self.cents(0))
+        self.assertEqual(float(b), -0.3)
+        self.assertEqual(b.__str__(), '-3/10')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,9 @@
+import copy
+import decimal
+import fractions
+import math
+import numbers
+import pickle
 import unittest
 from fraction_impl import Fraction
 
@@ -14,6 +20,8 @@ class FractionTestCase(unittest.TestCase):
             Fraction(num=5, den=4.5)
         with self.assertRaises(TypeError):
             Fraction(num=-5.3, den=4.5)
+        with self.assertRaises(TypeError):
+            Fraction(2, 4, _reduced=True)
         self.assertEqual(Fraction(num=6, den=8).numerator, 3)
         self.assertEqual(Fraction(num=6, den=8).denominator, 4)
         self.assertEqual(Fraction(num=0, den=8).numerator, 0)
@@ -21,11 +29,54 @@ class FractionTestCase(unittest.TestCase):
         self.assertEqual(Fraction(num=-15, den=6).numerator, -5)
         self.assertEqual(Fraction(num=-15, den=6).denominator, 2)
 
+    def test_init_big_numbers(self):
+        big = 2 ** 64 + 1
+        self.assertEqual(Fraction(num=big * 3, den=3).numerator, big)
+        self.assertEqual(Fraction(num=big * 3, den=3).denominator, 1)
+        self.assertEqual(Fraction(num=10 ** 30 + 1, den=-(10 ** 40)).numerator, -(10 ** 30 + 1))
+        self.assertIs(type(Fraction(num=6, den=8).numerator), int)
+
+    def test_slots(self):
+        f = Fraction(num=6, den=8)
+        self.assertFalse(hasattr(f, '__dict__'))
+        with self.assertRaises(AttributeError):
+            f.other = 1
+
+    def test_pickle(self):
+        for fraction in (Fraction(num=-15, den=6), Fraction(num=10 ** 40 + 1, den=3), Fraction()):
+            restored = pickle.loads(pickle.dumps(fraction))
+            self.assertEqual(restored, fraction)
+            self.assertIs(type(restored.numerator), int)
+        self.assertNotIn(b'_Fraction__numerator', pickle.dumps(Fraction(num=1, den=3)))
+        self.assertEqual(copy.deepcopy(Fraction(num=1, den=3)), Fraction(num=1, den=3))
+
     def test_str(self):
         self.assertEqual(Fraction(num=12, den=3).__str__(), '4')
         self.assertEqual(Fraction(num=12, den=5).__str__(), '12/5')
         self.assertEqual(Fraction(num=-12, den=15).__str__(), '-4/5')
 
+    def test_from_string(self):
+        self.assertEqual(Fraction.from_string('4').__str__(), '4')
+        self.assertEqual(Fraction.from_string('-12/15').__str__(), '-4/5')
+        self.assertEqual(Fraction.from_string(' 12 / 8 ').__str__(), '3/2')
+        self.assertEqual(Fraction.from_string('2+2/5').__str__(), '12/5')
+        self.assertEqual(Fraction.from_string('-2-2/5').__str__(), '-12/5')
+        self.assertEqual(Fraction.from_string('0.125').__str__(), '1/8')
+        self.assertEqual(Fraction.from_string('-.5').__str__(), '-1/2')
+        self.assertEqual(Fraction.from_string('1.5e-3').__str__(), '3/2000')
+        self.assertEqual(Fraction.from_string('2E3').__str__(), '2000')
+        self.assertEqual(Fraction.from_string('+3/4').__str__(), '3/4')
+        self.assertEqual(Fraction.from_string('-0').__str__(), '0')
+        self.assertEqual(Fraction.from_string('1.').__str__(), '1')
+        for text in ('', 'abc', '1/2/3', '.', 'e5', '-2+2/5', '2-2/5', '1_000', '1_0/3', '1_0.5', '\u0663/4',
+                     '3/\u0664', '\u0663', '3/-4', '3/+4', '2 +2/5', '2+ 2/5', '+-3', '- 3', '1.-5', '\u00b2'):
+            with self.assertRaises(ValueError):
+                Fraction.from_string(text)
+        with self.assertRaises(ZeroDivisionError):
+            Fraction.from_string('1/0')
+        for fraction in (Fraction(num=12, den=5), Fraction(num=12, den=-5), Fraction(num=-4, den=5)):
+            self.assertEqual(Fraction.from_string(fraction.as_mixed_number()), fraction)
+
     def test_as_mixed_number(self):
         self.assertEqual(Fraction(num=12, den=3).as_mixed_number(), '4')
         self.assertEqual(Fraction(num=12, den=5).as_mixed_number(), '2+2/5')
@@ -37,30 +88,66 @@ class FractionTestCase(unittest.TestCase):
         self.assertEqual((Fraction(num=7, den=-8) + Fraction(num=-4, den=-7)).__str__(), '-17/56')
         self.assertEqual((Fraction(num=0, den=42) + Fraction(num=13, den=25)).__str__(), '13/25')
 
+    def test_add_big_numbers(self):
+        a = Fraction(num=10 ** 20 + 1, den=2 ** 70)
+        b = Fraction(num=3, den=2 ** 68)
+        self.assertEqual((a + b).numerator, 10 ** 20 + 13)
+        self.assertEqual((a + b).denominator, 2 ** 70)
+        self.assertEqual((Fraction(num=1, den=6) + Fraction(num=1, den=3)).__str__(), '1/2')
+        self.assertEqual((Fraction(num=1, den=6) + Fraction(num=-1, den=6)).__str__(), '0')
+
     def test_sub(self):
         self.assertEqual((Fraction(num=5, den=6) - Fraction(num=4, den=7)).__str__(), '11/42')
         self.assertEqual((Fraction(num=7, den=-8) - Fraction(num=-4, den=-7)).__str__(), '-81/56')
         self.assertEqual((Fraction(num=0, den=42) - Fraction(num=13, den=25)).__str__(), '-13/25')
 
+    def test_sub_big_numbers(self):
+        a = Fraction(num=2 ** 80, den=3)
+        b = Fraction(num=1, den=3)
+        self.assertEqual((a - b).numerator, (2 ** 80 - 1) // 3)
+        self.assertEqual((a - b).denominator, 1)
+
     def test_mul(self):
         self.assertEqual((Fraction(num=5, den=6) * Fraction(num=4, den=7)).__str__(), '10/21')
         self.assertEqual((Fraction(num=7, den=-8) * Fraction(num=-4, den=-7)).__str__(), '-1/2')
         self.assertEqual((Fraction(num=0, den=42) * Fraction(num=13, den=25)).__str__(), '0')
 
+    def test_mul_cross_reduction(self):
+        product = Fraction(num=2 ** 70, den=3 ** 40) * Fraction(num=3 ** 41, den=2 ** 71)
+        self.assertEqual(product.numerator, 3)
+        self.assertEqual(product.denominator, 2)
+
     def test_truediv(self):
         self.assertEqual((Fraction(num=5, den=6) / Fraction(num=4, den=7)).__str__(), '35/24')
         self.assertEqual((Fraction(num=7, den=-8) / Fraction(num=-4, den=-7)).__str__(), '-49/32')
         self.assertEqual((Fraction(num=0, den=42) / Fraction(num=13, den=25)).__str__(), '0')
         with self.assertRaises(ZeroDivisionError):
             (Fraction(num=5, den=2) / Fraction(num=0, den=6)).__str__()
+        self.assertEqual((Fraction(num=3, den=4) / Fraction(num=-9, den=2)).__str__(), '-1/6')
 
     def test_pow(self):
-        with self.assertRaises(TypeError):
-            (Fraction(num=5, den=6) ** Fraction(num=4, den=7)).__str__()
-        with self.assertRaises(TypeError):
-            (Fraction(num=7, den=-8) ** Fraction(num=-4, den=-7)).__str__()
+        self.assertAlmostEqual(Fraction(num=5, den=6) ** Fraction(num=4, den=7), (5 / 6) ** (4 / 7))
+        self.assertAlmostEqual(Fraction(num=7, den=-8) ** Fraction(num=-4, den=-7), (7 / 8) ** (4 / 7))
+        self.assertAlmostEqual(Fraction(num=-7, den=8) ** Fraction(num=3, den=5), -(7 / 8) ** (3 / 5))
         self.assertEqual((Fraction(num=0, den=42) ** Fraction(num=13, den=25)).__str__(), '0')
         self.assertEqual((Fraction(num=5, den=6) ** Fraction(num=2, den=1)).__str__(), '25/36')
+        self.assertEqual((Fraction(num=-2, den=3) ** Fraction(num=3, den=1)).__str__(), '-8/27')
+        self.assertEqual((Fraction(num=2, den=3) ** Fraction(num=-3, den=1)).__str__(), '27/8')
+        self.assertEqual((Fraction(num=-2, den=3) ** Fraction(num=-3, den=1)).__str__(), '-27/8')
+        self.assertEqual((Fraction(num=-2, den=3) ** Fraction(num=-2, den=1)).__str__(), '9/4')
+        self.assertEqual((Fraction(num=5, den=6) ** Fraction(num=0, den=1)).__str__(), '1')
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(num=0, den=5) ** Fraction(num=-1, den=1)
+
+    def test_pow_exact_roots(self):
+        self.assertEqual((Fraction(num=4, den=9) ** Fraction(num=1, den=2)).__str__(), '2/3')
+        self.assertEqual((Fraction(num=8, den=27) ** Fraction(num=-2, den=3)).__str__(), '9/4')
+        self.assertEqual((Fraction(num=-8, den=27) ** Fraction(num=1, den=3)).__str__(), '-2/3')
+        self.assertEqual((Fraction(num=-8, den=27) ** Fraction(num=2, den=3)).__str__(), '4/9')
+        big = Fraction(num=3 ** 500, den=7 ** 250)
+        self.assertEqual(big ** Fraction(num=1, den=250), Fraction(num=9, den=7))
+        with self.assertRaises(ValueError):
+            Fraction(num=-1, den=4) ** Fraction(num=1, den=2)
 
     def test_eq(self):
         self.assertTrue(Fraction(num=4, den=5) == Fraction(num=24, den=30))
@@ -68,12 +155,200 @@ class FractionTestCase(unittest.TestCase):
         self.assertTrue(Fraction(num=-4, den=5) == Fraction(num=4, den=-5))
         self.assertFalse(Fraction(num=-4, den=5) == Fraction(num=-4, den=-5))
 
+    def test_eq_mixed_types(self):
+        self.assertTrue(Fraction(num=8, den=4) == 2)
+        self.assertTrue(2 == Fraction(num=8, den=4))
+        self.assertTrue(Fraction(num=1, den=4) == 0.25)
+        self.assertTrue(Fraction(num=1, den=3) == fractions.Fraction(1, 3))
+        self.assertFalse(Fraction(num=1, den=3) == float('nan'))
+        self.assertFalse(Fraction(num=1, den=3) == '1/3')
+
+    def test_hash(self):
+        self.assertEqual(hash(Fraction(num=8, den=4)), hash(2))
+        self.assertEqual(hash(Fraction(num=-1, den=1)), hash(-1))
+        self.assertEqual(hash(Fraction(num=1, den=4)), hash(0.25))
+        self.assertEqual(hash(Fraction(num=-10 ** 30, den=7)), hash(fractions.Fraction(-10 ** 30, 7)))
+        self.assertEqual(len({Fraction(num=1, den=2), Fraction(num=2, den=4), 0.5}), 1)
+        self.assertEqual({Fraction(num=3, den=1): 'trois'}[3], 'trois')
+
+    def test_ordering(self):
+        self.assertTrue(Fraction(num=1, den=3) < Fraction(num=1, den=2))
+        self.assertTrue(Fraction(num=-1, den=2) <= Fraction(num=-2, den=4))
+        self.assertTrue(Fraction(num=7, den=3) > 2)
+        self.assertTrue(Fraction(num=7, den=3) >= 2.25)
+        self.assertTrue(1 < Fraction(num=7, den=3))
+        self.assertTrue(Fraction(num=10 ** 40 + 1, den=10 ** 40) > 1)
+        self.assertTrue(Fraction(num=10 ** 40, den=3) < float('inf'))
+        self.assertFalse(Fraction(num=1, den=3) < float('nan'))
+        values = [Fraction(num=1, den=2), Fraction(num=-3, den=4), Fraction(num=1, den=3), Fraction(num=5)]
+        self.assertEqual([str(f) for f in sorted(values)], ['-3/4', '1/3', '1/2', '5'])
+        with self.assertRaises(TypeError):
+            Fraction(num=1, den=2) < '1/3'
+
+    def test_mixed_operators(self):
+        self.assertEqual((Fraction(num=1, den=3) + 1).__str__(), '4/3')
+        self.assertEqual((1 + Fraction(num=1, den=3)).__str__(), '4/3')
+        self.assertEqual((1 - Fraction(num=1, den=3)).__str__(), '2/3')
+        self.assertEqual((3 * Fraction(num=1, den=6)).__str__(), '1/2')
+        self.assertEqual((2 / Fraction(num=4, den=3)).__str__(), '3/2')
+        self.assertEqual((4 ** Fraction(num=1, den=2)).__str__(), '2')
+        self.assertEqual((Fraction(num=2, den=3) ** 2).__str__(), '4/9')
+        self.assertEqual((fractions.Fraction(1, 2) + Fraction(num=1, den=3)).__str__(), '5/6')
+        self.assertEqual(Fraction(num=1, den=2) + 0.25, 0.75)
+        self.assertEqual(sum([Fraction(num=1, den=2), Fraction(num=1, den=3)]).__str__(), '5/6')
+        self.assertEqual((-Fraction(num=1, den=2)).__str__(), '-1/2')
+        self.assertEqual(abs(Fraction(num=-1, den=2)).__str__(), '1/2')
+        total = Fraction(num=1, den=4)
+        total += 1
+        total *= Fraction(num=2, den=5)
+        self.assertEqual(total.__str__(), '1/2')
+        with self.assertRaises(TypeError):
+            Fraction(num=1, den=2) + '1'
+        with self.assertRaises(ZeroDivisionError):
+            1 / Fraction(num=0, den=3)
+
+    def test_numeric_tower(self):
+        half = Fraction(num=1, den=2)
+        self.assertIsInstance(half, numbers.Rational)
+        self.assertEqual(fractions.Fraction(half), fractions.Fraction(1, 2))
+        self.assertEqual(fractions.Fraction(1, 2), half)
+        self.assertEqual(complex(half), 0.5 + 0j)
+        self.assertIs(+half, half)
+        self.assertEqual((half.real, half.imag, half.conjugate()), (half, 0, half))
+        self.assertFalse(Fraction(num=0, den=5))
+        self.assertTrue(Fraction(num=-1, den=5))
+
+    def test_integer_conversions(self):
+        for num, den in ((7, 2), (-7, 2), (6, 3), (-1, 3), (0, 1), (10 ** 30 + 1, 10 ** 15)):
+            expected = fractions.Fraction(num, den)
+            value = Fraction(num=num, den=den)
+            self.assertEqual(int(value), int(expected))
+            self.assertEqual(math.trunc(value), math.trunc(expected))
+            self.assertEqual(math.floor(value), math.floor(expected))
+            self.assertEqual(math.ceil(value), math.ceil(expected))
+            self.assertEqual(round(value), round(expected))
+            self.assertEqual(round(value, 2), round(expected, 2))
+            self.assertEqual(round(value, -1), round(expected, -1))
+        self.assertEqual(round(Fraction(num=5, den=2)), 2)
+        self.assertEqual(round(Fraction(num=-7, den=2)), -4)
+        self.assertEqual(round(Fraction(num=1, den=8), 2).__str__(), '3/25')
+        self.assertEqual(round(Fraction(num=1250), -2).__str__(), '1200')
+
+    def test_floordiv_mod(self):
+        pairs = ((Fraction(num=7, den=2), Fraction(num=1, den=3)), (Fraction(num=7, den=2), Fraction(num=-1, den=3)),
+                 (Fraction(num=-5, den=3), 2), (3, Fraction(num=4, den=5)),
+                 (Fraction(num=-9, den=4), fractions.Fraction(1, 6)))
+        for a, b in pairs:
+            x = fractions.Fraction(a.numerator, a.denominator)
+            y = fractions.Fraction(b.numerator, b.denominator)
+            self.assertEqual(a // b, x // y)
+            self.assertEqual(a % b, x % y)
+            self.assertEqual(divmod(a, b), divmod(x, y))
+        self.assertIsInstance(Fraction(num=7, den=2) // 2, int)
+        self.assertEqual(Fraction(num=7, den=2) // 0.5, 7.0)
+        self.assertEqual(Fraction(num=7, den=2) % 1.5, 0.5)
+        with self.assertRaises(ZeroDivisionError):
+            Fraction(num=1, den=2) // 0
+        with self.assertRaises(ZeroDivisionError):
+            1 % Fraction(num=0)
+        with self.assertRaises(TypeError):
+            Fraction(num=1, den=2) // '2'
+
     def test_float(self):
         self.assertEqual(Fraction(num=4, den=5).__float__(), 0.8)
         self.assertEqual(Fraction(num=-40, den=25).__float__(), -1.6)
         self.assertEqual(Fraction(num=-0, den=-144).__float__(), 0)
         self.assertEqual(Fraction(num=144, den=-12).__float__(), -12)
 
+    def test_from_float(self):
+        self.assertEqual(Fraction.from_float(0.125).__str__(), '1/8')
+        self.assertEqual(Fraction.from_float(-2.5).__str__(), '-5/2')
+        self.assertEqual(Fraction.from_float(0.1), fractions.Fraction(0.1))
+        self.assertEqual(Fraction.from_float(3).__str__(), '3')
+        with self.assertRaises(ValueError):
+            Fraction.from_float(float('nan'))
+        with self.assertRaises(OverflowError):
+            Fraction.from_float(float('inf'))
+        with self.assertRaises(TypeError):
+            Fraction.from_float('0.5')
+
+    def test_from_decimal(self):
+        self.assertEqual(Fraction.from_decimal(decimal.Decimal('0.1')).__str__(), '1/10')
+        self.assertEqual(Fraction.from_decimal(decimal.Decimal('-1.25E+3')).__str__(), '-1250')
+        with self.assertRaises(ValueError):
+            Fraction.from_decimal(decimal.Decimal('NaN'))
+        with self.assertRaises(TypeError):
+            Fraction.from_decimal(0.1)
+
+    def test_float_big_operands(self):
+        self.assertEqual(float(Fraction(num=10 ** 400 + 1, den=10 ** 399)), 10.0)
+        self.assertEqual(float(Fraction(num=-3 ** 1000, den=3 ** 999 * 7)), -3 / 7)
+        self.assertEqual(float(Fraction(num=1, den=10 ** 400)), 0.0)
+        self.assertEqual(float(Fraction(num=2 ** 53 + 1)), 2.0 ** 53)
+        self.assertEqual(float(Fraction(num=2 ** 53 + 3)), 2.0 ** 53 + 4)
+        for num, den in ((7 ** 500, 3 ** 700 + 11), (2 ** 1100 + 1, 2 ** 1000), (10 ** 30 + 7, 3)):
+            self.assertEqual(float(Fraction(num=num, den=den)), float(fractions.Fraction(num, den)))
+        with self.assertRaises(OverflowError):
+            float(Fraction(num=10 ** 400, den=3))
+
+    def test_to_decimal(self):
+        self.assertEqual(str(Fraction(num=1, den=3).to_decimal(5)), '0.33333')
+        self.assertEqual(str(Fraction(num=-2, den=3).to_decimal(3)), '-0.667')
+        self.assertEqual(str(Fraction(num=7).to_decimal(2)), '7.00')
+        self.assertEqual(str(Fraction(num=5, den=2).to_decimal(0)), '2')
+        self.assertEqual(str(Fraction(num=5, den=2).to_decimal(0, decimal.ROUND_HALF_UP)), '3')
+        context = decimal.Context(prec=200)
+        values = [Fraction(num=n, den=d) for n in range(-30, 31) for d in (1, 2, 4, 8, 40, 3, 7)]
+        for rounding in ('ROUND_DOWN', 'ROUND_UP', 'ROUND_CEILING', 'ROUND_FLOOR', 'ROUND_HALF_UP',
+                         'ROUND_HALF_DOWN', 'ROUND_HALF_EVEN', 'ROUND_05UP'):
+            mode = getattr(decimal, rounding)
+            for value in values:
+                exact = context.divide(decimal.Decimal(value.numerator), decimal.Decimal(value.denominator))
+                expected = exact.quantize(decimal.Decimal('0.1'), rounding=mode, context=context)
+                self.assertEqual(value.to_decimal(1, mode), expected, (value.__str__(), rounding))
+        big = Fraction(num=3 ** 9000, den=7 ** 5000)
+        whole = str(big.numerator // big.denominator)
+        self.assertEqual(str(big.to_decimal(10_000))[:len(whole) + 1], whole + '.')
+        self.assertEqual(len(big.to_decimal(10_000).as_tuple().digits), len(whole) + 10_000)
+        with self.assertRaises(ValueError):
+            big.to_decimal(-1)
+        with self.assertRaises(ValueError):
+            big.to_decimal(2, 'nearest')
+
+    def test_decimal_digits(self):
+        self.assertEqual(list(Fraction(num=1, den=8).decimal_digits()), [1, 2, 5])
+        self.assertEqual(list(Fraction(num=-13, den=6).decimal_digits()), [1, 6])
+        self.assertEqual(list(Fraction(num=1, den=7).decimal_digits()), [1, 4, 2, 8, 5, 7])
+        self.assertEqual(list(Fraction(num=3).decimal_digits()), [])
+        self.assertEqual(Fraction(num=1, den=6).decimal_period(), (1, 1))
+        self.assertEqual(Fraction(num=1, den=7).decimal_period(), (0, 6))
+        self.assertEqual(Fraction(num=3, den=40).decimal_period(), (3, 0))
+        self.assertEqual(Fraction(num=5).decimal_period(), (0, 0))
+        value = Fraction(num=123, den=2 ** 3 * 5 ** 4 * 97)
+        pre, period = value.decimal_period()
+        self.assertEqual((pre, period), (4, 96))
+        digits = list(value.decimal_digits())
+        self.assertEqual(len(digits), pre + period)
+        expected = str(value.to_decimal(pre + period, decimal.ROUND_DOWN)).split('.')[1]
+        self.assertEqual(''.join(map(str, digits)), expected)
+
+    def test_to_continued_fraction(self):
+        self.assertEqual(Fraction(num=415, den=93).to_continued_fraction(), [4, 2, 6, 7])
+        self.assertEqual(Fraction(num=-7, den=3).to_continued_fraction(), [-3, 1, 2])
+        self.assertEqual(Fraction(num=5).to_continued_fraction(), [5])
+        self.assertEqual(Fraction().to_continued_fraction(), [0])
+
+    def test_limit_denominator(self):
+        pi = Fraction.from_float(math.pi)
+        self.assertEqual(pi.limit_denominator(10).__str__(), '22/7')
+        self.assertEqual(pi.limit_denominator(1000).__str__(), '355/113')
+        self.assertEqual((-pi).limit_denominator(100).__str__(), '-311/99')
+        self.assertEqual(Fraction(num=1, den=3).limit_denominator(5).__str__(), '1/3')
+        self.assertEqual(Fraction.from_float(0.1).limit_denominator().__str__(), '1/10')
+        self.assertEqual(Fraction(num=3, den=7).limit_denominator(1).__str__(), '0')
+        with self.assertRaises(ValueError):
+            pi.limit_denominator(0)
+
     def test_is_zero(self):
         self.assertTrue(Fraction(num=0, den=12).is_zero())
         self.assertFalse(Fraction(num=8, den=7).is_zero())
@@ -103,6 +378,21 @@ class FractionTestCase(unittest.TestCase):
         self.assertTrue(Fraction(num=1, den=4).is_adjacent_to(Fraction(num=1, den=2)))
         self.assertTrue(Fraction(num=-3, den=1).is_adjacent_to(Fraction(num=2, den=-1)))
         self.assertFalse(Fraction(num=2, den=3).is_adjacent_to(Fraction(num=1, den=4)))
+        self.assertFalse(Fraction(num=2, den=3).is_adjacent_to(Fraction(num=2, den=3)))
+        self.assertTrue(Fraction(num=5, den=2).is_adjacent_to(2))
+        big = Fraction(num=3 ** 90, den=2 ** 70)
+        self.assertTrue(big.is_adjacent_to(big + Fraction(num=1, den=2 ** 71)))
+        self.assertFalse(big.is_adjacent_to(big + Fraction(num=3, den=2 ** 71)))
+        with self.assertRaises(TypeError):
+            Fraction(num=1, den=2).is_adjacent_to(0.25)
+
+    def test_predicates_match_difference(self):
+        values = [Fraction(num=n, den=d) for n in range(-7, 8) for d in range(1, 8)]
+        for a in values[::5]:
+            for b in values:
+                self.assertEqual(a.is_adjacent_to(b), abs((a - b).numerator) == 1)
+        for a in values:
+            self.assertEqual(a.is_proper(), abs(a.numerator) < a.denominator)
 
 
 if __name__ == '__main__':
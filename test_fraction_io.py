@@ -0,0 +1,61 @@
+import io
+import mmap
+import tempfile
+import unittest
+from fraction_impl import Fraction
+from fraction_io import format_many, parse_many
+
+
+class FractionIOTestCase(unittest.TestCase):
+    values = [Fraction(num=1, den=2), Fraction(num=-12, den=5), Fraction(num=7), Fraction(num=1, den=8)]
+
+    def test_parse_many(self):
+        text = '1/2\n\n -2-2/5 \r\n7\n0.125'
+        self.assertEqual(list(parse_many(text)), self.values)
+        self.assertEqual(list(parse_many(text.encode())), self.values)
+        self.assertEqual(list(parse_many(memoryview(text.encode()))), self.values)
+        self.assertEqual(list(parse_many(io.StringIO(text))), self.values)
+        self.assertEqual(list(parse_many(io.BytesIO(text.encode()))), self.values)
+        with self.assertRaises(ValueError):
+            list(parse_many('1/2\nabc'))
+
+    def test_parse_many_plain_lines(self):
+        text = '6/8\r\n-0/3\n  \t \n-10/4 \n1/2/3'
+        self.assertEqual([str(f) for f in parse_many(text.rpartition('\n')[0])], ['3/4', '0', '-5/2'])
+        self.assertEqual([str(f) for f in parse_many(text.encode().rpartition(b'\n')[0])], ['3/4', '0', '-5/2'])
+        self.assertEqual([str(f) for f in parse_many(['6/8\n', b'-10/4\r\n', ' \n'])], ['3/4', '-5/2'])
+        for source in ('3/0', b'3/0', ['3/0\n']):
+            with self.assertRaises(ZeroDivisionError):
+                list(parse_many(source))
+        for source in (text, '3/-4', '1_0/3', '\u0663/4', ['3/-4']):
+            with self.assertRaises(ValueError):
+                list(parse_many(source))
+
+    def test_parse_many_blank_lines_are_linear(self):
+        blank = ' ' * 200_000
+        self.assertEqual(list(parse_many(blank + '\n1/2\n' + blank)), [Fraction(num=1, den=2)])
+        self.assertEqual(list(parse_many((blank + '\n3\n').encode())), [Fraction(num=3)])
+
+    def test_parse_many_is_lazy(self):
+        values = parse_many('1/2\nabc')
+        self.assertEqual(next(values), Fraction(num=1, den=2))
+        with self.assertRaises(ValueError):
+            next(values)
+
+    def test_parse_many_mmap(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(b'1/2\n-2-2/5\n7\n0.125\n')
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.assertEqual(list(parse_many(buffer)), self.values)
+
+    def test_format_many(self):
+        self.assertEqual(''.join(format_many(self.values)), '1/2\n-12/5\n7\n1/8\n')
+        self.assertEqual(''.join(format_many(self.values, mixed=True)), '1/2\n-2-2/5\n7\n1/8\n')
+        output = io.StringIO()
+        output.writelines(format_many(self.values, mixed=True))
+        self.assertEqual(list(parse_many(output.getvalue())), self.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+from fraction_impl import Fraction
+from fraction_matrix import FractionMatrix
+
+
+def naive_det(rows):
+    """Gaussian elimination with Fraction arithmetic, used as a reference"""
+    rows = [list(row) for row in rows]
+    n, det = len(rows), Fraction(1)
+    for c in range(n):
+        p = next((i for i in range(c, n) if rows[i][c] != 0), None)
+        if p is None:
+            return Fraction(0)
+        if p != c:
+            rows[p], rows[c] = rows[c], rows[p]
+            det = -det
+        det = det * rows[c][c]
+        for i in range(c + 1, n):
+            factor = rows[i][c] / rows[c][c]
+            rows[i] = [x - factor * y for x, y in zip(rows[i], rows[c])]
+    return det
+
+
+class FractionMatrixTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.a = FractionMatrix([[Fraction(1, 2), Fraction(2, 3)], [3, Fraction(-1, 4)]])
+
+    def test_init_and_access(self):
+        self.assertEqual(self.a.shape, (2, 2))
+        self.assertEqual(self.a[0, 1], Fraction(2, 3))
+        self.assertEqual(self.a[1], [Fraction(3), Fraction(-1, 4)])
+        self.assertEqual(self.a.rows(), [[Fraction(1, 2), Fraction(2, 3)], [Fraction(3), Fraction(-1, 4)]])
+        self.assertEqual(str(self.a), '[1/2, 2/3]\n[3, -1/4]')
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2], [3]])
+        with self.assertRaises(TypeError):
+            FractionMatrix([[0.5]])
+        with self.assertRaises(IndexError):
+            self.a[2, 0]
+
+    def test_arithmetic(self):
+        b = FractionMatrix([[1, Fraction(1, 3)], [Fraction(1, 5), 0]])
+        self.assertEqual((self.a + b).rows(), [[Fraction(3, 2), Fraction(1)], [Fraction(16, 5), Fraction(-1, 4)]])
+        self.assertEqual(self.a - self.a, FractionMatrix.zeros(2, 2))
+        self.assertEqual((self.a * 2).rows(), [[Fraction(1), Fraction(4, 3)], [Fraction(6), Fraction(-1, 2)]])
+        self.assertEqual(-self.a, self.a * -1)
+        self.assertEqual(self.a.transpose()[0, 1], Fraction(3))
+        with self.assertRaises(ValueError):
+            self.a + FractionMatrix.identity(3)
+
+    def test_matmul(self):
+        b = FractionMatrix([[Fraction(2, 7), 1, 0], [Fraction(-3, 5), Fraction(1, 2), 4]])
+        product = self.a @ b
+        self.assertEqual(product.shape, (2, 3))
+        for i in range(2):
+            for j in range(3):
+                expected = sum((self.a[i, k] * b[k, j] for k in range(2)), Fraction(0))
+                self.assertEqual(product[i, j], expected)
+        self.assertEqual(self.a @ FractionMatrix.identity(2), self.a)
+        with self.assertRaises(ValueError):
+            b @ self.a
+
+    def test_det_and_rank(self):
+        self.assertEqual(self.a.det(), Fraction(1, 2) * Fraction(-1, 4) - Fraction(2, 3) * 3)
+        singular = FractionMatrix([[1, 2, 3], [2, 4, 6], [Fraction(1, 2), 1, 7]])
+        self.assertEqual(singular.det(), 0)
+        self.assertEqual(singular.rank(), 2)
+        self.assertEqual(FractionMatrix([[0, 1], [1, 0]]).det(), -1)
+        self.assertEqual(FractionMatrix.zeros(2, 3).rank(), 0)
+        self.assertEqual(FractionMatrix([[1, 2, 3], [2, 4, 7]]).rank(), 2)
+        with self.assertRaises(ValueError):
+            FractionMatrix.zeros(2, 3).det()
+
+    def test_det_matches_naive(self):
+        rng = random.Random(2020)
+        for n in (1, 3, 6):
+            rows = [[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)] for _ in range(n)]
+            self.assertEqual(FractionMatrix(rows).det(), naive_det(rows))
+
+    def test_solve_and_inverse(self):
+        x = self.a.solve([1, Fraction(1, 2)])
+        self.assertEqual([sum((self.a[i, j] * x[j] for j in range(2)), Fraction(0)) for i in range(2)],
+                         [Fraction(1), Fraction(1, 2)])
+        inverse = self.a.inverse()
+        self.assertEqual(self.a @ inverse, FractionMatrix.identity(2))
+        self.assertEqual(inverse @ self.a, FractionMatrix.identity(2))
+        rng = random.Random(7)
+        rows = [[Fraction(rng.randint(-20, 20), rng.randint(1, 12)) for _ in range(8)] for _ in range(8)]
+        m = FractionMatrix(rows)
+        self.assertEqual(m @ m.inverse(), FractionMatrix.identity(8))
+        b = FractionMatrix([[rng.randint(-5, 5), Fraction(1, 3)] for _ in range(8)])
+        self.assertEqual(m @ m.solve(b), b)
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2], [2, 4]]).inverse()
+        with self.assertRaises(ValueError):
+            self.a.solve([1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
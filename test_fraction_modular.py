@@ -0,0 +1,71 @@
+import random
+import unittest
+from fraction_impl import Fraction
+from fraction_expr import lazy
+from fraction_modular import ModularEvaluator, _reconstruct, evaluate_modular
+
+
+class FractionModularTestCase(unittest.TestCase):
+    def test_small_expressions(self):
+        x, y = lazy(Fraction(num=1, den=3)), lazy(Fraction(num=-5, den=7))
+        for expression in (x + y, x - y, x * y, x / y, x ** 5, y ** -3, (x + 1) * (y - 2) / (x ** 2 + y)):
+            self.assertEqual(evaluate_modular(expression), expression.evaluate())
+        self.assertEqual(evaluate_modular(x - x).__str__(), '0')
+        self.assertEqual(evaluate_modular(Fraction(num=-22, den=7)).__str__(), '-22/7')
+        self.assertEqual(evaluate_modular(12).__str__(), '12')
+        with self.assertRaises(TypeError):
+            evaluate_modular(0.5)
+
+    def test_escalation(self):
+        rng = random.Random(2020)
+        result = lazy(1)
+        for _ in range(200):
+            result = result * Fraction(num=rng.randint(1, 10 ** 6), den=rng.randint(1, 10 ** 6)) + 1
+        expected = result.evaluate()
+        self.assertGreater(expected.denominator.bit_length(), 2000)
+        self.assertEqual(evaluate_modular(result, primes=1, group_size=3), expected)
+        with self.assertRaises(ValueError):
+            evaluate_modular(result, max_primes=8)
+
+    def test_big_leaves_and_cancellation(self):
+        x = lazy(Fraction(num=3 ** 400, den=2 ** 300 + 1))
+        identity = (x + 1) ** 6 - (x ** 6 + 6 * x ** 5 + 15 * x ** 4 + 20 * x ** 3 + 15 * x ** 2 + 6 * x + 1)
+        self.assertEqual(evaluate_modular(identity).__str__(), '0')
+        self.assertEqual(evaluate_modular((x * 7) / (x * 3)).__str__(), '7/3')
+
+    def test_zero_division(self):
+        x = lazy(Fraction(num=1, den=3))
+        with self.assertRaises(ZeroDivisionError):
+            evaluate_modular(1 / (x - Fraction(num=1, den=3)))
+        with self.assertRaises(ZeroDivisionError):
+            evaluate_modular((x - x) ** -2)
+        with self.assertRaises(ZeroDivisionError):
+            evaluate_modular((1 / (x - x)) ** 0)
+        self.assertEqual(evaluate_modular((x - x) ** 0).__str__(), '1')
+        zero = x - x
+        for expression in (x / (1 / zero), 1 / (1 / zero), (1 / zero) ** -1, (1 / zero) * 0):
+            with self.assertRaises(ZeroDivisionError):
+                expression.evaluate()
+            with self.assertRaises(ZeroDivisionError):
+                evaluate_modular(expression)
+            with self.assertRaises(ZeroDivisionError):
+                evaluate_modular(expression, primes=1, group_size=3)
+
+    def test_reconstruct(self):
+        m = 1_000_003 * 999_983
+        for n, d in ((3, 7), (-12, 5), (0, 1), (1, 1)):
+            self.assertEqual(_reconstruct(n * pow(d, -1, m) % m, m), (n, d))
+        self.assertIsNone(_reconstruct(3, 11))
+        self.assertEqual(_reconstruct(5, 11), (-1, 2))
+
+    def test_workers(self):
+        rng = random.Random(7)
+        result = lazy(0)
+        for _ in range(100):
+            result = result / Fraction(num=rng.randint(1, 10 ** 9), den=rng.randint(1, 10 ** 9)) - 3
+        with ModularEvaluator(workers=2, group_size=2) as evaluator:
+            self.assertEqual(evaluator.evaluate(result), result.evaluate())
+
+
+if __name__ == '__main__':
+    unittest.main()
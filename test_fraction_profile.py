@@ -0,0 +1,80 @@
+import unittest
+import fraction_cache
+import fraction_impl
+from fraction_cache import FractionCache
+from fraction_impl import Fraction
+from fraction_profile import FractionProfiler, profile
+from fraction_sum import fsum
+
+
+class FractionProfilerTestCase(unittest.TestCase):
+    def test_disabled_is_untouched(self):
+        add, gcd = Fraction.__add__, fraction_impl._gcd
+        profiler = FractionProfiler()
+        profiler.enable()
+        self.assertIsNot(Fraction.__add__, add)
+        profiler.disable()
+        self.assertIs(Fraction.__add__, add)
+        self.assertIs(fraction_impl._gcd, gcd)
+        self.assertIs(fraction_cache._gcd, gcd)
+        self.assertEqual(profiler.snapshot()['calls'], {})
+
+    def test_counts(self):
+        with profile() as profiler:
+            a = Fraction(num=6, den=8)
+            b = Fraction(num=1, den=6)
+            self.assertEqual((a + b).__str__(), '11/12')
+            self.assertEqual((a * b).__str__(), '1/8')
+            fsum([a, b, Fraction(num=1, den=5)])
+        self.assertFalse(profiler.enabled)
+        stats = profiler.snapshot()
+        self.assertEqual(stats['calls']['__init__'], 5)
+        self.assertEqual(stats['calls']['__add__'], 2)
+        self.assertEqual(stats['calls']['__mul__'], 1)
+        self.assertTrue(stats['time_ns']['__add__']['histogram'])
+        self.assertGreaterEqual(stats['gcd_calls'], 5)
+        self.assertGreaterEqual(stats['gcd_reductions'], 1)
+        self.assertEqual(stats['lcm_calls'], 1)
+        self.assertEqual(sum(stats['bits']['denominator']['histogram'].values()), 8)
+        profiler.reset()
+        self.assertEqual(profiler.snapshot()['gcd_calls'], 0)
+
+    def test_floordiv_counts(self):
+        a, b = Fraction(num=7, den=2), Fraction(num=2, den=3)
+        with profile() as profiler:
+            self.assertEqual(a // b, 5)
+            self.assertEqual((a % b).__str__(), '1/6')
+            self.assertEqual(divmod(a, b)[0], 5)
+            self.assertEqual(round(a), 4)
+        calls = profiler.snapshot()['calls']
+        self.assertEqual(calls['__floordiv__'], 1)
+        self.assertEqual(calls['__mod__'], 1)
+        self.assertEqual(calls['__divmod__'], 1)
+        self.assertEqual(calls['__round__'], 1)
+
+    def test_cache_gcd_counts(self):
+        with profile() as profiler:
+            cache = FractionCache()
+            cache(6, 8)
+            cache(1, 3)
+        stats = profiler.snapshot()
+        self.assertEqual(stats['gcd_calls'], 2)
+        self.assertEqual(stats['gcd_reductions'], 1)
+
+    def test_single_active(self):
+        with profile():
+            with self.assertRaises(RuntimeError):
+                FractionProfiler().enable()
+
+    def test_prometheus(self):
+        with profile() as profiler:
+            Fraction(num=1, den=2) + Fraction(num=1, den=3)
+        text = profiler.to_prometheus()
+        self.assertIn('fraction_calls_total{method="__add__"} 1', text)
+        self.assertIn('fraction_call_duration_ns_bucket{method="__add__",le="+Inf"} 1', text)
+        self.assertIn('fraction_gcd_calls_total', text)
+        self.assertTrue(text.endswith('\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
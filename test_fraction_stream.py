@@ -0,0 +1,123 @@
+import asyncio
+import concurrent.futures
+import io
+import unittest
+from fraction_impl import Fraction
+from fraction_stream import aformat, aggregate, amap, aparse, buffered, run_pipeline, write_lines
+
+
+def square(value):
+    return value * value
+
+
+async def agen(values):
+    for value in values:
+        yield value
+
+
+async def alist(values):
+    return [value async for value in values]
+
+
+def reader_for(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class MemoryWriter:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.drains = 0
+
+    def write(self, data):
+        self.buffer.write(data)
+
+    async def drain(self):
+        self.drains += 1
+
+
+class FractionStreamTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_parse_and_format(self):
+        values = await alist(aparse(reader_for(b'1/2\n\n-3/4\n2+1/3\n')))
+        self.assertEqual(values, [Fraction(1, 2), Fraction(-3, 4), Fraction(7, 3)])
+        self.assertEqual(await alist(aformat(agen(values))), ['1/2\n', '-3/4\n', '7/3\n'])
+        self.assertEqual((await alist(aformat(agen(values), mixed=True)))[2], '2+1/3\n')
+        with self.assertRaises(ValueError):
+            await alist(aparse(agen(['1/2', 'abc'])))
+
+    async def test_map_inline(self):
+        values = [Fraction(n, n + 1) for n in range(25)]
+        self.assertEqual(await alist(amap('mul', agen(values), Fraction(3, 2), batch_size=4)),
+                         [value * Fraction(3, 2) for value in values])
+        self.assertEqual(await alist(amap(square, agen(values), batch_size=7)), [square(value) for value in values])
+        with self.assertRaises(ZeroDivisionError):
+            await alist(amap('truediv', agen(values), 0))
+        with self.assertRaises(ValueError):
+            await alist(amap('modulo', agen(values), 1))
+
+    async def test_map_offloaded(self):
+        values = [Fraction(3 ** 200 + n, 2 ** 150) for n in range(30)]
+        expected = [value + Fraction(1, 3) for value in values]
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            self.assertEqual(await alist(amap('add', agen(values), Fraction(1, 3), executor=executor,
+                                              batch_size=4)), expected)
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            self.assertEqual(await alist(amap('add', agen(values), Fraction(1, 3), executor=executor,
+                                              batch_size=8)), expected)
+
+    async def test_aggregate(self):
+        values = [Fraction(1, n) for n in range(1, 11)]
+        self.assertEqual(await aggregate(agen(values)), sum(values, Fraction(0)))
+        product = Fraction(1)
+        for value in values:
+            product = product * value
+        self.assertEqual(await aggregate(agen(values), 'mul'), product)
+        self.assertEqual(await aggregate(agen([])), Fraction(0))
+        self.assertEqual(await aggregate(agen([]), 'mul'), Fraction(1))
+
+    async def test_buffered_backpressure(self):
+        produced = 0
+
+        async def source():
+            nonlocal produced
+            for n in range(100):
+                produced += 1
+                yield Fraction(n)
+
+        consumed = 0
+        async for _ in buffered(source(), maxsize=5):
+            consumed += 1
+            await asyncio.sleep(0)
+            self.assertLessEqual(produced - consumed, 6)
+        self.assertEqual(consumed, 100)
+
+    async def test_buffered_errors_and_early_exit(self):
+        with self.assertRaises(ValueError):
+            await alist(buffered(aparse(agen(['1', '2', 'x']))))
+        stream = buffered(agen(range(1000)), maxsize=3)
+        async for value in stream:
+            if value == 10:
+                break
+        await stream.aclose()
+
+    async def test_pipeline(self):
+        writer = MemoryWriter()
+        lines = b''.join(f'{n}/{n + 2}\n'.encode() for n in range(1000))
+        count = await run_pipeline(reader_for(lines), writer, 'mul', Fraction(2), batch_size=64, maxsize=16)
+        self.assertEqual(count, 1000)
+        output = writer.buffer.getvalue().decode().splitlines()
+        self.assertEqual(output[:3], ['0', '2/3', '1'])
+        self.assertEqual(output[-1], str(Fraction(999, 1001) * 2))
+        self.assertGreater(writer.drains, 1)
+
+    async def test_write_lines_without_drain(self):
+        buffer = io.BytesIO()
+        self.assertEqual(await write_lines(agen(['1\n', '2\n']), buffer), 2)
+        self.assertEqual(buffer.getvalue(), b'1\n2\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
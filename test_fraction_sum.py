@@ -0,0 +1,49 @@
+import fractions
+import random
+import unittest
+from fraction_impl import Fraction
+from fraction_sum import FractionAccumulator, fdot, fmean, fsum
+
+
+class FractionSumTestCase(unittest.TestCase):
+    def test_accumulator(self):
+        accumulator = FractionAccumulator()
+        accumulator.add(Fraction(num=1, den=2))
+        accumulator.add(Fraction(num=1, den=3))
+        accumulator.add(1)
+        accumulator.add(fractions.Fraction(1, 6))
+        self.assertEqual(accumulator.value().__str__(), '2')
+        self.assertEqual(accumulator.count, 4)
+        accumulator.update(Fraction(num=-1, den=n) for n in (2, 2))
+        self.assertEqual(accumulator.value().__str__(), '1')
+        self.assertEqual(FractionAccumulator(start=Fraction(num=3, den=4)).value().__str__(), '3/4')
+        with self.assertRaises(TypeError):
+            accumulator.add(0.5)
+
+    def test_flush(self):
+        rng = random.Random(7)
+        values = [Fraction(rng.randint(-50, 50), rng.randint(1, 40)) for _ in range(500)]
+        accumulator = FractionAccumulator(max_groups=3)
+        accumulator.update(values)
+        expected = sum(fractions.Fraction(f.numerator, f.denominator) for f in values)
+        self.assertEqual(accumulator.value(), expected)
+
+    def test_fsum(self):
+        self.assertEqual(fsum(Fraction(num=1, den=n * (n + 1)) for n in range(1, 100)).__str__(), '99/100')
+        self.assertEqual(fsum([]).__str__(), '0')
+
+    def test_fdot(self):
+        left = [Fraction(num=1, den=2), Fraction(num=2, den=3), 3]
+        right = [Fraction(num=2, den=5), Fraction(num=3, den=4), Fraction(num=1, den=6)]
+        self.assertEqual(fdot(left, right).__str__(), '6/5')
+        with self.assertRaises(ValueError):
+            fdot(left, right[:2])
+
+    def test_fmean(self):
+        self.assertEqual(fmean([Fraction(num=1, den=2), Fraction(num=1, den=3), 1]).__str__(), '11/18')
+        with self.assertRaises(ValueError):
+            fmean([])
+
+
+if __name__ == '__main__':
+    unittest.main()